@@ -1,47 +1,131 @@
-from turf_along.index import along
-# from turf_area.index import area
-from turf_bbox.index import bbox
-from turf_bbox_polygon.index import bbox_polygon
-from turf_bearing.index import bearing
-# from turf_bezier.index import bezier
-# from turf_buffer.index import buffer
-from turf_center.index import center
-# from turf_center_of_mass.index import center_of_mass
-from turf_centroid.index import centroid
-from turf_circle.index import circle
-from turf_collect.index import collect
-from turf_combine.index import combine
-# from turf_concave.index import concave
-# from turf_convex.index import convex
-from turf_destination.index import destination
-# from turf_difference.index import difference
-from turf_distance .index import distance
-from turf_envelope.index import envelope
-from turf_explode.index import explode
-from turf_flip.index import flip
-from turf_hex_grid.index import hex_grid
-from turf_idw.index import idw
-from turf_inside.index import input as inside
-# from turf_intersect.index import intersect
-# from turf_isolines.index import isolines
-from turf_kinks.index import kinks
-from turf_line_distance.index import line_distance
-from turf_line_slice.index import line_slice
-from turf_line_slice_along.index import line_slice_along
-from turf_midpoint.index import midpoint
-from turf_nearest.index import nearest
-from turf_planepoint.index import planepoint
-from turf_point_grid.index import point_grid
-from turf_point_on_line.index import point_on_line
-from turf_point_on_surface.index import point_on_surface
-# from turf_random.index import random
-from turf_sample.index import sample
-# from turf_simplify.index import simplify
-from turf_square.index import square
-from turf_square_grid.index import square_grid
-from turf_tag.index import tag
-# from turf_tesselate.index import tesselate
-from turf_tin.index import tin
-from turf_triangle_grid.index import triangle_grid
-# from turf_union.index import union
-from turf_within.index import within
+import importlib
+import sys
+from types import ModuleType
+
+# Every turf function is exposed here, but its module is only imported the
+# first time the name is looked up: `from packages import distance` loads
+# turf_distance and what it depends on, and nothing else.
+_exports = {
+    "along":                ("turf_along.index", "along"),
+    # "area":               ("turf_area.index", "area"),
+    "bbox":                 ("turf_bbox.index", "bbox"),
+    "bbox_polygon":         ("turf_bbox_polygon.index", "bbox_polygon"),
+    "bearing":              ("turf_bearing.index", "bearing"),
+    "bearing_many":         ("turf_bearing.index", "bearing_many"),
+    # "bezier":             ("turf_bezier.index", "bezier"),
+    # "buffer":             ("turf_buffer.index", "buffer"),
+    "cache_bbox":           ("turf_bbox.index", "cache_bbox"),
+    "cached_bbox":          ("turf_bbox.index", "cached_bbox"),
+    "center":               ("turf_center.index", "center"),
+    # "center_of_mass":     ("turf_center_of_mass.index", "center_of_mass"),
+    "centroid":             ("turf_centroid.index", "centroid"),
+    "circle":               ("turf_circle.index", "circle"),
+    "circle_rings":         ("turf_circle.index", "circle_rings"),
+    "circles":              ("turf_circle.index", "circles"),
+    "collect":              ("turf_collect.index", "collect"),
+    "combine":              ("turf_combine.index", "combine"),
+    # "concave":            ("turf_concave.index", "concave"),
+    # "convex":             ("turf_convex.index", "convex"),
+    "delaunay":             ("turf_tin.index", "delaunay"),
+    "destination":          ("turf_destination.index", "destination"),
+    "destination_many":     ("turf_destination.index", "destination_many"),
+    # "difference":         ("turf_difference.index", "difference"),
+    "distance":             ("turf_distance.index", "distance"),
+    "distance_many":        ("turf_distance.index", "distance_many"),
+    "distance_matrix":      ("turf_distance.index", "distance_matrix"),
+    "distance_matrix_chunks": ("turf_distance.index",
+                               "distance_matrix_chunks"),
+    "distance_pairs":       ("turf_distance.index", "distance_pairs"),
+    "envelope":             ("turf_envelope.index", "envelope"),
+    "explode":              ("turf_explode.index", "explode"),
+    "fast_ruler":           ("turf_ruler.index", "fast_ruler"),
+    "flip":                 ("turf_flip.index", "flip"),
+    "grid_layout":          ("turf_square_grid.index", "grid_layout"),
+    "hex_bin":              ("turf_hex_grid.index", "hex_bin"),
+    "hex_bin_arrays":       ("turf_hex_grid.index", "hex_bin_arrays"),
+    "hex_grid":             ("turf_hex_grid.index", "hex_grid"),
+    "hex_grid_arrays":      ("turf_hex_grid.index", "hex_grid_arrays"),
+    "hex_layout":           ("turf_hex_grid.index", "hex_layout"),
+    "idw":                  ("turf_idw.index", "idw"),
+    "idw_array":            ("turf_idw.index", "idw_array"),
+    "inside":               ("turf_inside.index", "input"),
+    "instrument":           ("turf_instrument.index", "instrument"),
+    # "intersect":          ("turf_intersect.index", "intersect"),
+    "invalidate_bbox":      ("turf_bbox.index", "invalidate_bbox"),
+    # "isolines":           ("turf_isolines.index", "isolines"),
+    "is_simple":            ("turf_kinks.index", "is_simple"),
+    "iter_hex_grid":        ("turf_hex_grid.index", "iter_hex_grid"),
+    "iter_point_grid":      ("turf_point_grid.index", "iter_point_grid"),
+    "iter_square_grid":     ("turf_square_grid.index", "iter_square_grid"),
+    "iter_tag":             ("turf_tag.index", "iter_tag"),
+    "iter_triangle_grid":   ("turf_triangle_grid.index", "iter_triangle_grid"),
+    "iter_within":          ("turf_within.index", "iter_within"),
+    "JoinExecutor":         ("turf_parallel.index", "JoinExecutor"),
+    "kinks":                ("turf_kinks.index", "kinks"),
+    "line_distance":        ("turf_line_distance.index", "line_distance"),
+    "line_slice":           ("turf_line_slice.index", "line_slice"),
+    "line_slice_along":     ("turf_line_slice_along.index", "line_slice_along"),
+    "line_snapper":         ("turf_point_on_line.index", "line_snapper"),
+    "linear_reference":     ("turf_linear_reference.index",
+                             "linear_reference"),
+    "midpoint":             ("turf_midpoint.index", "midpoint"),
+    "midpoint_many":        ("turf_midpoint.index", "midpoint_many"),
+    "nearest":              ("turf_nearest.index", "nearest"),
+    "planepoint":           ("turf_planepoint.index", "planepoint"),
+    "point_grid":           ("turf_point_grid.index", "point_grid"),
+    "point_grid_arrays":    ("turf_point_grid.index", "point_grid_arrays"),
+    "point_on_line":        ("turf_point_on_line.index", "point_on_line"),
+    "point_index":          ("turf_spatial_index.index", "point_index"),
+    "point_on_surface":     ("turf_point_on_surface.index", "point_on_surface"),
+    "prepare":              ("turf_inside.index", "prepare"),
+    "read_features":        ("turf_stream.index", "read_features"),
+    # "random":             ("turf_random.index", "random"),
+    "sample":               ("turf_sample.index", "sample"),
+    "spatial_index":        ("turf_spatial_index.index", "spatial_index"),
+    # "simplify":           ("turf_simplify.index", "simplify"),
+    "square":               ("turf_square.index", "square"),
+    "square_grid":          ("turf_square_grid.index", "square_grid"),
+    "square_grid_arrays":   ("turf_square_grid.index", "square_grid_arrays"),
+    "tag":                  ("turf_tag.index", "tag"),
+    # "tesselate":          ("turf_tesselate.index", "tesselate"),
+    "tin":                  ("turf_tin.index", "tin"),
+    "triangle_grid":        ("turf_triangle_grid.index", "triangle_grid"),
+    "triangle_grid_arrays": ("turf_triangle_grid.index",
+                             "triangle_grid_arrays"),
+    # "union":              ("turf_union.index", "union"),
+    "within":               ("turf_within.index", "within")
+}
+
+
+class _LazyModule(ModuleType):
+    def __getattr__(self, name):
+        if name not in _exports:
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(__name__, name)
+            )
+
+        module_name, attribute = _exports[name]
+        module = importlib.import_module("." + module_name, __name__)
+        value = getattr(module, attribute)
+        # cache it, so that __getattr__ is only ever hit once per name
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(_exports))
+
+
+def _install():
+    module = _LazyModule(__name__, __doc__)
+    module.__dict__.update(
+        (key, value) for key, value in globals().items()
+        if key.startswith("__")
+    )
+    module.__all__ = sorted(_exports)
+    # keep the original module alive: Python 2 clears the globals of
+    # modules that get garbage collected, and _LazyModule still needs them
+    module._module = sys.modules[__name__]
+    sys.modules[__name__] = module
+
+
+_install()
@@ -0,0 +1,8 @@
+from packages import along, line_distance
+
+
+def bench(suite, size):
+    line = suite.line(size)
+    half = line_distance(line, 'kilometers') / 2
+
+    suite.add('along', lambda: along(line, half, 'kilometers'))
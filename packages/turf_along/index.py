@@ -59,5 +59,5 @@ def along (line, distance, units):
         else:
             travelled += measure_distance(coords[i], coords[i + 1], units)
 
-    return Point(coords[coords.length - 1])
+    return Point(coords[-1])
 
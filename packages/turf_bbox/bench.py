@@ -0,0 +1,13 @@
+from packages import bbox, cache_bbox
+
+
+def bench(suite, size):
+    poly = suite.polygon(size)
+    points = suite.points(size)
+    polygons = suite.polygons(size)
+    cached = cache_bbox(suite.polygons(size))
+
+    suite.add('bbox#polygon', lambda: bbox(poly))
+    suite.add('bbox#points', lambda: bbox(points))
+    suite.add('bbox#polygons', lambda: bbox(polygons))
+    suite.add('bbox#polygons,cached', lambda: bbox(cached))
@@ -1,10 +1,18 @@
-from packages.turf_meta import coord_each
+from packages.turf_meta import is_packed, is_stream, iter_coords
+from itertools import chain
 
 # Takes a set of features, calculates the bbox of all input features,
 #   and returns a bounding box.
 #
+# A `bbox` member that `cacheBbox` stored is taken as the extent of the
+#   object that carries it, and of a feature when its geometry carries it:
+#   their coordinates are not read again. Other `bbox` members, such as those
+#   read from files, may be stale, padded or cross the antimeridian, and are
+#   ignored.
+#
 # @name bbox
-# @param {(Feature|FeatureCollection)} geojson input features
+# @param {(Feature|FeatureCollection|Iterable<Feature>)} geojson input
+#   features, or a stream of them such as `read_features` returns
 # @return {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
 # @example
 # var pt1 = point([114.175329, 22.2524])
@@ -22,18 +30,145 @@ from packages.turf_meta import coord_each
 #
 # //=bboxPolygon
 def bbox(geojson):
-    def callback(coord):
-        if bbox[0] > coord[0]:
-            bbox[0] = coord[0]
-        if bbox[1] > coord[1]:
-            bbox[1] = coord[1]
-        if bbox[2] < coord[0]:
-            bbox[2] = coord[0]
-        if bbox[3] < coord[1]:
-            bbox[3] = coord[1]
+    if is_packed(geojson):
+        return geojson.bbox()
+
+    if not is_stream(geojson):
+        cached = cached_bbox(geojson)
+        if cached is not None:
+            return cached
+
+    # features carrying a bbox are replaced by its corners, which have the
+    # same extent; the corners are gathered while the coordinates of the
+    # others are read, and read after them
+    corners = []
+    if is_stream(geojson) or geojson["type"] == "FeatureCollection":
+        features = geojson if is_stream(geojson) else geojson["features"]
+        geojson = _uncached(features, corners)
 
     Infinity = float("inf")
-    bbox = [Infinity, Infinity, -Infinity, -Infinity]
-    coord_each(geojson, callback)
+    min_x = min_y = Infinity
+    max_x = max_y = -Infinity
+
+    for coord in chain(iter_coords(geojson), corners):
+        x = coord[0]
+        y = coord[1]
+        if min_x > x:
+            min_x = x
+        if min_y > y:
+            min_y = y
+        if max_x < x:
+            max_x = x
+        if max_y < y:
+            max_y = y
+
+    return [min_x, min_y, max_x, max_y]
+
+
+# Computes the bbox of each feature of a collection, and of the collection,
+#   once, and stores it as their standard `bbox` member, for `bbox`,
+#   `center`, `envelope`, `inside`, `within`, `tag` and the spatial index to
+#   use instead of reading their coordinates again. Members it stored before
+#   are kept, and other members, which are never trusted, replaced; features
+#   without coordinates get none. Only the members of the objects themselves
+#   count: those read back from a file are others.
+#
+# The members go stale when the coordinates change: mutate features through
+#   `flip(input, true)`, or call `invalidateBbox` on them, and on any
+#   collection holding them, after changing their coordinates in place.
+#
+# @name cacheBbox
+# @param {(Feature|FeatureCollection|Geometry)} geojson input features
+# @return {(Feature|FeatureCollection|Geometry)} `geojson` itself
+# @example
+# turf.cacheBbox(zones);
+#
+# var tagged = turf.tag(points, zones, 'name', 'zone');
+def cache_bbox(geojson):
+    if is_packed(geojson):
+        # the packed layout keeps a bbox table of its own
+        return geojson
+
+    if geojson["type"] == "FeatureCollection":
+        for feature in geojson["features"]:
+            _store(feature)
+    _store(geojson)
+    return geojson
+
+
+# Removes the `bbox` members `cacheBbox` stores from a feature, its geometry
+#   and, for a collection, from all of its features, so that their bounds
+#   are computed from their coordinates again.
+#
+# @name invalidateBbox
+# @param {(Feature|FeatureCollection|Geometry)} geojson input features
+# @return {(Feature|FeatureCollection|Geometry)} `geojson` itself
+# @example
+# zone.geometry.coordinates[0][0] = [0, 0];
+# turf.invalidateBbox(zone);
+# turf.invalidateBbox(zones);
+def invalidate_bbox(geojson):
+    if is_packed(geojson):
+        return geojson
+
+    geojson.pop("bbox", None)
+    if geojson["type"] == "FeatureCollection":
+        for feature in geojson["features"]:
+            invalidate_bbox(feature)
+    elif geojson["type"] == "Feature" and geojson["geometry"]:
+        geojson["geometry"].pop("bbox", None)
+    return geojson
+
+
+# Returns the bbox `cacheBbox` stored as the `bbox` member of a feature,
+#   collection or geometry, or of the geometry of a feature, without
+#   computing one: for a quick rejection that costs nothing when there is
+#   none. Members `cacheBbox` did not store are not returned.
+#
+# @name cachedBbox
+# @param {(Feature|FeatureCollection|Geometry)} geojson input features
+# @return {Array<number>} bbox extent in [minX, minY, maxX, maxY] order,
+#   or `null` when `geojson` carries no cached one
+# @example
+# var extent = turf.cachedBbox(zone);
+# if (extent && pt[0] < extent[0]) {
+#   //=outside
+# }
+def cached_bbox(geojson):
+    cached = geojson.get("bbox")
+    if type(cached) is not _Extent and geojson.get("type") == "Feature" and \
+            geojson["geometry"]:
+        cached = geojson["geometry"].get("bbox")
+
+    if type(cached) is not _Extent:
+        return None
+    return list(cached)
+
+
+class _Extent(list):
+    # the type of the bbox members cache_bbox stores, which tells them from
+    # those of the input; it serializes as a plain list
+    pass
+
+
+def _uncached(features, corners):
+    # the features without a cached bbox, appending the corners of the others
+    for feature in features:
+        cached = cached_bbox(feature)
+        if cached is None:
+            yield feature
+        else:
+            corners.append(cached[:2])
+            corners.append(cached[2:])
+
+
+def _store(geojson):
+    if type(geojson.get("bbox")) is _Extent:
+        return
 
-    return bbox
+    # a member of the input may well be what it is computed from
+    geojson.pop("bbox", None)
+    extent = bbox(geojson)
+    # no coordinates: there is no extent to store
+    if extent[0] <= extent[2]:
+        geojson["bbox"] = _Extent(extent)
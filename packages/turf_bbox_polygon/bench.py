@@ -0,0 +1,7 @@
+from packages import bbox_polygon
+
+
+def bench(suite, size):
+    boxes = [suite.coord() + suite.coord() for _ in range(size)]
+
+    suite.add('bbox_polygon', lambda: [bbox_polygon(box) for box in boxes])
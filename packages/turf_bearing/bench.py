@@ -0,0 +1,10 @@
+from packages import bearing, bearing_many
+
+
+def bench(suite, size):
+    pairs = [(suite.point(), suite.point()) for _ in range(size)]
+    starts = [start for start, _ in pairs]
+    ends = [end for _, end in pairs]
+
+    suite.add('bearing', lambda: [bearing(start, end) for start, end in pairs])
+    suite.add('bearing_many', lambda: bearing_many(starts, ends))
@@ -1,4 +1,5 @@
-from packages.turf_invariant import get_coord
+from packages.turf_invariant import get_coord, get_coord_array
+from packages.turf_helpers import scalar_math
 import math
 # http://en.wikipedia.org/wiki/Haversine_formula
 # http://www.movable-type.co.uk/scripts/latlong.html
@@ -43,16 +44,46 @@ import math
 # //=bearing
 #
 def bearing (start, end):
-    degrees2radians = math.pi / 180
-    radians2degrees = 180 / math.pi
     coordinates1 = get_coord(start)
     coordinates2 = get_coord(end)
+    return _bearing(scalar_math, coordinates1[0], coordinates1[1],
+                    coordinates2[0], coordinates2[1])
+
+
+# Finds the bearings between many pairs of {@link Point|points} at once, with
+#   the same formula as `bearing`, vectorized with numpy.
+#
+# @name bearing_many
+# @param {FeatureCollection<Point>|Array<Array<number>>} starts starting
+#   points, as a FeatureCollection, a list of points or an (n, 2) array of
+#   coordinates; a single point is paired with every end
+# @param {FeatureCollection<Point>|Array<Array<number>>} ends ending points,
+#   likewise
+# @returns {numpy.ndarray} bearing in decimal degrees from each start to its
+#   end
+# @example
+# var bearings = turf.bearing_many(starts, ends);
+#
+# //=bearings
+#
+def bearing_many(starts, ends):
+    import numpy as np
+
+    starts = get_coord_array(starts)
+    ends = get_coord_array(ends)
+    return _bearing(np, starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1])
+
+
+def _bearing(xp, lon1, lat1, lon2, lat2):
+    # `xp` is numpy for arrays of coordinates, scalar_math for floats
+    degrees2radians = math.pi / 180
+    radians2degrees = 180 / math.pi
 
-    lon1 = degrees2radians * coordinates1[0]
-    lon2 = degrees2radians * coordinates2[0]
-    lat1 = degrees2radians * coordinates1[1]
-    lat2 = degrees2radians * coordinates2[1]
-    a = math.sin(lon2 - lon1) * math.cos(lat2)
-    b = math.cos(lat1) * math.sin(lat2) - \
-        math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1)
-    return radians2degrees * math.atan2(a, b)
+    lon1 = degrees2radians * lon1
+    lon2 = degrees2radians * lon2
+    lat1 = degrees2radians * lat1
+    lat2 = degrees2radians * lat2
+    a = xp.sin(lon2 - lon1) * xp.cos(lat2)
+    b = xp.cos(lat1) * xp.sin(lat2) - \
+        xp.sin(lat1) * xp.cos(lat2) * xp.cos(lon2 - lon1)
+    return radians2degrees * xp.arctan2(a, b)
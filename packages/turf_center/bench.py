@@ -0,0 +1,7 @@
+from packages import center
+
+
+def bench(suite, size):
+    points = suite.points(size)
+
+    suite.add('center', lambda: center(points))
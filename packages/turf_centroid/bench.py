@@ -0,0 +1,9 @@
+from packages import centroid
+
+
+def bench(suite, size):
+    poly = suite.polygon(size)
+    points = suite.points(size)
+
+    suite.add('centroid#polygon', lambda: centroid(poly))
+    suite.add('centroid#points', lambda: centroid(points))
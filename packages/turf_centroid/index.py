@@ -1,4 +1,4 @@
-from packages.turf_meta import coord_each
+from packages.turf_meta import is_packed, iter_coords
 from geojson import Feature, Point
 
 # Takes one or more features and calculates the centroid using
@@ -7,7 +7,8 @@ from geojson import Feature, Point
 # the centroid of a set of polygons.
 #
 # @name centroid
-# @param {(Feature|FeatureCollection)} features input features
+# @param {(Feature|FeatureCollection|Iterable<Feature>)} features input
+#   features, or a stream of them such as `read_features` returns
 # @return {Feature<Point>} the centroid of the input features
 # @example
 # var poly = {
@@ -34,17 +35,17 @@ from geojson import Feature, Point
 #
 # //=result
 def centroid(features):
-    local_vars = {
-        "x_sum": 0,
-        "y_sum": 0,
-        "length": 0
-    }
+    if is_packed(features):
+        x, y = features.coord_array(True)[:, :2].mean(axis=0).tolist()
+        return Feature(geometry=Point((x, y)))
 
-    def callback(coord):
-        local_vars["x_sum"] += coord[0]
-        local_vars["y_sum"] += coord[1]
-        local_vars["length"] += 1
+    x_sum = 0
+    y_sum = 0
+    length = 0
 
-    coord_each(features, callback, True)
-    return Feature(Point((local_vars["x_sum"] / local_vars["length"],
-                          local_vars["y_sum"] / local_vars["length"])))
+    for coord in iter_coords(features, True):
+        x_sum += coord[0]
+        y_sum += coord[1]
+        length += 1
+
+    return Feature(geometry=Point((x_sum / length, y_sum / length)))
@@ -0,0 +1,11 @@
+from packages import circle, circle_rings, circles
+
+
+def bench(suite, size):
+    center = suite.point()
+    centers = suite.points(size)
+
+    suite.add('circle', lambda: circle(center, 5, size, 'kilometers'))
+    suite.add('circles', lambda: circles(centers, 5, 64, 'kilometers'))
+    suite.add('circle_rings',
+              lambda: circle_rings(centers, 5, 64, 'kilometers'))
@@ -1,5 +1,11 @@
-from packages import destination
-from geojson import Polygon
+from packages.turf_helpers import distance_to_radians, scalar_math
+from packages.turf_invariant import get_coord, get_coord_array
+from packages.turf_meta import copy_feature
+from geojson import Feature, FeatureCollection, Polygon
+import math
+
+# sines and cosines of the bearings of the vertices of a circle, by steps
+_ANGLES = {}
 
 # Takes a {@link Point} and calculates the circle polygon given a radius
 #   in degrees, radians, miles, or kilometers; and steps for precision.
@@ -20,14 +26,159 @@ from geojson import Polygon
 #
 # //=circle
 #
-def circle(center, radius, steps, units):
+def circle(center, radius, steps=64, units="kilometers"):
     steps = steps or 64
-    coordinates = []
+    degrees2radians = math.pi / 180
+    radians2degrees = 180 / math.pi
+    coordinates1 = get_coord(center)
+    longitude1 = degrees2radians * coordinates1[0]
+    latitude1 = degrees2radians * coordinates1[1]
+    radians = distance_to_radians(radius, units)
 
+    # the terms of `destination` that only depend on the center and radius
+    sin_latitude1 = math.sin(latitude1)
+    cos_latitude1 = math.cos(latitude1)
+    sin_radians = math.sin(radians)
+    cos_radians = math.cos(radians)
+
+    coordinates = []
+    sines, cosines = _angles(steps)
     for i in range(steps):
-        point = destination(center, radius, i * 360 / steps, units)
-        coordinates.append(point["geometry"]["coordinates"])
+        longitude2, latitude2 = _ring(
+            scalar_math, longitude1, sin_latitude1, cos_latitude1,
+            sin_radians, cos_radians, sines[i], cosines[i])
+        coordinates.append((radians2degrees * longitude2,
+                            radians2degrees * latitude2))
 
     coordinates.append(coordinates[0])
 
     return Polygon([coordinates])
+
+
+# Calculates the circles around many {@link Point|points} at once, with the
+#   vertices `circle` would give them. The bearings of the vertices are
+#   computed once per number of steps, and the centers are processed in
+#   chunks with numpy, so that memory use does not grow with their number.
+#
+# Each circle is a Feature: when the centers are Features, it has a copy of
+#   the properties of its center.
+#
+# @name circles
+# @param {FeatureCollection<Point>|Array<Array<number>>} centers center
+#   points, as a FeatureCollection, a list of points or an (n, 2) array of
+#   coordinates
+# @param {number|Array<number>} radii radius of each circle, or one for all
+#   of them
+# @param {number} [steps=64] number of steps
+# @param {string} [units=kilometers] miles, kilometers, degrees, or radians
+# @param {number} [chunkSize=4096] number of circles computed at a time
+# @returns {FeatureCollection<Polygon>} circle polygons, in the order of
+#   their centers
+# @example
+# var coverage = turf.circles(stores, 5, 64, 'kilometers');
+#
+# //=coverage
+#
+def circles(centers, radii, steps=64, units="kilometers", chunk_size=4096):
+    import numpy as np
+
+    if isinstance(centers, dict):
+        centers = centers["features"] \
+            if centers["type"] == "FeatureCollection" else [centers]
+    coordinates = get_coord_array(centers)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64),
+                            (len(coordinates),))
+
+    features = []
+    for start in range(0, len(coordinates), chunk_size):
+        stop = start + chunk_size
+        rings = circle_rings(coordinates[start:stop], radii[start:stop],
+                             steps, units)
+        for i, ring in enumerate(rings.tolist(), start):
+            # rounded as geojson rounds the rings of `circle`, without
+            # its per-number checks
+            polygon = {"type": "Polygon", "coordinates": [
+                [[round(x, 6), round(y, 6)] for x, y in ring]
+            ]}
+            center = centers[i]
+            if isinstance(center, dict) and center["type"] == "Feature":
+                features.append(copy_feature(center, polygon))
+            else:
+                features.append(Feature(geometry=polygon, properties={}))
+
+    return FeatureCollection(features)
+
+
+# Packed variant of `circles`: the same rings, as one numpy array rather
+#   than GeoJSON objects. Values are those the Polygons are built from,
+#   before geojson rounds them to its output precision.
+#
+# @name circleRings
+# @param {FeatureCollection<Point>|Array<Array<number>>} centers center
+#   points, as a FeatureCollection, a list of points or an (n, 2) array of
+#   coordinates
+# @param {number|Array<number>} radii radius of each circle, or one for all
+#   of them
+# @param {number} [steps=64] number of steps
+# @param {string} [units=kilometers] miles, kilometers, degrees, or radians
+# @returns {numpy.ndarray} (n, steps + 1, 2) closed rings of the circles
+# @example
+# var rings = turf.circleRings(stores, 5, 64, 'kilometers');
+def circle_rings(centers, radii, steps=64, units="kilometers"):
+    import numpy as np
+
+    steps = steps or 64
+    degrees2radians = math.pi / 180
+    radians2degrees = 180 / math.pi
+    coordinates = get_coord_array(centers)
+    count = len(coordinates)
+
+    # one row per circle, one column per vertex
+    longitude1 = (degrees2radians * coordinates[:, 0])[:, None]
+    latitude1 = (degrees2radians * coordinates[:, 1])[:, None]
+    radians = distance_to_radians(np.asarray(radii, dtype=np.float64), units)
+    radians = np.broadcast_to(radians, (count,))[:, None]
+    sines, cosines = (np.array(table) for table in _angles(steps))
+
+    sin_latitude1 = np.sin(latitude1)
+    cos_latitude1 = np.cos(latitude1)
+    sin_radians = np.sin(radians)
+    cos_radians = np.cos(radians)
+
+    longitude2, latitude2 = _ring(np, longitude1, sin_latitude1,
+                                  cos_latitude1, sin_radians, cos_radians,
+                                  sines, cosines)
+
+    rings = np.empty((count, steps + 1, 2), dtype=np.float64)
+    rings[:, :steps, 0] = radians2degrees * longitude2
+    rings[:, :steps, 1] = radians2degrees * latitude2
+    rings[:, steps] = rings[:, 0]
+    return rings
+
+
+def _ring(xp, longitude1, sin_latitude1, cos_latitude1, sin_radians,
+          cos_radians, sin_bearing, cos_bearing):
+    # `destination`, in radians, from the sines and cosines of the center
+    # latitude, the radius and the bearing, which the callers compute once
+    # for many vertices; `xp` is numpy for arrays, scalar_math for floats
+    latitude2 = xp.arcsin(
+        sin_latitude1 * cos_radians +
+        cos_latitude1 * sin_radians * cos_bearing
+    )
+    longitude2 = longitude1 + xp.arctan2(
+        sin_bearing * sin_radians * cos_latitude1,
+        cos_radians - sin_latitude1 * xp.sin(latitude2)
+    )
+    return longitude2, latitude2
+
+
+def _angles(steps):
+    # the sines and cosines of the bearings `circle` steps through,
+    # computed the way `destination` computes them from a bearing
+    if steps not in _ANGLES:
+        degrees2radians = math.pi / 180
+        bearings = [degrees2radians * (i * 360.0 / steps)
+                    for i in range(steps)]
+        _ANGLES[steps] = ([math.sin(bearing) for bearing in bearings],
+                          [math.cos(bearing) for bearing in bearings])
+    return _ANGLES[steps]
@@ -0,0 +1,22 @@
+from packages.turf_parallel import JoinExecutor
+from packages import collect, spatial_index
+
+
+def bench(suite, size):
+    polygons = suite.polygons(max(size // 10, 1))
+    points = suite.points(size, properties=lambda i: {'population': i})
+    index = spatial_index(polygons)
+    # started once, outside the timings, as a long running service would,
+    # by a join of one point; stopped once the cases are done
+    executor = JoinExecutor(4)
+    list(executor.contained(points["features"][:1], polygons))
+    suite.cleanup(executor.close)
+
+    suite.add('collect',
+              lambda: collect(polygons, points, 'population', 'values'))
+    suite.add('collect#indexed',
+              lambda: collect(polygons, points, 'population', 'values',
+                              index))
+    suite.add('collect#workers=4',
+              lambda: collect(polygons, points, 'population', 'values',
+                              workers=executor))
@@ -1,4 +1,8 @@
 from packages import inside
+from packages.turf_meta import feature_table, iter_features
+from packages.turf_parallel import iter_contained
+from packages.turf_spatial_index import spatial_index
+from geojson import FeatureCollection
 
 # Merges a specified property from a FeatureCollection of points into a
 # FeatureCollection of polygons. Given an `inProperty` on points
@@ -7,11 +11,18 @@ from packages import inside
 #   and adds them as an array to `outProperty` on the polygon.
 #
 # @name collect
-# @param {FeatureCollection<Polygon>} polygons polygons with values on which
-#   to aggregate
-# @param {FeatureCollection<Point>} points points to be aggregated
+# @param {FeatureCollection<Polygon>|PackedCollection} polygons polygons
+#   with values on which to aggregate; packed ones are unpacked into the
+#   returned collection
+# @param {FeatureCollection<Point>|Iterable<Feature<Point>>} points points
+#   to be aggregated, or a stream of them such as `read_features` returns
 # @param {string} inProperty property to be nested from
 # @param {string} outProperty property to be nested into
+# @param {SpatialIndex} [index] spatial index of `polygons`, to reuse across
+#   calls; built on the fly when omitted
+# @param {number|JoinExecutor} [workers] number of processes to run the join
+#   on, or a `JoinExecutor` to reuse across calls; the index is then built
+#   by each process instead
 # @return {FeatureCollection<Polygon>} polygons with properties listed based
 #   on `outField`
 # @example
@@ -28,11 +39,34 @@ from packages import inside
 #
 # collected.features[0].properties.values // => [200, 600]);
 #
-def collect(polygons, points, in_property, out_property):
-    for poly in polygons["features"]:
-        values = map(lambda point: point["properties"][in_property],
-                     [pt for pt in points["features"] if inside(pt, poly)])
+def collect(polygons, points, in_property, out_property, index=None,
+            workers=None):
+    if index is None and workers is None:
+        index = spatial_index(polygons)
+    source = polygons
+    if not isinstance(polygons, dict):
+        polygons = FeatureCollection(list(iter_features(polygons)))
+
+    if workers is not None:
+        pairs = iter_contained(points, source, workers)
+    else:
+        pairs = _contained(points, polygons, index)
+
+    values = [[] for _ in polygons["features"]]
+    for pt, polygon_ids in pairs:
+        for i in polygon_ids:
+            values[i].append(pt["properties"][in_property])
+
+    for poly, poly_values in zip(polygons["features"], values):
         if not poly["properties"]:
             poly["properties"] = {}
-        poly["properties"][out_property] = values
+        poly["properties"][out_property] = poly_values
     return polygons
+
+
+def _contained(points, polygons, index):
+    # each point, with the polygons it lands within
+    features = feature_table(polygons)
+    for pt in iter_features(points):
+        yield pt, [i for i in index.search_point(pt)
+                   if inside(pt, features[i])]
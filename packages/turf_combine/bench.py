@@ -0,0 +1,9 @@
+from packages import combine
+
+
+def bench(suite, size):
+    points = suite.points(size)
+    polygons = suite.polygons(max(size // 10, 1))
+
+    suite.add('combine#points', lambda: combine(points))
+    suite.add('combine#polygons', lambda: combine(polygons))
@@ -47,7 +47,7 @@ def combine (feature_collection):
     def multi_mapping_reduce_function(memo, item):
         memo[item.replace('Multi', '')] = item
         return memo
-    multi_mapping = reduce(multi_mapping_reduce_function, groups.keys())
+    multi_mapping = reduce(multi_mapping_reduce_function, groups.keys(), {})
 
     def add_to_group(feature, key, multi):
         if not multi:
@@ -62,9 +62,9 @@ def combine (feature_collection):
     def callback(feature):
         if not feature["geometry"]:
             return
-        if groups[feature["geometry"]["type"]]:
+        if feature["geometry"]["type"] in groups:
             add_to_group(feature, feature["geometry"]["type"], True)
-        elif multi_mapping[feature["geometry"]["type"]]:
+        elif feature["geometry"]["type"] in multi_mapping:
             add_to_group(feature, multi_mapping[feature["geometry"]["type"]],
                          False)
     feature_each(feature_collection, callback)
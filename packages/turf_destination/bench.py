@@ -0,0 +1,11 @@
+from packages import destination, destination_many
+
+
+def bench(suite, size):
+    origins = [suite.point() for _ in range(size)]
+
+    suite.add('destination', lambda: [
+        destination(origin, 50, 90, 'kilometers') for origin in origins
+    ])
+    suite.add('destination_many',
+              lambda: destination_many(origins, 50, 90, 'kilometers'))
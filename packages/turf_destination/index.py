@@ -1,7 +1,7 @@
 # http://en.wikipedia.org/wiki/Haversine_formula
 # http://www.movable-type.co.uk/scripts/latlong.html
-from packages.turf_invariant import get_coord
-from packages.turf_helpers import distance_to_radians
+from packages.turf_invariant import get_coord, get_coord_array
+from packages.turf_helpers import distance_to_radians, scalar_math
 from geojson import Point
 import math
 
@@ -43,22 +43,58 @@ import math
 # //=result
 # 
 def destination (point_from, distance, bearing, units):
+    coordinates1 = get_coord(point_from)
+    return Point(_destination(scalar_math, coordinates1[0], coordinates1[1],
+                              distance, bearing, units))
+
+
+# Calculates the destinations of many {@link Point|points} at once, with the
+#   same formula as `destination`, vectorized with numpy.
+#
+# @name destination_many
+# @param {FeatureCollection<Point>|Array<Array<number>>} origins starting
+#   points, as a FeatureCollection, a list of points or an (n, 2) array of
+#   coordinates
+# @param {number|Array<number>} distance distance from each starting point,
+#   or one for all of them
+# @param {number|Array<number>} bearing bearing from each starting point,
+#   or one for all of them
+# @param {String} [units=kilometers] miles, kilometers, degrees, or radians
+# @returns {numpy.ndarray} (n, 2) coordinates of the destination points
+# @example
+# var destinations = turf.destination_many(points, 50, bearings, 'miles');
+#
+# //=destinations
+#
+def destination_many(origins, distance, bearing, units="kilometers"):
+    import numpy as np
+
+    origins = get_coord_array(origins)
+    longitude2, latitude2 = _destination(
+        np, origins[:, 0], origins[:, 1],
+        np.asarray(distance, dtype=np.float64),
+        np.asarray(bearing, dtype=np.float64), units
+    )
+    return np.column_stack(np.broadcast_arrays(longitude2, latitude2))
+
+
+def _destination(xp, longitude1, latitude1, distance, bearing, units):
+    # `xp` is numpy for arrays of coordinates, scalar_math for floats
     degrees2radians = math.pi / 180
     radians2degrees = 180 / math.pi
-    coordinates1 = get_coord(point_from)
-    longitude1 = degrees2radians * coordinates1[0]
-    latitude1 = degrees2radians * coordinates1[1]
+    longitude1 = degrees2radians * longitude1
+    latitude1 = degrees2radians * latitude1
     bearing_rad = degrees2radians * bearing
 
     radians = distance_to_radians(distance, units)
 
-    latitude2 = math.asin(
-        math.sin(latitude1) * math.cos(radians) +
-        math.cos(latitude1) * math.sin(radians) * math.cos(bearing_rad)
+    latitude2 = xp.arcsin(
+        xp.sin(latitude1) * xp.cos(radians) +
+        xp.cos(latitude1) * xp.sin(radians) * xp.cos(bearing_rad)
     )
-    longitude2 = longitude1 + math.atan2(
-        math.sin(bearing_rad) * math.sin(radians) * math.cos(latitude1),
-        math.cos(radians) - math.sin(latitude1) * math.sin(latitude2)
+    longitude2 = longitude1 + xp.arctan2(
+        xp.sin(bearing_rad) * xp.sin(radians) * xp.cos(latitude1),
+        xp.cos(radians) - xp.sin(latitude1) * xp.sin(latitude2)
     )
 
-    return Point((radians2degrees * longitude2, radians2degrees * latitude2))
+    return radians2degrees * longitude2, radians2degrees * latitude2
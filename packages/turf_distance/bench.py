@@ -0,0 +1,18 @@
+from packages import distance, distance_many, distance_matrix, \
+    distance_pairs
+
+
+def bench(suite, size):
+    origin = suite.point()
+    points = suite.points(size)
+    targets = suite.points(100)
+
+    suite.add('distance', lambda: [
+        distance(origin, point, 'kilometers') for point in points['features']
+    ])
+    suite.add('distance_many',
+              lambda: distance_many(origin, points, 'kilometers'))
+    suite.add('distance_pairs',
+              lambda: distance_pairs(points, points, 'kilometers'))
+    suite.add('distance_matrix#x100',
+              lambda: distance_matrix(points, targets, 'kilometers'))
@@ -1,5 +1,5 @@
-from packages.turf_invariant import get_coord
-from packages.turf_helpers import radians_to_distance
+from packages.turf_invariant import get_coord, get_coord_array
+from packages.turf_helpers import radians_to_distance, scalar_math
 import math
 # //http://en.wikipedia.org/wiki/Haversine_formula
 # //http://www.movable-type.co.uk/scripts/latlong.html
@@ -45,19 +45,142 @@ import math
 # //=distance
 # 
 def distance (point_from, point_to, units):
-    degrees2radians = math.pi / 180
     coordinates1 = get_coord(point_from)
     coordinates2 = get_coord(point_to)
-    d_lat = degrees2radians * (coordinates2[1] - coordinates1[1])
-    d_lon = degrees2radians * (coordinates2[0] - coordinates1[0])
-    lat1 = degrees2radians * coordinates1[1]
-    lat2 = degrees2radians * coordinates2[1]
+    return _distance(scalar_math, coordinates1[0], coordinates1[1],
+                     coordinates2[0], coordinates2[1], units)
+
+
+# Calculates the distances between many pairs of {@link Point|points} at once,
+# with the same [Haversine formula](http://en.wikipedia.org/wiki/Haversine_formula)
+# as `distance`, vectorized with numpy.
+#
+# @name distance_pairs
+# @param {FeatureCollection<Point>|Array<Array<number>>} a first point of each
+#   pair, as a FeatureCollection, a list of points or an (n, 2) array of
+#   coordinates; a single point is paired with every point of `b`
+# @param {FeatureCollection<Point>|Array<Array<number>>} b second point of
+#   each pair, likewise
+# @param {String} [units=kilometers] any of the units in turf_helpers.factors
+# @return {numpy.ndarray} distance between the points of each pair
+# @example
+# var legs = turf.distance_pairs(departures, arrivals, 'miles');
+#
+# //=legs
+#
+def distance_pairs(a, b, units="kilometers"):
+    import numpy as np
+
+    a = get_coord_array(a)
+    b = get_coord_array(b)
+    return _distance(np, a[:, 0], a[:, 1], b[:, 0], b[:, 1], units)
 
-    a = math.pow(math.sin(d_lat / 2), 2) + \
-        math.pow(math.sin(d_lon / 2), 2) * math.cos(lat1) * math.cos(lat2)
+
+def _distance(xp, lon1, lat1, lon2, lat2, units, cos_lat2=None):
+    # `xp` is numpy for arrays of coordinates, scalar_math for floats;
+    # `cos_lat2`, when given, is the cosine of lat2, computed once for
+    # repeated calls
+    degrees2radians = math.pi / 180
+    d_lat = degrees2radians * (lat2 - lat1)
+    d_lon = degrees2radians * (lon2 - lon1)
+    if cos_lat2 is None:
+        cos_lat2 = xp.cos(degrees2radians * lat2)
+
+    a = xp.sin(d_lat / 2) ** 2 + \
+        xp.sin(d_lon / 2) ** 2 * xp.cos(degrees2radians * lat1) * cos_lat2
 
     return radians_to_distance(
-        2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)),
+        2 * xp.arctan2(xp.sqrt(a), xp.sqrt(1 - a)),
         units
     )
 
+
+# Calculates the distances from one {@link Point|point} to many others at once
+# using the same [Haversine formula](http://en.wikipedia.org/wiki/Haversine_formula)
+# as `distance`, vectorized with numpy.
+#
+# @name distance_many
+# @param {Feature<Point>} origin origin point
+# @param {FeatureCollection<Point>|Array<Array<number>>} points destination
+#   points, as a FeatureCollection, a list of points or an (n, 2) array
+#   of coordinates
+# @param {String} [units=kilometers] any of the units in turf_helpers.factors
+# @return {numpy.ndarray} distance from `origin` to each of `points`
+# @example
+# var distances = turf.distance_many(origin, points, 'miles');
+#
+# //=distances
+#
+def distance_many(origin, points, units="kilometers"):
+    import numpy as np
+
+    lon1, lat1 = get_coord(origin)[:2]
+    coords = get_coord_array(points)
+    return _distance(np, lon1, lat1, coords[:, 0], coords[:, 1], units)
+
+
+# Calculates the distance between every pair of points taken from two sets,
+# using the same [Haversine formula](http://en.wikipedia.org/wiki/Haversine_formula)
+# as `distance`, vectorized with numpy.
+#
+# The whole matrix takes len(a) * len(b) * 8 bytes, plus about as much again
+# in temporaries while it is computed. Passing `chunk_size` bounds the
+# temporaries to `chunk_size` rows at a time; to never hold the full matrix at
+# all, iterate over `distance_matrix_chunks` instead.
+#
+# @name distance_matrix
+# @param {FeatureCollection<Point>|Array<Array<number>>} a row points
+# @param {FeatureCollection<Point>|Array<Array<number>>} b column points
+# @param {String} [units=kilometers] any of the units in turf_helpers.factors
+# @param {number} [chunk_size] number of rows computed at a time
+# @return {numpy.ndarray} (len(a), len(b)) matrix of distances
+# @example
+# var matrix = turf.distance_matrix(stores, customers, 'miles');
+#
+# //=matrix
+#
+def distance_matrix(a, b, units="kilometers", chunk_size=None):
+    import numpy as np
+
+    a = get_coord_array(a)
+    b = get_coord_array(b)
+    if chunk_size is None:
+        chunk_size = max(len(a), 1)
+
+    matrix = np.empty((len(a), len(b)), dtype=np.float64)
+    for start, chunk in distance_matrix_chunks(a, b, units, chunk_size):
+        matrix[start:start + len(chunk)] = chunk
+
+    return matrix
+
+
+# Yields the rows of `distance_matrix(a, b, units)` in blocks of at most
+# `chunk_size` rows, so that memory use stays bounded by
+# chunk_size * len(b) whatever the size of `a`.
+#
+# @name distance_matrix_chunks
+# @param {FeatureCollection<Point>|Array<Array<number>>} a row points
+# @param {FeatureCollection<Point>|Array<Array<number>>} b column points
+# @param {String} [units=kilometers] any of the units in turf_helpers.factors
+# @param {number} [chunk_size=1024] number of rows per block
+# @return {Iterator<[number, numpy.ndarray]>} index of the first row of each
+#   block, and the block itself
+# @example
+# var blocks = turf.distance_matrix_chunks(pings, zones, 'meters', 4096);
+#
+# //=blocks
+#
+def distance_matrix_chunks(a, b, units="kilometers", chunk_size=1024):
+    import numpy as np
+
+    a = get_coord_array(a)
+    b = get_coord_array(b)
+    lon2 = b[:, 0][np.newaxis, :]
+    lat2 = b[:, 1][np.newaxis, :]
+    cos_lat2 = np.cos(np.radians(lat2))
+
+    for start in range(0, len(a), chunk_size):
+        chunk = a[start:start + chunk_size]
+        yield start, _distance(np, chunk[:, 0][:, np.newaxis],
+                               chunk[:, 1][:, np.newaxis], lon2, lat2, units,
+                               cos_lat2)
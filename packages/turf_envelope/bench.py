@@ -0,0 +1,7 @@
+from packages import envelope
+
+
+def bench(suite, size):
+    points = suite.points(size)
+
+    suite.add('envelope', lambda: envelope(points))
@@ -0,0 +1,7 @@
+from packages import explode
+
+
+def bench(suite, size):
+    poly = suite.polygon(size)
+
+    suite.add('explode', lambda: explode(poly))
@@ -1,4 +1,4 @@
-from packages.turf_meta import coord_each
+from packages.turf_meta import iter_coords
 from geojson import FeatureCollection, Point
 
 # Takes a feature or set of features and returns all positions as
@@ -33,6 +33,4 @@ from geojson import FeatureCollection, Point
 #
 # //=points
 def explode(geojson):
-    points = []
-    coord_each(geojson, lambda coord: points.append(Point(coord)))
-    return FeatureCollection(points)
+    return FeatureCollection([Point(coord) for coord in iter_coords(geojson)])
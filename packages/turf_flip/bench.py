@@ -0,0 +1,11 @@
+from packages import flip
+
+
+def bench(suite, size):
+    poly = suite.polygon(size)
+    points = suite.points(size)
+
+    suite.add('flip#polygon', lambda: flip(poly))
+    suite.add('flip#points', lambda: flip(points))
+    # flips back and forth, the layer is the same every other call
+    suite.add('flip#points#inplace', lambda: flip(points, inplace=True))
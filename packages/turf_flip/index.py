@@ -1,13 +1,18 @@
-from packages.turf_meta import coord_each
-import json
+from packages.turf_bbox.index import invalidate_bbox
+from packages.turf_meta import coord_each, copy_feature, is_packed
+from numbers import Number
 
 # Takes input features and flips all of their coordinates
 # from `[x, y]` to `[y, x]`.
 #
 # @name flip
 # @param {(Feature|FeatureCollection)} input input features
+# @param {boolean} [inplace=false] flip the coordinates of `input` itself,
+#   rather than those of a copy
 # @returns {(Feature|FeatureCollection)} a feature or set of features
-#   of the same type as `input` with flipped coordinates
+#   of the same type as `input` with flipped coordinates; unless flipped in
+#   place, its features and properties dicts are new, but the property
+#   values are shared with `input`
 # @example
 # var serbia = {
 #   "type": "Feature",
@@ -23,12 +28,57 @@ import json
 # var saudiArabia = turf.flip(serbia);
 #
 # //=saudiArabia
-def flip(input):
-    # ensure that we don't modify features in-place and changes to the
-    # output do not change the previous feature, including changes to nested
-    # properties.
-    input = json.loads(json.dumps(input))
+def flip(input, inplace=False):
+    # packed collections flip their coordinate buffer in one go and
+    # never share it with the output.
+    if is_packed(input):
+        return input.flip(inplace)
 
-    coord_each(input, lambda coord: reversed(coord))
-    return input
+    if inplace:
+        # a position listed twice, like the closing position of a ring built
+        # from its first one, is one list and must only be swapped once
+        seen = set()
 
+        def swap(coord):
+            if id(coord) not in seen:
+                seen.add(id(coord))
+                coord[0], coord[1] = coord[1], coord[0]
+        coord_each(input, swap)
+        return invalidate_bbox(input)
+
+    # only the coordinates are rebuilt: the output gets new features and
+    # properties dicts, and shares everything else with the input, but for
+    # the bbox members, which no longer hold.
+    if input["type"] == "FeatureCollection":
+        output = dict(input)
+        output.pop("bbox", None)
+        output["features"] = [_flip_feature(feature)
+                              for feature in input["features"]]
+        return output
+    if input["type"] == "Feature":
+        return _flip_feature(input)
+    return _flip_geometry(input)
+
+
+def _flip_feature(feature):
+    return copy_feature(feature, _flip_geometry(feature["geometry"]))
+
+
+def _flip_geometry(geometry):
+    if geometry is None:
+        return None
+
+    output = dict(geometry)
+    output.pop("bbox", None)
+    if geometry["type"] == "GeometryCollection":
+        output["geometries"] = [_flip_geometry(member)
+                                for member in geometry["geometries"]]
+    else:
+        output["coordinates"] = _flip_coords(geometry["coordinates"])
+    return output
+
+
+def _flip_coords(coords):
+    if len(coords) and isinstance(coords[0], Number):
+        return [coords[1], coords[0]] + list(coords[2:])
+    return [_flip_coords(member) for member in coords]
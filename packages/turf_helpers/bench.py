@@ -0,0 +1,12 @@
+from packages.turf_helpers import radians_to_distance, distance_to_radians
+
+
+def bench(suite, size):
+    values = [suite.random.uniform(0, 1) for _ in range(size)]
+
+    suite.add('radians_to_distance', lambda: [
+        radians_to_distance(value, 'miles') for value in values
+    ])
+    suite.add('distance_to_radians', lambda: [
+        distance_to_radians(value, 'miles') for value in values
+    ])
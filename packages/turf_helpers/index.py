@@ -1,4 +1,6 @@
 from numbers import Number
+from types import ModuleType
+import math
 
 
 factors = {
@@ -57,7 +59,7 @@ def distance_to_radians(distance, units="kilometers"):
     if factor is None:
         raise ValueError("Invalid unit")
 
-    return distance / factor
+    return distance / float(factor)
 
 
 def distance_to_degrees(distance, units="kilometers"):
@@ -79,11 +81,24 @@ def distance_to_degrees(distance, units="kilometers"):
     if factor is None:
         raise ValueError("Invalid unit")
 
-    return (distance / factor) * 57.2958
+    return (distance / float(factor)) * 57.2958
+
+
+# The functions of `math` under the names numpy gives them, so that a kernel
+# written once against an array namespace runs on numpy arrays when given
+# `numpy`, and on floats, with the results of `math`, when given this. It is
+# a module, so that looking its functions up costs what it does on `math`.
+scalar_math = ModuleType("scalar_math")
+scalar_math.sin = math.sin
+scalar_math.cos = math.cos
+scalar_math.sqrt = math.sqrt
+scalar_math.arcsin = math.asin
+scalar_math.arctan2 = math.atan2
 
 
 __all__ = [
     "factors",
+    "scalar_math",
     "radians_to_distance",
     "distance_to_radians",
     "distance_to_degrees"
@@ -0,0 +1,31 @@
+from packages import hex_bin, hex_bin_arrays, hex_grid, hex_grid_arrays, \
+    iter_hex_grid
+
+
+def bench(suite, size):
+    bbox = suite.bbox()
+    # roughly `size` cells over a 10 degree box at the equator
+    cell = 1111.0 / size ** 0.5
+    points = suite.points(size, properties=lambda i: {'value': i})
+    coords = [pt["geometry"]["coordinates"] for pt in points["features"]]
+
+    def drain(cells):
+        count = 0
+        for _ in cells:
+            count += 1
+        return count
+
+    suite.add('hex_grid', lambda: hex_grid(bbox, cell, 'kilometers', False))
+    suite.add('hex_grid#triangles',
+              lambda: hex_grid(bbox, cell, 'kilometers', True))
+    suite.add('iter_hex_grid',
+              lambda: drain(iter_hex_grid(bbox, cell, 'kilometers')))
+    suite.add('hex_grid_arrays',
+              lambda: hex_grid_arrays(bbox, cell, 'kilometers'))
+    suite.add('hex_grid_arrays#triangles',
+              lambda: hex_grid_arrays(bbox, cell, 'kilometers', True))
+    suite.add('hex_bin', lambda: hex_bin(points, bbox, cell, 'kilometers'))
+    suite.add('hex_bin#field',
+              lambda: hex_bin(points, bbox, cell, 'kilometers', 'value'))
+    suite.add('hex_bin_arrays',
+              lambda: hex_bin_arrays(coords, bbox, cell, 'kilometers'))
@@ -1,5 +1,8 @@
 from packages import distance
-from geojson import Point, Polygon, FeatureCollection
+from packages.turf_invariant import get_coord
+from packages.turf_meta import iter_features
+from geojson import Feature, Point, Polygon, FeatureCollection
+from collections import namedtuple
 import math
 
 # Precompute cosines and sines of angles used in hexagon creation
@@ -30,6 +33,249 @@ for ii in range(6):
 #
 # //=hexgrid
 def hex_grid(bbox, cell_size, units, triangles):
+    return FeatureCollection(list(iter_hex_grid(bbox, cell_size, units,
+                                                triangles)))
+
+
+# Lazy variant of `hexGrid`: yields the same cells one at a time instead
+#   of collecting them, so that only one cell is alive at any time.
+#
+# @name iterHexGrid
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize dimension of cell in specified units
+# @param {string} [units=kilometers] used in calculating cellSize, can be degrees, radians, miles, or kilometers
+# @param {boolean} [triangles=false] whether to yield triangles instead of hexagons
+# @return {Iterator<Polygon>} the cells of the grid
+# @example
+# for (var hex of turf.iterHexGrid([-96,31,-84,40], 50, 'miles')) {
+#   //=hex
+# }
+def iter_hex_grid(bbox, cell_size, units, triangles=False):
+    layout = hex_layout(bbox, cell_size, units)
+
+    for center in _hex_centers(layout):
+        if triangles:
+            for triangle in hex_triangles(center, layout.rx, layout.ry):
+                yield triangle
+        else:
+            yield hexagon(center, layout.rx, layout.ry)
+
+
+# Columnar variant of `hexGrid`: the same cells, in the same order, as
+#   numpy arrays rather than GeoJSON objects. Values are those the Polygons
+#   are built from, before geojson rounds them to its output precision.
+#
+# @name hexGridArrays
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize dimension of cell in specified units
+# @param {string} [units=kilometers] used in calculating cellSize, can be degrees, radians, miles, or kilometers
+# @param {boolean} [triangles=false] whether to return triangles instead of hexagons
+# @return {Array<numpy.ndarray>} the (n, 2) cell centres and the (n, 7, 2)
+#   closed rings of the hexagons; with `triangles`, the (6n, 2) centroids and
+#   the (6n, 4, 2) rings of the triangles, six per hexagon
+# @example
+# var [centres, rings] = turf.hexGridArrays([-96,31,-84,40], 50, 'miles');
+def hex_grid_arrays(bbox, cell_size, units, triangles=False):
+    import numpy as np
+
+    layout = hex_layout(bbox, cell_size, units)
+    centers = np.array(list(_hex_centers(layout)),
+                       dtype=np.float64).reshape(-1, 2)
+    corners = np.empty((len(centers), 7, 2), dtype=np.float64)
+    corners[:, :6, 0] = centers[:, :1] + layout.rx * np.array(cosines)
+    corners[:, :6, 1] = centers[:, 1:] + layout.ry * np.array(sines)
+    corners[:, 6] = corners[:, 0]
+
+    if not triangles:
+        return centers, corners
+
+    rings = np.empty((len(centers), 6, 4, 2), dtype=np.float64)
+    rings[:, :, 0] = rings[:, :, 3] = centers[:, np.newaxis]
+    rings[:, :, 1] = corners[:, :6]
+    rings[:, :, 2] = corners[:, 1:]
+    rings = rings.reshape(-1, 4, 2)
+    return rings[:, :3].mean(axis=1), rings
+
+
+# Bins points into the hexagons of `hexGrid(bbox, cellSize, units)` without
+#   building the grid: each point is mapped to its hexagon arithmetically,
+#   from the layout alone, so binning takes time linear in the number of
+#   points. Only the hexagons holding at least one point are returned, in
+#   the order `hexGrid` lists them, with the number of points in each and,
+#   given a `field`, the sum and the mean of that property over the points
+#   that have it. A point on the edge between two hexagons goes to exactly
+#   one of them, and points outside every hexagon are left out.
+#
+# @name hexBin
+# @param {FeatureCollection<Point>|Iterable<Feature<Point>>} points points
+#   to bin, or a stream of them such as `read_features` returns
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize dimension of cell in specified units
+# @param {string} [units=kilometers] used in calculating cellSize, can be degrees, radians, miles, or kilometers
+# @param {string} [field] numeric property of the points to aggregate
+# @return {FeatureCollection<Polygon>} the non-empty hexagons, with `count`,
+#   and with `sum` and `mean` when a `field` is given; `mean` is `null` in a
+#   hexagon none of whose points have the field
+# @example
+# var bins = turf.hexBin(points, [-96,31,-84,40], 50, 'miles', 'population');
+#
+# //=bins
+def hex_bin(points, bbox, cell_size, units, field=None):
+    coords = []
+    values = [] if field is not None else None
+    for pt in iter_features(points):
+        coords.append(get_coord(pt))
+        if field is not None:
+            value = (pt["properties"] or {}).get(field)
+            values.append(float("nan") if value is None else value)
+
+    layout = hex_layout(bbox, cell_size, units)
+    cells, counts, sums, means = _bin(layout, coords, values)
+
+    features = []
+    for i, (x, y) in enumerate(cells):
+        properties = {"count": counts[i]}
+        if field is not None:
+            properties["sum"] = sums[i]
+            properties["mean"] = means[i]
+        features.append(Feature(
+            geometry=hexagon(_hex_center(layout, x, y), layout.rx, layout.ry),
+            properties=properties
+        ))
+    return FeatureCollection(features)
+
+
+# Columnar variant of `hexBin`, for coordinates that already are in an array:
+#   the hexagons are identified by their position in `hexGrid`, so that
+#   `hexGridArrays(bbox, cellSize, units)[1][cells]` are their rings.
+#
+# @name hexBinArrays
+# @param {numpy.ndarray} coords (n, 2) coordinates of the points to bin
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize dimension of cell in specified units
+# @param {string} [units=kilometers] used in calculating cellSize, can be degrees, radians, miles, or kilometers
+# @param {numpy.ndarray} [values] value of each point to aggregate, NaN
+#   where a point has none
+# @return {Array<numpy.ndarray>} the index in `hexGrid` of each non-empty
+#   hexagon and the number of points in it; given `values`, then also their
+#   sum and mean in each hexagon
+# @example
+# var [cells, counts, sums, means] =
+#   turf.hexBinArrays(coords, bbox, 50, 'miles', values);
+def hex_bin_arrays(coords, bbox, cell_size, units, values=None):
+    import numpy as np
+
+    layout = hex_layout(bbox, cell_size, units)
+    cells, counts, sums, means = _bin(layout, coords, values, lists=False)
+
+    # the number of hexagons in each column, row 0 of some being left out
+    skipped = np.arange(layout.x_count) % 2 == 1
+    if layout.has_offset_y:
+        skipped[:] = True
+    offsets = np.concatenate((
+        [0], np.cumsum(layout.y_count - skipped)[:-1]
+    ))
+    indices = offsets[cells[:, 0]] + cells[:, 1] - skipped[cells[:, 0]]
+    if values is None:
+        return indices, counts
+    return indices, counts, sums, means
+
+
+# Counts, and sums `values` over, the points of `coords` in each hexagon of
+#   `layout`, listing the non-empty hexagons as (column, row) in grid order.
+def _bin(layout, coords, values, lists=True):
+    import numpy as np
+
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    x, y = _hex_cells(layout, coords[:, 0], coords[:, 1])
+
+    valid = (x >= 0) & (x < layout.x_count) & \
+        (y >= 0) & (y < layout.y_count)
+    if layout.has_offset_y:
+        valid &= y != 0
+    else:
+        valid &= (y != 0) | (x % 2 == 0)
+
+    ids = x[valid] * layout.y_count + y[valid]
+    size = layout.x_count * layout.y_count
+    counts = np.bincount(ids, minlength=size)
+    occupied = np.flatnonzero(counts)
+    cells = np.column_stack((occupied // layout.y_count,
+                             occupied % layout.y_count))
+    counts = counts[occupied]
+
+    sums = means = None
+    if values is not None:
+        values = np.asarray(values, dtype=np.float64)[valid]
+        present = ~np.isnan(values)
+        sums = np.bincount(ids[present], weights=values[present],
+                           minlength=size)[occupied]
+        valued = np.bincount(ids[present], minlength=size)[occupied]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / valued
+
+    if lists:
+        cells = cells.tolist()
+        counts = counts.tolist()
+        if values is not None:
+            sums = sums.tolist()
+            means = [None if mean != mean else mean for mean in means.tolist()]
+    return cells, counts, sums, means
+
+
+# Maps coordinates to the (column, row) of the hexagon of `layout` holding
+#   them: they are scaled so that hexagons become regular with a radius of 1,
+#   converted to axial hex coordinates and rounded to the nearest hexagon,
+#   which is then moved to the odd-q offset coordinates of the grid, whose
+#   odd columns are shifted half a row down.
+def _hex_cells(layout, x, y):
+    import numpy as np
+
+    u = (x - layout.x_origin) / layout.rx
+    v = (y - layout.y_origin) / layout.ry
+
+    q = 2 / 3.0 * u
+    r = -u / 3.0 + math.sqrt(3) / 3 * v
+    s = -q - r
+
+    rq = np.rint(q)
+    rr = np.rint(r)
+    rs = np.rint(s)
+    dq = np.abs(rq - q)
+    dr = np.abs(rr - r)
+    ds = np.abs(rs - s)
+
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq).astype(np.int64)
+    rr = np.where(fix_r, -rq - rs, rr).astype(np.int64)
+
+    return rq, rr + (rq + (rq & 1)) // 2
+
+
+# Where the cells of a hex grid go, see `hexLayout`.
+HexLayout = namedtuple("HexLayout", [
+    "x_origin", "y_origin", "x_interval", "y_interval",
+    "x_count", "y_count", "has_offset_y", "rx", "ry"
+])
+
+
+# The odd-q layout of `hexGrid(bbox, cellSize, units)`: the grid has
+#   `x_count` columns and `y_count` rows, the hexagon in column x and row y is
+#   centred on
+#
+#     x_origin + x * x_interval,
+#     y_origin + y * y_interval - (y_interval / 2 if x is odd else 0)
+#
+#   and has radii `rx` and `ry`. Row 0 is left out of odd columns, and out of
+#   every column when `has_offset_y` is set.
+#
+# @name hexLayout
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize dimension of cell in specified units
+# @param {string} [units=kilometers] used in calculating cellSize
+# @return {HexLayout} the layout of the grid, in degrees
+def hex_layout(bbox, cell_size, units):
     x_fraction = cell_size / (distance(Point((bbox[0], bbox[1])),
                                        Point((bbox[2], bbox[1])), units))
     cell_width = x_fraction * (bbox[2] - bbox[0])
@@ -44,17 +290,17 @@ def hex_grid(bbox, cell_size, units, triangles):
     box_width = bbox[2] - bbox[0]
     box_height = bbox[3] - bbox[1]
 
-    x_interval = 3 / 4 * hex_width
+    x_interval = 3 / 4.0 * hex_width
     y_interval = hex_height
 
     x_span = box_width / (hex_width - radius / 2)
-    x_count = math.ceil(x_span)
+    x_count = int(math.ceil(x_span))
     if round(x_span) == x_count:
         x_count += 1
 
     x_adjust = ((x_count * x_interval - radius / 2) - box_width) / 2 - radius / 2
 
-    y_count = math.ceil(box_height / hex_height)
+    y_count = int(math.ceil(box_height / hex_height))
 
     y_adjust = (box_height - y_count * hex_height) / 2
 
@@ -62,34 +308,32 @@ def hex_grid(bbox, cell_size, units, triangles):
     if has_offset_y:
         y_adjust -= hex_height / 4
 
-    fc = FeatureCollection([])
-    for x in range(x_count):
-        for y in range(y_count):
+    return HexLayout(bbox[0] - x_adjust, bbox[1] + y_adjust,
+                     x_interval, y_interval, x_count, y_count,
+                     has_offset_y, cell_width / 2, cell_height / 2)
+
 
-            is_odd = x % 2 == 1
+def _hex_centers(layout):
+    for x in range(layout.x_count):
+        is_odd = x % 2 == 1
+        for y in range(layout.y_count):
             if y == 0 and is_odd:
                 continue
 
-            if y == 0 and has_offset_y:
+            if y == 0 and layout.has_offset_y:
                 continue
 
-            center_x = x * x_interval + bbox[0] - x_adjust
-            center_y = y * y_interval + bbox[1] + y_adjust
-
-            if is_odd:
-                center_y -= hex_height / 2
-            if triangles:
-                fc["features"] += [
-                    hex_triangles([center_x, center_y],
-                                  cell_width / 2, cell_height / 2)
-                ]
-            else:
-                fc["features"] += [
-                    hexagon([center_x, center_y],
-                            cell_width / 2, cell_height / 2)
-                ]
-
-    return fc
+            yield _hex_center(layout, x, y)
+
+
+def _hex_center(layout, x, y):
+    center_x = layout.x_origin + x * layout.x_interval
+    center_y = layout.y_origin + y * layout.y_interval
+
+    if x % 2 == 1:
+        center_y -= layout.y_interval / 2
+    return [center_x, center_y]
+
 
 # //Center should be [x, y]
 def hexagon(center, rx, ry):
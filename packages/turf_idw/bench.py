@@ -0,0 +1,15 @@
+from packages import idw, idw_array
+
+
+def bench(suite, size):
+    points = suite.points(size, properties=lambda i: {
+        'value': suite.random.uniform(0, 100)
+    })
+    # a 20x20 grid over the control points
+    cell = 1111.0 / 20
+
+    suite.add('idw', lambda: idw(points, 'value', 2, cell, 'kilometers'))
+    suite.add('idw_array',
+              lambda: idw_array(points, 'value', 2, cell, 'kilometers'))
+    suite.add('idw_array#k=8',
+              lambda: idw_array(points, 'value', 2, cell, 'kilometers', k=8))
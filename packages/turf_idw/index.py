@@ -1,4 +1,5 @@
-from packages import bbox, centroid, distance, square_grid
+from packages import bbox, distance_matrix_chunks, grid_layout, point_index
+from geojson import Feature, FeatureCollection, Polygon
 
 
 # Takes a FeatureCollection of points with known value, a power parameter,
@@ -19,33 +20,148 @@ from packages import bbox, centroid, distance, square_grid
 #   The distance across each cell
 # @param  {String} units
 #   Units to use for cellWidth ('miles' or 'kilometers')
+# @param  {Number} [k]
+#   Only weight the k control points closest to each cell
+# @param  {Number} [radius]
+#   Only weight the control points within this distance of each cell, in
+#   `units`; a cell with none gets no value
+# @param  {Number} [chunk_size=1024]
+#   Cells evaluated at a time when every control point is weighted, bounding
+#   memory to chunk_size * len(controlPoints) distances
 # @return {FeatureCollection<Polygon>} grid
-#   A grid of polygons with a property field "IDW"
-def idw(control_points, value_field, b, cell_width, units):
+#   A grid of polygons with a property field "z"
+# @throws {ValueError} if no control point has the valueField property
+def idw(control_points, value_field, b, cell_width, units, k=None,
+        radius=None, chunk_size=1024):
+    xs, ys, cell_w, cell_h, z = _interpolate(
+        control_points, value_field, b, cell_width, units, k, radius,
+        chunk_size)
+    # the same cells as square_grid, in the same order
+    features = []
+    for i, x in enumerate(xs):
+        for j, y in enumerate(ys):
+            value = z[j, i]
+            features.append(Feature(
+                geometry=Polygon([[
+                    [x, y],
+                    [x, y + cell_h],
+                    [x + cell_w, y + cell_h],
+                    [x + cell_w, y],
+                    [x, y]
+                ]]),
+                properties={"z": None if value != value else float(value)}
+            ))
+    return FeatureCollection(features)
+
+
+# Same interpolation as `idw`, returned as a plain 2D array instead of
+#   polygons: row j and column i hold the value of the cell whose south-west
+#   corner is at the i-th x and j-th y of `grid_layout`, so that rows run
+#   from south to north. Cells without a value hold NaN.
+#
+# @param  {FeatureCollection<Point>} controlPoints
+#   Sampled points with known value
+# @param  {String} valueField
+#   GeoJSON field containing the known value to interpolate on
+# @param  {Number} b
+#   Exponent regulating the distance-decay weighting
+# @param  {Number} cellWidth
+#   The distance across each cell
+# @param  {String} units
+#   Units to use for cellWidth ('miles' or 'kilometers')
+# @param  {Number} [k]
+#   Only weight the k control points closest to each cell
+# @param  {Number} [radius]
+#   Only weight the control points within this distance of each cell
+# @param  {Number} [chunk_size=1024]
+#   Cells evaluated at a time when every control point is weighted
+# @return {numpy.ndarray} (rows, columns) interpolated values
+# @throws {ValueError} if no control point has the valueField property
+def idw_array(control_points, value_field, b, cell_width, units, k=None,
+              radius=None, chunk_size=1024):
+    return _interpolate(control_points, value_field, b, cell_width, units, k,
+                        radius, chunk_size)[4]
+
+
+def _interpolate(control_points, value_field, b, cell_width, units, k,
+                 radius, chunk_size):
+    import numpy as np
+
     # check if field containing data exists..
-    filtered = filter(
-        lambda feature: (feature["properties"] and
-                         value_field in feature["properties"]),
-        control_points["features"]
-    )
-    if len(filtered) != 0:
-        # create a sample square grid
-        # compared to a point grid helps visualizing the output
-        sampling_grid = square_grid(bbox(control_points), cell_width, units)
-        for i in range(len(sampling_grid["features"])):
-            zw = 0
-            sw = 0
-            # calculate the distance from each control point to cell's centroid
-            for j in range(len(control_points["features"])):
-                d = distance(centroid(sampling_grid["features"][j]),
-                             control_points["features"][j], units)
-                if d == 0:
-                    zw = control_points["features"][j]["properties"][value_field]
-                w = 1.0 / pow(d, b)
-                sw += w
-                zw += w * control_points["features"][j]["properties"][value_field]
-            # write IDW value for each grid cell
-            sampling_grid["features"][i]["properties"]["z"] = zw / sw
-        return sampling_grid
+    filtered = [
+        feature for feature in control_points["features"]
+        if feature["properties"] and value_field in feature["properties"]
+    ]
+    if not filtered:
+        raise ValueError("Specified Data Field is Missing")
+
+    xs, ys, cell_w, cell_h = grid_layout(bbox(control_points), cell_width,
+                                         units)
+    values = np.array([feature["properties"][value_field]
+                       for feature in filtered], dtype=np.float64)
+
+    # cell centroids, row by row
+    lon, lat = np.meshgrid(np.array(xs) + cell_w / 2,
+                           np.array(ys) + cell_h / 2)
+    centroids = np.column_stack((lon.ravel(), lat.ravel()))
+
+    if k is None and radius is None:
+        z = _weigh_all(centroids, filtered, values, b, units, chunk_size)
     else:
-        print('Specified Data Field is Missing')
+        z = _weigh_neighbours(centroids, filtered, values, b, units, k,
+                              radius)
+
+    return xs, ys, cell_w, cell_h, z.reshape(len(ys), len(xs))
+
+
+def _weigh_all(centroids, filtered, values, b, units, chunk_size):
+    import numpy as np
+
+    z = np.empty(len(centroids), dtype=np.float64)
+    for start, d in distance_matrix_chunks(centroids, filtered, units,
+                                           chunk_size):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w = 1.0 / np.power(d, b)
+            chunk = (w * values).sum(axis=1) / w.sum(axis=1)
+        # a control point sitting on a centroid gives the cell its value
+        exact = d == 0
+        on_point = exact.any(axis=1)
+        chunk[on_point] = values[exact.argmax(axis=1)[on_point]]
+        z[start:start + len(chunk)] = chunk
+    return z
+
+
+def _weigh_neighbours(centroids, filtered, values, b, units, k, radius):
+    import numpy as np
+
+    index = point_index(filtered)
+    counts = []
+    ids = []
+    distances = []
+    for centroid in centroids.tolist():
+        found = index.neighbours(centroid, k, radius, units)
+        counts.append(len(found))
+        for i, d in found:
+            ids.append(i)
+            distances.append(d)
+
+    counts = np.array(counts, dtype=np.int64)
+    ids = np.array(ids, dtype=np.int64)
+    d = np.array(distances, dtype=np.float64)
+    cells = np.repeat(np.arange(len(centroids)), counts)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w = 1.0 / np.power(d, b)
+        w[d == 0] = 0
+        z = np.bincount(cells, w * values[ids], len(centroids)) / \
+            np.bincount(cells, w, len(centroids))
+
+    # neighbours come closest first: a control point sitting on a centroid
+    # is the first of its cell
+    starts = np.cumsum(counts) - counts
+    has_any = counts > 0
+    on_point = np.zeros(len(centroids), dtype=bool)
+    on_point[has_any] = d[starts[has_any]] == 0
+    z[on_point] = values[ids[starts[on_point]]]
+    z[~has_any] = np.nan
+    return z
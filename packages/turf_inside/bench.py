@@ -0,0 +1,18 @@
+from packages import cache_bbox, inside, prepare
+
+
+def bench(suite, size):
+    poly = suite.polygon(size)
+    pt_in = suite.point([0.1, 0.1])
+    pt_out = suite.point([5, 5])
+    prepared = prepare(poly)
+    cached = cache_bbox(suite.polygon(size))
+    points = suite.points(1000, [-1, -1, 1, 1])
+
+    suite.add('inside', lambda: inside(pt_in, poly))
+    suite.add('inside#outside', lambda: inside(pt_out, poly))
+    suite.add('inside#outside,cached', lambda: inside(pt_out, cached))
+    suite.add('prepare', lambda: prepare(poly))
+    suite.add('prepared.contains', lambda: prepared.contains(pt_in))
+    suite.add('prepared.contains_many#1000',
+              lambda: prepared.contains_many(points))
@@ -1,4 +1,7 @@
+from packages.turf_bbox.index import cached_bbox
 from packages.turf_invariant import get_coord
+from packages.turf_meta import is_packed
+from packages.turf_spatial_index import spatial_index
 
 # http://en.wikipedia.org/wiki/Even%E2%80%93odd_rule
 # modified from: https://github.com/substack/point-in-polygon/blob/master/index.js
@@ -11,7 +14,10 @@ from packages.turf_invariant import get_coord
 # @name inside
 # @param {Feature<Point>} point input point
 # @param {Feature<(Polygon|MultiPolygon)>} polygon input polygon
-#   or multipolygon
+#   or multipolygon; a packed collection of polygons, such as `read_packed`
+#   returns, tests against each of them through its spatial index. A point
+#   outside the `bbox` member that `cache_bbox` stored on the polygon
+#   is rejected without reading its rings
 # @return {Boolean} `true` if the Point is inside the Polygon; `false` if
 #   the Point is not inside the Polygon
 # @example
@@ -29,10 +35,23 @@ from packages.turf_invariant import get_coord
 # //=isInside
 #
 def input(point, polygon):
+    if isinstance(polygon, PreparedPolygon):
+        return polygon.contains(point)
+
+    if is_packed(polygon):
+        features = polygon["features"]
+        return any(input(point, features[i])
+                   for i in spatial_index(polygon).search_point(point))
+
     pt = get_coord(point)
+    extent = cached_bbox(polygon)
+    if extent is not None and (pt[0] < extent[0] or pt[0] > extent[2] or
+                               pt[1] < extent[1] or pt[1] > extent[3]):
+        return False
+
     polys = polygon["geometry"]["coordinates"]
     # normalize to multipolygon
-    if polygon.geometry.type == 'Polygon':
+    if polygon["geometry"]["type"] == 'Polygon':
         polys = [polys]
 
     inside_poly = False
@@ -44,7 +63,7 @@ def input(point, polygon):
             in_hole = False
             k = 1
             # check for the point in any of the holes
-            while k < polys[i].length and not in_hole:
+            while k < len(polys[i]) and not in_hole:
                 if in_ring(pt, polys[i][k]):
                     in_hole = True
                 k += 1
@@ -58,12 +77,131 @@ def in_ring(pt, ring):
     is_inside = False
     j = len(ring) - 1
     for i in range(len(ring)):
-        xi = ring[i][0], yi = ring[i][1]
-        xj = ring[j][0], yj = ring[j][1]
+        xi, yi = ring[i][0], ring[i][1]
+        xj, yj = ring[j][0], ring[j][1]
         intersect = ((yi > pt[1]) != (yj > pt[1])) and \
             (pt[0] < (xj - xi) * (pt[1] - yi) / (yj - yi) + xi)
         if intersect:
             is_inside = not is_inside
-        j = i + 1
+        j = i
 
     return is_inside
+
+
+# Prepares a {@link Polygon} or {@link MultiPolygon} for testing many points
+#   against it. All the per-polygon work `inside` repeats on every call is
+#   done once: rings are normalized, each ring gets a bounding box, and its
+#   edges are sorted by y into horizontal slabs, so that a point is only
+#   tested against the few edges of the slab it falls in.
+#
+# The answers are exactly those of `inside`; the prepared polygon can also be
+#   passed to `inside` in place of the polygon.
+#
+# @name prepare
+# @param {Feature<(Polygon|MultiPolygon)>} polygon input polygon
+#   or multipolygon
+# @return {PreparedPolygon} prepared polygon
+# @example
+# var zone = turf.prepare(poly);
+#
+# var isInside = zone.contains(pt);
+#
+# var flags = zone.contains_many(points);
+#
+# //=flags
+#
+def prepare(polygon):
+    return PreparedPolygon(polygon)
+
+
+# A polygon prepared for repeated point in polygon tests, see `prepare`.
+class PreparedPolygon(object):
+    def __init__(self, polygon):
+        self.feature = polygon
+        geometry = polygon["geometry"] if polygon["type"] == "Feature" \
+            else polygon
+        polys = geometry["coordinates"]
+        # normalize to multipolygon
+        if geometry["type"] == "Polygon":
+            polys = [polys]
+
+        self.polygons = [
+            (PreparedRing(poly[0]), [PreparedRing(hole) for hole in poly[1:]])
+            for poly in polys if poly
+        ]
+
+        Infinity = float("inf")
+        self.bbox = [Infinity, Infinity, -Infinity, -Infinity]
+        for outer, holes in self.polygons:
+            self.bbox = [min(self.bbox[0], outer.bbox[0]),
+                         min(self.bbox[1], outer.bbox[1]),
+                         max(self.bbox[2], outer.bbox[2]),
+                         max(self.bbox[3], outer.bbox[3])]
+
+    def contains(self, point):
+        pt = get_coord(point)
+        x = pt[0]
+        y = pt[1]
+        bbox = self.bbox
+        if x < bbox[0] or x > bbox[2] or y < bbox[1] or y > bbox[3]:
+            return False
+
+        for outer, holes in self.polygons:
+            # check if it is in the outer ring first, then in any of the holes
+            if outer.contains(x, y):
+                for hole in holes:
+                    if hole.contains(x, y):
+                        break
+                else:
+                    return True
+        return False
+
+    def contains_many(self, points):
+        if isinstance(points, dict):
+            points = points["features"]
+        return [self.contains(point) for point in points]
+
+
+# One ring of a prepared polygon: its edges, bucketed into as many equal
+#   height slabs as there are edges. An edge is listed in every slab its
+#   y-range overlaps, so the slab holding a point's y lists every edge the
+#   even-odd rule of `in_ring` could count.
+class PreparedRing(object):
+    def __init__(self, ring):
+        xs = [coord[0] for coord in ring]
+        ys = [coord[1] for coord in ring]
+        self.bbox = [min(xs), min(ys), max(xs), max(ys)]
+
+        edges = []
+        j = len(ring) - 1
+        for i in range(len(ring)):
+            if ys[i] != ys[j]:
+                edges.append((xs[i], ys[i], xs[j], ys[j]))
+            j = i
+
+        self.y_min = self.bbox[1]
+        self.slab_count = max(len(edges), 1)
+        self.slab_height = (self.bbox[3] - self.y_min) / \
+            float(self.slab_count) or 1.0
+        self.slabs = [[] for _ in range(self.slab_count)]
+        for edge in edges:
+            first = self._slab(min(edge[1], edge[3]))
+            last = self._slab(max(edge[1], edge[3]))
+            for slab in range(first, last + 1):
+                self.slabs[slab].append(edge)
+
+    def _slab(self, y):
+        return min(int((y - self.y_min) / self.slab_height),
+                   self.slab_count - 1)
+
+    def contains(self, x, y):
+        bbox = self.bbox
+        if x < bbox[0] or x > bbox[2] or y < bbox[1] or y > bbox[3]:
+            return False
+
+        is_inside = False
+        for xi, yi, xj, yj in self.slabs[self._slab(y)]:
+            if ((yi > y) != (yj > y)) and \
+               (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
+                is_inside = not is_inside
+        return is_inside
@@ -0,0 +1,24 @@
+from packages import distance, inside, instrument
+
+
+def bench(suite, size):
+    a = suite.coord()
+    b = suite.coord()
+    poly = suite.polygon(size)
+    pt = suite.point([0.1, 0.1])
+
+    def distances():
+        for _ in range(1000):
+            distance(a, b, 'kilometers')
+
+    def instrumented(fn):
+        with instrument():
+            fn()
+
+    suite.add('distance#1000', distances)
+    suite.add('distance#1000,instrumented',
+              lambda: instrumented(distances))
+    suite.add('inside', lambda: inside(pt, poly))
+    suite.add('inside#instrumented',
+              lambda: instrumented(lambda: inside(pt, poly)))
+    suite.add('instrument', lambda: instrumented(lambda: None))
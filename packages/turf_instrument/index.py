@@ -0,0 +1,429 @@
+from numbers import Number
+from timeit import default_timer
+import functools
+import importlib
+import inspect
+import json
+import os
+import sys
+
+# the functions instrumented, by the name their events are recorded under
+TARGETS = [
+    ("distance", "turf_distance.index", "distance"),
+    ("distance_many", "turf_distance.index", "distance_many"),
+    ("distance_matrix", "turf_distance.index", "distance_matrix"),
+    ("distance_pairs", "turf_distance.index", "distance_pairs"),
+    ("hex_bin", "turf_hex_grid.index", "hex_bin"),
+    ("hex_grid", "turf_hex_grid.index", "hex_grid"),
+    ("hex_grid_arrays", "turf_hex_grid.index", "hex_grid_arrays"),
+    ("idw", "turf_idw.index", "idw"),
+    ("idw_array", "turf_idw.index", "idw_array"),
+    ("inside", "turf_inside.index", "input"),
+    ("iter_hex_grid", "turf_hex_grid.index", "iter_hex_grid"),
+    ("iter_point_grid", "turf_point_grid.index", "iter_point_grid"),
+    ("iter_square_grid", "turf_square_grid.index", "iter_square_grid"),
+    ("iter_tag", "turf_tag.index", "iter_tag"),
+    ("iter_triangle_grid", "turf_triangle_grid.index", "iter_triangle_grid"),
+    ("iter_within", "turf_within.index", "iter_within"),
+    ("point_grid", "turf_point_grid.index", "point_grid"),
+    ("point_grid_arrays", "turf_point_grid.index", "point_grid_arrays"),
+    ("square_grid", "turf_square_grid.index", "square_grid"),
+    ("square_grid_arrays", "turf_square_grid.index", "square_grid_arrays"),
+    ("tag", "turf_tag.index", "tag"),
+    ("tin", "turf_tin.index", "tin"),
+    ("triangle_grid", "turf_triangle_grid.index", "triangle_grid"),
+    ("triangle_grid_arrays", "turf_triangle_grid.index",
+     "triangle_grid_arrays"),
+    ("within", "turf_within.index", "within")
+]
+
+# the index queries instrumented, by class and method
+INDEX_TARGETS = [
+    ("turf_spatial_index.index", "SpatialIndex", "search_point")
+]
+
+# the types of arguments that are counted at a glance
+_SCALARS = (float, int, bool, str, type(u""), type(None))
+_SEQUENCES = (list, tuple)
+
+# the sinks of the contexts entered and not yet left, and the wrappers in
+# place while there are any
+_sinks = []
+_wrappers = {}
+_methods = []
+# the process that installed the wrappers; processes forked from it, such as
+# the workers of a JoinExecutor, inherit them, but record nothing
+_pid = None
+
+
+class MemorySink(object):
+    """
+    Aggregate events in memory, per function: in ``stats``, each name maps
+        to the number of ``calls`` and of ``errors``, the total and largest
+        wall ``time``, in seconds, and the totals of the counts the events
+        carry: input ``features`` and ``vertices``, ``output`` features, and
+        for index queries, ``candidates``, ``hits`` and ``misses``.
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+    def record(self, event):
+        # type: (dict) -> None
+        """
+        Add an event to the totals of its function
+
+        :type   event:  dict
+        :param  event:  the event
+        """
+        stats = self.stats.get(event["name"])
+        if stats is None:
+            stats = self.stats[event["name"]] = {
+                "calls": 0, "errors": 0, "time": 0.0, "max_time": 0.0,
+                "features": 0, "vertices": 0, "output": 0,
+                "candidates": 0, "hits": 0, "misses": 0
+            }
+
+        stats["calls"] += 1
+        stats["time"] += event["time"]
+        stats["max_time"] = max(stats["max_time"], event["time"])
+        if "error" in event:
+            stats["errors"] += 1
+        for key in ("features", "vertices", "output", "candidates"):
+            if event.get(key) is not None:
+                stats[key] += event[key]
+        if "hit" in event:
+            stats["hits" if event["hit"] else "misses"] += 1
+
+    def report(self):
+        # type: () -> str
+        """
+        The totals, as a table, slowest function first
+
+        :rtype:     str
+        :return:    one line per function
+        """
+        lines = ["{0:<24} {1:>10} {2:>12} {3:>12} {4:>12} {5:>8}".format(
+            "name", "calls", "time (s)", "features", "vertices", "hits")]
+        for name, stats in sorted(self.stats.items(),
+                                  key=lambda item: -item[1]["time"]):
+            queries = stats["hits"] + stats["misses"]
+            lines.append(
+                "{0:<24} {1:>10} {2:>12.6f} {3:>12} {4:>12} {5:>8}".format(
+                    name, stats["calls"], stats["time"], stats["features"],
+                    stats["vertices"],
+                    "{0:.1%}".format(float(stats["hits"]) / queries)
+                    if queries else "-"
+                ))
+        return "\n".join(lines)
+
+
+class JsonLinesSink(object):
+    """
+    Write each event to a file, as one line of JSON.
+
+    :type   fp: IO
+    :param  fp: an open file, in text mode; it is not closed
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+
+    def record(self, event):
+        # type: (dict) -> None
+        """
+        Write an event
+
+        :type   event:  dict
+        :param  event:  the event
+        """
+        self.fp.write(json.dumps(event, sort_keys=True) + "\n")
+
+
+class CallbackSink(object):
+    """
+    Hand each event to a function.
+
+    :type   callback:   FunctionType
+    :param  callback:   a function that takes (event)
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def record(self, event):
+        # type: (dict) -> None
+        """
+        Call the callback with an event
+
+        :type   event:  dict
+        :param  event:  the event
+        """
+        self.callback(event)
+
+
+class Instrumentation(object):
+    """
+    Records an event for each call of the instrumented turf functions, and
+        each query of a spatial index, made while it is entered.
+
+    An event is a dict with the ``name`` of the function and the wall
+    ``time`` of the call, in seconds, with the number of ``features`` and
+    ``vertices`` of its arguments and of ``output`` features, when they
+    can be counted without reading through a stream, and with the ``error``
+    the call raised, if any. Events of spatial index queries carry the
+    number of ``candidates`` found, and whether the query ``hit`` any.
+    Iterators, such as ``iter_tag``, are timed over all their iterations,
+    and recorded when exhausted or closed. Calls the functions make to each
+    other are recorded too, so that the time of ``within`` includes that of
+    the ``inside`` calls it makes. Calls made by worker processes are not
+    recorded.
+
+    Nothing is recorded, and nothing is paid, outside of the context: the
+    functions are only replaced by instrumented wrappers while it is
+    entered, in their modules and in every module that imported them, and
+    are put back when it is left. Contexts can be nested; their sinks all
+    get the events of the calls made while they are entered. The
+    replacement applies to all threads. Entering and leaving the outermost
+    context scan the globals of every loaded module, in a few milliseconds,
+    and each recorded call costs a few microseconds more.
+
+    :type   sinks:  list
+    :param  sinks:  sinks to record events to
+    """
+
+    def __init__(self, sinks):
+        self.sinks = sinks
+
+    def __enter__(self):
+        if not _sinks:
+            _install()
+        _sinks.extend(self.sinks)
+        return self.sinks[0]
+
+    def __exit__(self, *exc_info):
+        for sink in self.sinks:
+            _sinks.remove(sink)
+        if not _sinks:
+            _uninstall()
+
+
+def instrument(*sinks):
+    # type: (*Any) -> Instrumentation
+    """
+    Record where the time of turf calls goes, for the duration of a context.
+
+    :type   sinks:  Any
+    :param  sinks:  sinks to record events to, objects with a ``record``
+                    method, like MemorySink and JsonLinesSink, or functions
+                    that take an event; a MemorySink when omitted
+    :rtype:         Instrumentation
+    :return:        a context manager, which returns the first sink
+
+    @example
+    with instrument() as stats:
+        tagged = tag(points, zones, "name", "zone")
+    print(stats.report())
+    """
+    sinks = [sink if hasattr(sink, "record") else CallbackSink(sink)
+             for sink in sinks] or [MemorySink()]
+    return Instrumentation(sinks)
+
+
+def _install():
+    global _pid
+    _pid = os.getpid()
+    for name, module_name, attribute in TARGETS:
+        module = importlib.import_module("packages." + module_name)
+        original = getattr(module, attribute)
+        _wrappers[id(original)] = (original, _instrumented(name, original))
+
+    for module_name, class_name, method in INDEX_TARGETS:
+        cls = getattr(importlib.import_module("packages." + module_name),
+                      class_name)
+        original = cls.__dict__[method]
+        _methods.append((cls, method, original))
+        setattr(cls, method, _instrumented_query(
+            "{0}.{1}".format(class_name, method), original))
+
+    _rebind(dict((key, wrapper)
+                 for key, (original, wrapper) in _wrappers.items()),
+            dict((key, original)
+                 for key, (original, wrapper) in _wrappers.items()))
+
+
+def _uninstall():
+    _rebind(dict((id(wrapper), original)
+                 for original, wrapper in _wrappers.values()),
+            dict((id(wrapper), wrapper)
+                 for original, wrapper in _wrappers.values()))
+    _wrappers.clear()
+
+    for cls, method, original in _methods:
+        setattr(cls, method, original)
+    del _methods[:]
+
+
+def _rebind(replacements, expected):
+    # replace, in the globals of every module, each value found in
+    # `expected` by identity with its replacement
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if namespace is None:
+            continue
+        for key, value in list(namespace.items()):
+            found = expected.get(id(value))
+            if found is not None and found is value:
+                namespace[key] = replacements[id(value)]
+
+
+def _instrumented(name, function):
+    if inspect.isgeneratorfunction(function):
+        @functools.wraps(function)
+        def iterate(*args, **kwargs):
+            event = _event(name, args)
+            event["output"] = 0
+            elapsed = 0.0
+            iterator = function(*args, **kwargs)
+            try:
+                while True:
+                    start = default_timer()
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        elapsed += default_timer() - start
+                    event["output"] += 1
+                    yield item
+            except Exception as error:
+                event["error"] = type(error).__name__
+                raise
+            finally:
+                event["time"] = elapsed
+                _record(event)
+        return iterate
+
+    @functools.wraps(function)
+    def call(*args, **kwargs):
+        event = _event(name, args)
+        start = default_timer()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as error:
+            event["time"] = default_timer() - start
+            event["error"] = type(error).__name__
+            _record(event)
+            raise
+        event["time"] = default_timer() - start
+        event["output"] = _output(result)
+        _record(event)
+        return result
+    return call
+
+
+def _instrumented_query(name, method):
+    @functools.wraps(method)
+    def query(*args, **kwargs):
+        start = default_timer()
+        result = method(*args, **kwargs)
+        _record({"name": name, "time": default_timer() - start,
+                 "candidates": len(result), "hit": bool(result)})
+        return result
+    return query
+
+
+def _record(event):
+    if os.getpid() != _pid:
+        return
+    for sink in list(_sinks):
+        sink.record(event)
+
+
+def _event(name, args):
+    features = vertices = 0
+    for arg in args:
+        counts = _counts(arg)
+        if counts is None:
+            features = vertices = None
+            break
+        features += counts[0]
+        vertices += counts[1]
+    return {"name": name, "features": features, "vertices": vertices}
+
+
+def _counts(value):
+    # (features, vertices) in an argument, without reading its coordinates;
+    # None for a stream, which cannot be counted without consuming it
+    kind = type(value)
+    if kind in _SCALARS:
+        return 0, 0
+    if kind in _SEQUENCES and len(value) and type(value[0]) in _SCALARS:
+        # a position, or a bbox
+        return 0, 1 if len(value) <= 3 else 0
+    if isinstance(value, dict):
+        if value.get("type") == "FeatureCollection":
+            vertices = 0
+            for feature in value["features"]:
+                vertices += _vertices(feature.get("geometry"))
+            return len(value["features"]), vertices
+        if value.get("type") == "Feature":
+            return 1, _vertices(value["geometry"])
+        return 0, _vertices(value)
+    if hasattr(value, "geometry_offsets"):
+        return len(value), len(value.coords)
+    if hasattr(value, "shape"):
+        # an array of coordinates
+        return 0, len(value)
+    if isinstance(value, (list, tuple)):
+        features = vertices = 0
+        for item in value:
+            counts = _counts(item)
+            if counts is None:
+                return None
+            features += counts[0]
+            vertices += counts[1]
+        return features, vertices
+    if isinstance(value, Number) or not hasattr(value, "__iter__"):
+        return 0, 0
+    return None
+
+
+def _vertices(geometry):
+    if not geometry:
+        return 0
+    kind = geometry.get("type")
+    if kind == "GeometryCollection":
+        return sum(_vertices(member) for member in geometry["geometries"])
+    coords = geometry.get("coordinates")
+    if kind == "Point":
+        return 1
+    if kind in ("MultiPoint", "LineString"):
+        return len(coords)
+    if kind in ("MultiLineString", "Polygon"):
+        return sum(len(ring) for ring in coords)
+    if kind == "MultiPolygon":
+        return sum(len(ring) for polygon in coords for ring in polygon)
+    return 0
+
+
+def _output(result):
+    # the number of features, or rows, of a result; None for scalars
+    if isinstance(result, dict) and "features" in result:
+        return len(result["features"])
+    if isinstance(result, tuple) and len(result) and \
+            hasattr(result[0], "shape"):
+        # the arrays of the columnar variants share their first dimension
+        return len(result[0])
+    if isinstance(result, list) or hasattr(result, "shape"):
+        return len(result)
+    return None
+
+
+__all__ = [
+    "CallbackSink",
+    "Instrumentation",
+    "JsonLinesSink",
+    "MemorySink",
+    "instrument"
+]
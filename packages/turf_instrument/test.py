@@ -0,0 +1,49 @@
+from packages import instrument, within
+from packages.turf_instrument import JsonLinesSink
+from geojson import Feature, FeatureCollection, Point, Polygon
+import json
+import random
+import tempfile
+import unittest
+
+
+class InstrumentTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.points = FeatureCollection([
+            Feature(geometry=Point([rng.uniform(0, 10), rng.uniform(0, 10)]),
+                    properties={})
+            for _ in range(500)
+        ])
+        self.polygons = FeatureCollection([
+            Feature(geometry=Polygon([[[x, y], [x + 2, y], [x + 2, y + 2],
+                                       [x, y + 2], [x, y]]]),
+                    properties={})
+            for x in range(0, 10, 2) for y in range(0, 10, 2)
+        ])
+
+    def test_workers_record_nothing(self):
+        # the workers are forked while the wrappers are installed, and share
+        # the file of the sink
+        with tempfile.TemporaryFile("w+") as fp:
+            with instrument(JsonLinesSink(fp)):
+                result = within(self.points, self.polygons, workers=2)
+            fp.flush()
+            fp.seek(0)
+            events = [json.loads(line) for line in fp]
+
+        self.assertEqual([event["name"] for event in events], ["within"])
+        self.assertEqual(events[0]["output"], len(result["features"]))
+
+    def test_serial_calls_are_recorded(self):
+        with instrument() as stats:
+            within(self.points, self.polygons)
+        self.assertEqual(stats.stats["within"]["calls"], 1)
+        self.assertGreater(stats.stats["inside"]["calls"], 0)
+        self.assertEqual(stats.stats["SpatialIndex.search_point"]["calls"],
+                         len(self.points["features"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
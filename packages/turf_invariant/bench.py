@@ -0,0 +1,7 @@
+from packages.turf_invariant import get_coord
+
+
+def bench(suite, size):
+    points = suite.points(size)['features']
+
+    suite.add('get_coord', lambda: [get_coord(point) for point in points])
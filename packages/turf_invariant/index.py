@@ -1,6 +1,11 @@
 from geojson import GeoJSON, Feature, FeatureCollection
 from numbers import Number
 
+# the types of plain coordinates, checked by identity before the slower
+# isinstance checks against Number
+_SEQUENCES = (list, tuple)
+_NUMBERS = (float, int)
+
 
 def get_coord(obj):
     # type: (Any) -> list[Number]
@@ -13,22 +18,65 @@ def get_coord(obj):
     :rtype:         list[Number]
     :return:        a coordinate
     """
-    if isinstance(obj, list) and isinstance(obj[0], Number) and \
+    if type(obj) in _SEQUENCES and type(obj[0]) in _NUMBERS and \
+       type(obj[1]) in _NUMBERS:
+        return obj
+
+    if isinstance(obj, (list, tuple)) and isinstance(obj[0], Number) and \
        isinstance(obj[1], Number):
         return obj
 
     elif obj:
         if obj["type"] == "Feature" and \
-           "geometry" not in obj and obj["geometry"]["type"] == "Point" and \
-           isinstance(obj.geometry.coordinates, list):
-            return obj.geometry.coordinates
+           "geometry" in obj and obj["geometry"]["type"] == "Point" and \
+           isinstance(obj["geometry"]["coordinates"], (list, tuple)):
+            return obj["geometry"]["coordinates"]
 
-        elif obj["type"] == "Point" and isinstance(obj.coordinates, list):
-            return obj.coordinates
+        elif obj["type"] == "Point" and \
+                isinstance(obj["coordinates"], (list, tuple)):
+            return obj["coordinates"]
 
     raise ValueError("A coordinate, feature, or point geometry is required")
 
 
+def get_coord_array(obj):
+    # type: (Any) -> np.ndarray
+    """
+    Unwrap the coordinates of many points into an (n, 2) float64 array.
+    Requires numpy.
+
+    :type   obj:    Any
+    :param  obj:    a FeatureCollection of points, a MultiPoint, a sequence
+                    of anything get_coord accepts, an array of coordinates,
+                    or a single point or coordinate, as one row
+    :rtype:         np.ndarray
+    :return:        longitudes in the first column, latitudes in the second
+    """
+    import numpy as np
+
+    if isinstance(obj, dict):
+        if obj["type"] == "FeatureCollection":
+            obj = obj["features"]
+        elif obj["type"] == "MultiPoint":
+            obj = obj["coordinates"]
+        else:
+            obj = [obj]
+    elif isinstance(obj, (list, tuple)) and len(obj) and \
+            isinstance(obj[0], Number):
+        obj = [obj]
+
+    if isinstance(obj, np.ndarray):
+        coords = obj.astype(np.float64, copy=False)
+    else:
+        coords = np.array([get_coord(coord)[:2] for coord in obj],
+                          dtype=np.float64)
+
+    if not len(coords):
+        return coords.reshape(0, 2)
+
+    return coords.reshape(len(coords), -1)[:, :2]
+
+
 def assert_geojson_type(value, geojson_type, name):
     # type: (GeoJSON, str, str) -> None
     """
@@ -129,5 +177,6 @@ __all__ = [
     "assert_geojson_type",
     "collection_of",
     "feature_of",
-    "get_coord"
+    "get_coord",
+    "get_coord_array"
 ]
@@ -0,0 +1,8 @@
+from packages import is_simple, kinks
+
+
+def bench(suite, size):
+    poly = suite.polygon(size)
+
+    suite.add('kinks', lambda: kinks(poly))
+    suite.add('is_simple', lambda: is_simple(poly))
@@ -30,35 +30,135 @@
 # //=result
 
 from geojson import Point, FeatureCollection
+from bisect import bisect_left, bisect_right, insort
+import heapq
+import math
 
 def kinks(poly_in):
     results = FeatureCollection([])
-    if poly_in["type"] == 'Feature':
-        poly = poly_in["geometry"]
-    else:
-        poly = poly_in
-
-    for ring1 in poly["coordinates"]:
-        for ring2 in poly["coordinates"]:
-            for i in range(len(ring1) - 1):
-                for k in range(len(ring2) - 1):
-                    # don't check adjacent sides of a given ring,
-                    #  since of course they intersect in a vertex.
-                    if ring1 == ring2 and \
-                       (abs(i - k) == 1 or abs(i - k) == len(ring1) - 2):
-                        continue
-
-                    intersection = line_intersects(
-                        ring1[i][0], ring1[i][1],
-                        ring1[i + 1][0], ring1[i + 1][1],
-                        ring2[k][0], ring2[k][1], ring2[k + 1][0],
-                        ring2[k + 1][1])
-                    if intersection:
-                        results["features"].append(Point((intersection[0],
-                                                          intersection[1])))
+    rings = _rings(poly_in)
+
+    # every intersection is found from both of its segments, and listed in
+    # the order of a ring by ring, segment by segment scan
+    found = []
+    for r1, i, r2, k in _candidate_pairs(rings):
+        for key, (ring1, i1, ring2, i2) in (((r1, r2, i, k), (r1, i, r2, k)),
+                                            ((r2, r1, k, i), (r2, k, r1, i))):
+            intersection = _intersects(rings, ring1, i1, ring2, i2)
+            if intersection:
+                found.append((key, intersection))
+    found.sort(key=lambda item: item[0])
+
+    for _, intersection in found:
+        results["features"].append(Point((intersection[0], intersection[1])))
     return results
 
 
+# Takes a {@link Polygon|polygon} and tells whether it is simple, that is
+#   whether `kinks` would find no self-intersection at all. This stops at the
+#   first intersection found, so it is the cheaper test when the points
+#   themselves are not needed.
+#
+# @name is_simple
+# @param {Feature<Polygon>|Polygon} polygon input polygon
+# @returns {boolean} true if the polygon has no self-intersection
+# @example
+# var valid = turf.is_simple(poly);
+#
+# //=valid
+#
+def is_simple(poly_in):
+    rings = _rings(poly_in)
+    for r1, i, r2, k in _candidate_pairs(rings):
+        if _intersects(rings, r1, i, r2, k) or \
+           _intersects(rings, r2, k, r1, i):
+            return False
+    return True
+
+
+def _rings(poly_in):
+    if poly_in["type"] == 'Feature':
+        return poly_in["geometry"]["coordinates"]
+    return poly_in["coordinates"]
+
+
+def _intersects(rings, r1, i, r2, k):
+    ring1 = rings[r1]
+    ring2 = rings[r2]
+    return line_intersects(
+        ring1[i][0], ring1[i][1], ring1[i + 1][0], ring1[i + 1][1],
+        ring2[k][0], ring2[k][1], ring2[k + 1][0], ring2[k + 1][1])
+
+
+def _candidate_pairs(rings):
+    # Sweeps the segments of all rings by increasing min x, keeping the ones
+    # whose x range is still open, and yields each (ring, segment, ring,
+    # segment) pair once when their bounding boxes overlap: two segments
+    # can only intersect if they do.
+    #
+    # The open segments leave through a heap on their max x. They are kept
+    # ordered by min y, in one list per height class, segments of heights
+    # in [2 ** (e - 1), 2 ** e) in class e, and of height 0 apart, so that a
+    # segment only visits those of each class that start less than the
+    # class height below it, up to its max y. Those that still miss it in y
+    # all overlap each other, so that visiting them costs no more than the
+    # overlapping pairs: the sweep runs in O((n + k) log n), for k pairs of
+    # overlapping bounding boxes.
+    segments = []
+    for r, ring in enumerate(rings):
+        for i in range(len(ring) - 1):
+            x1, y1 = ring[i][0], ring[i][1]
+            x2, y2 = ring[i + 1][0], ring[i + 1][1]
+            segments.append((min(x1, x2), max(x1, x2),
+                             min(y1, y2), max(y1, y2), r, i))
+    segments.sort()
+
+    same_ring = {}
+    # height class: (reach below, (min y, position in segments) of its open
+    # segments, in order)
+    classes = {}
+    closing = []
+    for j, segment in enumerate(segments):
+        min_x, max_x, min_y, max_y, r, i = segment
+        while closing and closing[0][0] < min_x:
+            other = heapq.heappop(closing)[1]
+            active = classes[_height_class(segments[other])][1]
+            del active[bisect_left(active, (segments[other][2], other))]
+
+        for reach, active in classes.values():
+            lo = bisect_left(active, (min_y - reach, -1))
+            hi = bisect_right(active, (max_y, len(segments)))
+            for _, other in active[lo:hi]:
+                other = segments[other]
+                if other[3] < min_y:
+                    continue
+
+                r2, k = other[4], other[5]
+                # don't check adjacent sides of a given ring,
+                #  since of course they intersect in a vertex.
+                if (r, r2) not in same_ring:
+                    same_ring[r, r2] = same_ring[r2, r] = \
+                        rings[r] == rings[r2]
+                if same_ring[r, r2] and \
+                   (abs(i - k) == 1 or abs(i - k) == len(rings[r]) - 2):
+                    continue
+
+                yield r, i, r2, k
+
+        height_class = _height_class(segment)
+        if height_class not in classes:
+            classes[height_class] = (
+                math.ldexp(1, height_class) if height_class is not None
+                else 0, [])
+        insort(classes[height_class][1], (min_y, j))
+        heapq.heappush(closing, (max_x, j))
+
+
+def _height_class(segment):
+    height = segment[3] - segment[2]
+    return math.frexp(height)[1] if height else None
+
+
 # modified from http://jsfiddle.net/justin_c_rounds/Gd2S2/light/
 def line_intersects(line1_start_x, line1_start_y, line1_end_x, line1_end_y,
                     line2_start_x, line2_start_y, line2_end_x, line2_end_y):
@@ -81,8 +181,8 @@ def line_intersects(line1_start_x, line1_start_y, line1_end_x, line1_end_y,
                  ((line2_end_y - line2_start_y) * b)
     numerator2 = ((line1_end_x - line1_start_x) * a) -\
                  ((line1_end_y - line1_start_y) * b)
-    a = numerator1 / denominator
-    b = numerator2 / denominator
+    a = numerator1 / float(denominator)
+    b = numerator2 / float(denominator)
 
     # if we cast these lines infinitely in both directions,
     #   they intersect here:
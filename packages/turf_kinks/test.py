@@ -0,0 +1,78 @@
+from packages import is_simple, kinks
+from packages.turf_kinks.index import line_intersects
+from geojson import Feature, Point, Polygon
+import random
+import unittest
+
+
+def all_pairs(poly):
+    # the scan kinks made before the sweep: every pair of segments, ring by
+    # ring, segment by segment
+    found = []
+    rings = poly["geometry"]["coordinates"]
+    for ring1 in rings:
+        for ring2 in rings:
+            for i in range(len(ring1) - 1):
+                for k in range(len(ring2) - 1):
+                    if ring1 == ring2 and \
+                       (abs(i - k) == 1 or abs(i - k) == len(ring1) - 2):
+                        continue
+                    intersection = line_intersects(
+                        ring1[i][0], ring1[i][1],
+                        ring1[i + 1][0], ring1[i + 1][1],
+                        ring2[k][0], ring2[k][1],
+                        ring2[k + 1][0], ring2[k + 1][1])
+                    if intersection:
+                        found.append(Point(intersection)["coordinates"])
+    return found
+
+
+def comb(teeth, crossed=False):
+    # horizontal teeth off a vertical spine: every segment overlaps every
+    # other in x, but only its neighbours in y
+    ring = [[0.0, 0.0]]
+    for t in range(teeth):
+        ring.append([10.0, 2.0 * t])
+        ring.append([10.0, 2.0 * t + 1])
+        ring.append([1.0, 2.0 * t + 1])
+        ring.append([1.0, 2.0 * t + 2])
+    ring.append([0.0, 2.0 * teeth])
+    if crossed:
+        # back across the teeth, to the start
+        ring[-1] = [5.0, 2.0 * teeth + 1]
+    ring.append(ring[0])
+    return Feature(geometry=Polygon([ring]), properties={})
+
+
+def star(rng, vertices):
+    # a random ring, simple or not, with a hole that may cross it
+    rings = []
+    for radius in (1.0, 0.5):
+        ring = [[rng.uniform(-radius, radius), rng.uniform(-radius, radius)]
+                for _ in range(vertices)]
+        ring.append(ring[0])
+        rings.append(ring)
+    return Feature(geometry=Polygon(rings), properties={})
+
+
+class KinksTest(unittest.TestCase):
+
+    def check(self, poly):
+        expected = all_pairs(poly)
+        found = [point["coordinates"] for point in kinks(poly)["features"]]
+        self.assertEqual(found, expected)
+        self.assertEqual(is_simple(poly), not expected)
+
+    def test_comb(self):
+        self.check(comb(50))
+        self.check(comb(50, crossed=True))
+
+    def test_random(self):
+        rng = random.Random(0)
+        for vertices in (4, 5, 10, 30):
+            for _ in range(10):
+                self.check(star(rng, vertices))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,10 @@
+from packages import line_distance
+
+
+def bench(suite, size):
+    line = suite.line(size)
+    poly = suite.polygon(size)
+
+    suite.add('line_distance', lambda: line_distance(line, 'kilometers'))
+    suite.add('line_distance#polygon',
+              lambda: line_distance(poly, 'kilometers'))
@@ -1,5 +1,5 @@
 from packages import distance
-from geojson import Point
+from packages.turf_meta import iter_geometries, iter_segments
 
 # Takes a {@link LineString} or {@link Polygon} and measures its length
 #   in the specified units.
@@ -31,45 +31,16 @@ from geojson import Point
 #
 # //=length
 def line_distance(line, units):
-    if line["type"] == 'FeatureCollection':
-        return reduce(lambda memo, feature: memo + line_distance(feature, units), line["features"], 0)
-
-    geometry = line["geometry"] if line["type"] == 'Feature' else line
-
-    if geometry["type"] == 'LineString':
-        return length(geometry["coordinates"], units)
-
-    elif geometry["type"] == 'Polygon' or geometry["type"] == 'MultiLineString':
-        d = 0
-        for i in range(len(geometry["coordinates"])):
-            d += length(geometry["coordinates"][i], units)
-        return d
-
-    elif geometry["type"] == 'MultiPolygon':
-        d = 0
-        for i in range(len(geometry["coordinates"])):
-            for j in range(len(geometry["coodinates"][i])):
-                d += length(geometry["coordinates"][i][j], units)
-
-        return d
-
-    else:
-        raise ValueError(
-            'input must be a LineString, MultiLineString, Polygon, '
-            'or MultiPolygon Feature or Geometry (or a FeatureCollection '
-            'containing only those types)')
-
-
-def length(coords, units):
     travelled = 0
-    prev_coords = Point(coords[0])
-    cur_coords = Point(coords[0])
-
-    for i in range(len(coords)):
-        cur_coords.geometry.coordinates = coords[i]
-        travelled += distance(prev_coords, cur_coords, units)
-        temp = prev_coords
-        prev_coords = cur_coords
-        cur_coords = temp
+    for geometry in iter_geometries(line):
+        if geometry["type"] not in ('LineString', 'MultiLineString',
+                                    'Polygon', 'MultiPolygon'):
+            raise ValueError(
+                'input must be a LineString, MultiLineString, Polygon, '
+                'or MultiPolygon Feature or Geometry (or a FeatureCollection '
+                'containing only those types)')
+
+        for start, end in iter_segments(geometry):
+            travelled += distance(start, end, units)
 
     return travelled
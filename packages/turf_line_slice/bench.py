@@ -0,0 +1,10 @@
+from packages import line_slice
+
+
+def bench(suite, size):
+    line = suite.line(size)
+    coords = line['geometry']['coordinates']
+    start = suite.point(coords[len(coords) // 4])
+    stop = suite.point(coords[3 * len(coords) // 4])
+
+    suite.add('line_slice', lambda: line_slice(start, stop, line))
@@ -68,10 +68,10 @@ def line_slice(start_pt, stop_pt, line):
     else:
         ends = [stop_vertex, start_vertex]
 
-    clip_line = LineString((ends[0]["geometry"]["coordinates"],))
-    for i in range(ends[0]["properties"]["index"],
+    clip_coords = [ends[0]["geometry"]["coordinates"]]
+    for i in range(ends[0]["properties"]["index"] + 1,
                    ends[1]["properties"]["index"] + 1):
-        clip_line.geometry.coordinates.push(coords[i])
-    clip_line["geometry"]["coordinates"].append(ends[1]["geometry"]["coordinates"])
+        clip_coords.append(coords[i])
+    clip_coords.append(ends[1]["geometry"]["coordinates"])
 
-    return clip_line
+    return LineString(clip_coords)
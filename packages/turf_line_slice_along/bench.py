@@ -0,0 +1,9 @@
+from packages import line_distance, line_slice_along
+
+
+def bench(suite, size):
+    line = suite.line(size)
+    length = line_distance(line, 'kilometers')
+
+    suite.add('line_slice_along', lambda: line_slice_along(
+        line, length / 4, 3 * length / 4, 'kilometers'))
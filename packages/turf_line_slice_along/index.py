@@ -50,36 +50,41 @@ from geojson import LineString
 def line_slice_along(line, start_dist, stop_dist, units):
     slice = []
     if line["type"] == 'Feature':
-        coords = line.geometry.coordinates
+        coords = line["geometry"]["coordinates"]
     elif line["type"] == 'LineString':
-        coords = line.coordinates
+        coords = line["coordinates"]
     else:
         raise ValueError('input must be a LineString Feature or Geometry')
 
     travelled = 0
     for i in range(len(coords)):
-        if start_dist >= travelled and i == coords.length - 1:
+        if start_dist >= travelled and i == len(coords) - 1:
             break
         elif travelled > start_dist and len(slice) == 0:
             overshot = start_dist - travelled
             if not overshot:
-                return slice.append(coords[i])
+                slice.append(coords[i])
+                return LineString(tuple(slice))
             direction = bearing(coords[i], coords[i - 1]) - 180
             interpolated = destination(coords[i], overshot, direction, units)
-            slice.append(interpolated.geometry.coordinates)
+            slice.append(interpolated["coordinates"])
 
         if travelled >= stop_dist:
             overshot = stop_dist - travelled
             if not overshot:
-                return slice.append(coords[i])
+                slice.append(coords[i])
+                return LineString(tuple(slice))
             direction = bearing(coords[i], coords[i - 1]) - 180
             interpolated = destination(coords[i], overshot, direction, units)
-            slice.append(interpolated.geometry.coordinates)
+            slice.append(interpolated["coordinates"])
             return LineString(tuple(slice))
 
         if travelled >= start_dist:
             slice.append(coords[i])
 
+        if i == len(coords) - 1:
+            return LineString(tuple(slice))
+
         travelled += distance(coords[i], coords[i + 1], units)
 
-    return LineString(coords[coords.length - 1])
+    raise ValueError('start position is beyond the line')
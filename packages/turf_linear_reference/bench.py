@@ -0,0 +1,15 @@
+from packages import linear_reference
+
+
+def bench(suite, size):
+    line = suite.line(size)
+    ref = linear_reference(line)
+    length = ref.length
+    distances = [length * i / 100.0 for i in range(100)]
+    pt = suite.point([0.5, 0.1])
+
+    suite.add('linear_reference', lambda: linear_reference(line))
+    suite.add('point_at', lambda: ref.point_at(length / 2))
+    suite.add('point_at_many#100', lambda: ref.point_at_many(distances))
+    suite.add('slice', lambda: ref.slice(length / 4, 3 * length / 4))
+    suite.add('locate', lambda: ref.locate(pt))
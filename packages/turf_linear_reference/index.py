@@ -0,0 +1,243 @@
+from packages import bearing, destination, distance
+from packages.turf_point_on_line.index import LineSnapper
+from geojson import LineString, Point
+from bisect import bisect_left
+
+
+class LinearReference(object):
+    """
+    Linear referencing over one LineString: positions along the line are
+        found by bisecting the cumulative lengths of its segments, which
+        are measured once, when the reference is built.
+
+    Answers are those of along and line_slice_along, which walk the line
+    and measure it again on every call: ``point_at(d)`` is
+    ``along(line, d, units)`` and ``slice(start, stop)`` is
+    ``line_slice_along(line, start, stop, units)``. Distances before the
+    start of the line are taken to be 0.
+
+    :type   line:   Feature | LineString
+    :param  line:   line to reference positions along
+    :type   units:  str
+    :param  units:  units of every distance along the line, can be degrees,
+                    radians, miles, or kilometers
+    """
+
+    def __init__(self, line, units="kilometers"):
+        if line["type"] == "Feature":
+            coords = line["geometry"]["coordinates"]
+        elif line["type"] == "LineString":
+            coords = line["coordinates"]
+        else:
+            raise ValueError("input must be a LineString Feature or Geometry")
+
+        self.coords = coords
+        self.units = units
+        self._snapper = None
+        # lengths[i] is the distance along the line to coords[i], summed in
+        # the order along sums it
+        self.lengths = [0]
+        for i in range(len(coords) - 1):
+            self.lengths.append(
+                self.lengths[i] + distance(coords[i], coords[i + 1], units)
+            )
+
+    @property
+    def length(self):
+        # type: () -> Number
+        """
+        Length of the line
+
+        :rtype:     Number
+        :return:    the distance along the line to its last position
+        """
+        return self.lengths[-1]
+
+    def point_at(self, distance):
+        # type: (Number) -> Point
+        """
+        The point at a distance along the line, in O(log n)
+
+        :type   distance:   Number
+        :param  distance:   distance along the line; past its end, the last
+                            position of the line is returned
+        :rtype:             Point
+        :return:            the point
+        """
+        return self._point_at(distance, 0)
+
+    def point_at_many(self, distances):
+        # type: (list[Number]) -> list[Point]
+        """
+        The points at many distances along the line, each bisection starting
+            from where the previous one ended
+
+        :type   distances:  list[Number]
+        :param  distances:  distances along the line, in increasing order
+        :rtype:             list[Point]
+        :return:            a point for each distance
+        :raises ValueError: if the distances are not sorted
+        """
+        _check_sorted(distances)
+        points = []
+        lo = 0
+        for d in distances:
+            lo = bisect_left(self.lengths, d, lo)
+            points.append(self._point_at(d, lo))
+        return points
+
+    def slice(self, start, stop):
+        # type: (Number, Number) -> LineString
+        """
+        The part of the line between two distances along it, in
+            O(log n + k) for a part of k positions
+
+        :type   start:  Number
+        :param  start:  distance along the line to start from
+        :type   stop:   Number
+        :param  stop:   distance along the line to stop at; past its end,
+                        the part runs to the last position of the line
+        :rtype:         LineString
+        :return:        the positions of the line in between, after the
+                        interpolated start and up to the interpolated stop
+        :raises ValueError: if ``start`` is not before the end of the line
+        """
+        return LineString(self._slice(max(start, 0), max(stop, 0), 0))
+
+    def slice_many(self, distances):
+        # type: (list[Number]) -> list[LineString]
+        """
+        Cut the line at many distances along it
+
+        :type   distances:  list[Number]
+        :param  distances:  distances along the line, in increasing order
+        :rtype:             list[LineString]
+        :return:            the slice between each distance and the next
+        :raises ValueError: if the distances are not sorted, or one but the
+                            last is not before the end of the line
+        """
+        _check_sorted(distances)
+        slices = []
+        lo = 0
+        for start, stop in zip(distances, distances[1:]):
+            start = max(start, 0)
+            stop = max(stop, 0)
+            lo = bisect_left(self.lengths, start, lo)
+            slices.append(LineString(self._slice(start, stop, lo)))
+        return slices
+
+    def locate(self, point):
+        # type: (Any) -> Number
+        """
+        The distance along the line to the position of the line closest to
+            a point, as point_on_line finds it
+
+        The segments of the line are indexed by a LineSnapper the first
+        time a point is located, so that only those near the point are
+        compared to it.
+
+        :type   point:  Any
+        :param  point:  a coordinate, a Point geometry or a Point Feature
+        :rtype:         Number
+        :return:        distance along the line
+        """
+        if self._snapper is None:
+            self._snapper = LineSnapper(
+                {"type": "LineString", "coordinates": self.coords},
+                self.units
+            )
+
+        _, i, position = self._snapper.closest(point)
+        if position is self.coords[i]:
+            return self.lengths[i]
+        if i + 1 < len(self.coords) and position is self.coords[i + 1]:
+            return self.lengths[i + 1]
+        return self.lengths[i] + distance(self.coords[i], position,
+                                          self.units)
+
+    def locate_many(self, points):
+        # type: (Any) -> list[Number]
+        """
+        The distances along the line to the positions closest to many points
+
+        :type   points: FeatureCollection | list
+        :param  points: points to locate
+        :rtype:         list[Number]
+        :return:        a distance along the line for each point
+        """
+        if isinstance(points, dict):
+            points = points["features"]
+        return [self.locate(point) for point in points]
+
+    def _point_at(self, d, lo):
+        coords = self.coords
+        lengths = self.lengths
+        # the first position at least `d` along the line, as along finds it
+        i = bisect_left(lengths, d, lo)
+        if i >= len(coords) or i == 0:
+            return Point(coords[-1] if i else coords[0])
+
+        overshot = d - lengths[i]
+        if not overshot:
+            return Point(coords[i])
+        direction = bearing(coords[i], coords[i - 1]) - 180
+        return destination(coords[i], overshot, direction, self.units)
+
+    def _slice(self, start, stop, lo):
+        coords = self.coords
+        lengths = self.lengths
+        if start >= lengths[-1]:
+            raise ValueError("start position is beyond the line")
+
+        part = []
+        # nothing happens at the positions before both distances
+        first = bisect_left(lengths, min(start, stop), lo)
+        for i in range(first, len(coords)):
+            travelled = lengths[i]
+            if travelled > start and not part:
+                part.append(self._interpolate(i, start - travelled))
+
+            if travelled >= stop:
+                overshot = stop - travelled
+                if not overshot:
+                    part.append(coords[i])
+                else:
+                    part.append(self._interpolate(i, overshot))
+                return part
+
+            if travelled >= start:
+                part.append(coords[i])
+        return part
+
+    def _interpolate(self, i, overshot):
+        # the position `overshot` (< 0) back from coords[i] towards the start
+        direction = bearing(self.coords[i], self.coords[i - 1]) - 180
+        return destination(self.coords[i], overshot, direction,
+                           self.units)["coordinates"]
+
+
+def linear_reference(line, units="kilometers"):
+    # type: (Any, str) -> LinearReference
+    """
+    Measure a line once, for many queries of positions along it.
+
+    :type   line:   Feature | LineString
+    :param  line:   line to reference positions along
+    :type   units:  str
+    :param  units:  units of every distance along the line
+    :rtype:         LinearReference
+    :return:        the linear reference of the line
+    """
+    return LinearReference(line, units)
+
+
+def _check_sorted(distances):
+    for a, b in zip(distances, distances[1:]):
+        if b < a:
+            raise ValueError("distances must be in increasing order")
+
+
+__all__ = [
+    "LinearReference",
+    "linear_reference"
+]
@@ -0,0 +1,58 @@
+from packages import along, line_slice_along, linear_reference
+from geojson import Feature, LineString
+import random
+import unittest
+
+
+class LinearReferenceTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(0)
+        coords = [[0.0, 0.0]]
+        for _ in range(50):
+            coords.append([coords[-1][0] + rng.uniform(0, 0.1),
+                           coords[-1][1] + rng.uniform(-0.1, 0.1)])
+        self.line = Feature(geometry=LineString(coords), properties={})
+        self.ref = linear_reference(self.line, 'kilometers')
+        length = self.ref.length
+        # random distances, the distances to the vertices, and past the end
+        self.distances = sorted(
+            [rng.uniform(0, length) for _ in range(50)] +
+            self.ref.lengths + [length + 1])
+
+    def test_point_at(self):
+        for d in self.distances:
+            self.assertEqual(self.ref.point_at(d),
+                             along(self.line, d, 'kilometers'))
+        self.assertEqual(self.ref.point_at_many(self.distances),
+                         [along(self.line, d, 'kilometers')
+                          for d in self.distances])
+
+    def test_slice(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            start, stop = sorted(rng.sample(self.distances[:-1], 2))
+            self.assertEqual(
+                self.ref.slice(start, stop),
+                line_slice_along(self.line, start, stop, 'kilometers'))
+
+        # every slice but the last starts before the end of the line
+        cuts = [d for d in self.distances if d < self.ref.length]
+        cuts.append(self.ref.length + 1)
+        self.assertEqual(
+            self.ref.slice_many(cuts),
+            [line_slice_along(self.line, start, stop, 'kilometers')
+             for start, stop in zip(cuts, cuts[1:])])
+
+    def test_slice_beyond_line(self):
+        length = self.ref.length
+        self.assertRaises(ValueError, self.ref.slice, length + 1, length + 2)
+        self.assertRaises(ValueError, line_slice_along, self.line,
+                          length + 1, length + 2, 'kilometers')
+
+    def test_point_at_many_unsorted(self):
+        self.assertRaises(ValueError, self.ref.point_at_many, [2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
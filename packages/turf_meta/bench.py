@@ -0,0 +1,36 @@
+from packages.turf_meta import coord_each, coord_reduce, iter_coords, pack, \
+    read_packed, write_packed
+import os
+import tempfile
+
+
+def bench(suite, size):
+    polygons = suite.polygons(size)
+    packed = pack(polygons)
+    path = os.path.join(tempfile.gettempdir(),
+                        'turf-bench-{0}.bin'.format(size))
+    write_packed(packed, path)
+
+    def sum_each(layer):
+        total = [0]
+
+        def callback(coord):
+            total[0] += coord[0]
+        coord_each(layer, callback)
+        return total[0]
+
+    def sum_iter(layer):
+        total = 0
+        for coord in iter_coords(layer):
+            total += coord[0]
+        return total
+
+    suite.add('coord_each', lambda: sum_each(polygons))
+    suite.add('coord_reduce',
+              lambda: coord_reduce(polygons, lambda memo, coord:
+                                   memo + coord[0], 0, False))
+    suite.add('iter_coords', lambda: sum_iter(polygons))
+    suite.add('iter_coords#packed', lambda: sum_iter(packed))
+    suite.add('pack', lambda: pack(polygons))
+    suite.add('write_packed', lambda: write_packed(packed, path))
+    suite.add('read_packed', lambda: read_packed(path))
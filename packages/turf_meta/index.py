@@ -22,6 +22,10 @@ def coord_each(layer, callback, exclude_wrap_coord=False):
       // coords is equal to [0, 0]
     });
     """
+    if is_packed(layer):
+        layer.coord_each(callback, exclude_wrap_coord)
+        return
+
     is_feature_collection = layer["type"] == 'FeatureCollection'
     is_feature = layer["type"] == 'Feature'
     stop = len(layer["features"]) if is_feature_collection else 1
@@ -108,14 +112,10 @@ def coord_reduce(layer, callback, memo, exclude_wrap_coord):
     :rtype:                     *
     :return:                    combined value
     """
-    local_vars = {"memo": memo}
-
-    def callback_wrapper(coord):
-        local_vars["memo"] = callback(local_vars["memo"], coord)
+    for coord in iter_coords(layer, exclude_wrap_coord):
+        memo = callback(memo, coord)
 
-    coord_each(layer, callback_wrapper, exclude_wrap_coord)
-
-    return local_vars["memo"]
+    return memo
 
 
 def prop_each(layer, callback):
@@ -174,14 +174,10 @@ def prop_reduce(layer, callback, memo):
       }, {})
     }
     """
-    local_vars = {"memo": memo}
-
-    def callback_wrapper(prop):
-        local_vars["memo"] = callback(local_vars["memo"], prop)
+    for prop in iter_props(layer):
+        memo = callback(memo, prop)
 
-    prop_each(layer, callback_wrapper)
-
-    return local_vars["memo"]
+    return memo
 
 
 def feature_each(layer, callback):
@@ -219,6 +215,9 @@ def coord_all(layer):
     :rtype:         list[list[Number]]
     :return:        coordinate position array
     """
+    if is_packed(layer):
+        return layer.positions()
+
     coords = []
 
     coord_each(layer, lambda coord: coords.append(coord))
@@ -226,7 +225,414 @@ def coord_all(layer):
     return coords
 
 
+def iter_features(layer):
+    # type: (GeoJSON) -> Iterator[Feature]
+    """
+    Iterate over features in any GeoJSON object or stream of features
+
+    :type   layer:  GeoJSON
+    :param  layer:  any GeoJSON object, or an iterable of features
+    :rtype:         Iterator[Feature]
+    :return:        a generator of features
+
+    @example
+    for feature in iter_features(collection):
+        if feature["properties"]["name"] == "needle":
+            break
+    """
+    if is_packed(layer):
+        for feature in layer.iter_features():
+            yield feature
+
+    elif is_stream(layer):
+        for feature in layer:
+            yield feature
+
+    elif layer["type"] == 'Feature':
+        yield layer
+
+    elif layer["type"] == 'FeatureCollection':
+        for feature in layer["features"]:
+            yield feature
+
+
+def iter_props(layer):
+    # type: (GeoJSON) -> Iterator[dict]
+    """
+    Iterate over property objects in any GeoJSON object
+
+    :type   layer:  GeoJSON
+    :param  layer:  any GeoJSON object
+    :rtype:         Iterator[dict]
+    :return:        a generator of property objects
+    """
+    if is_packed(layer):
+        for feature in layer.features:
+            yield feature["properties"]
+
+    elif is_stream(layer):
+        for feature in layer:
+            yield feature["properties"]
+
+    elif layer["type"] == 'FeatureCollection':
+        for feature in layer["features"]:
+            yield feature["properties"]
+
+    elif layer["type"] == 'Feature':
+        yield layer["properties"]
+
+
+def iter_geometries(layer, indices=False):
+    # type: (GeoJSON, bool) -> Iterator[Geometry]
+    """
+    Iterate over the geometries in any GeoJSON object.
+    Members of GeometryCollections are yielded one by one,
+        null geometries are skipped.
+
+    :type   layer:      GeoJSON
+    :param  layer:      any GeoJSON object
+    :type   indices:    bool
+    :param  indices:    whether to yield ``(geometry, feature_index)`` pairs
+    :rtype:             Iterator[Geometry]
+    :return:            a generator of geometries
+    """
+    if is_packed(layer):
+        for item in layer.iter_geometries(indices):
+            yield item
+        return
+
+    if is_stream(layer) or layer["type"] == 'FeatureCollection':
+        geometries = (feature["geometry"]
+                      for feature in iter_features(layer))
+    elif layer["type"] == 'Feature':
+        geometries = [layer["geometry"]]
+    else:
+        geometries = [layer]
+
+    for i, geometry in enumerate(geometries):
+        if geometry is None:
+            continue
+
+        if geometry["type"] == "GeometryCollection":
+            for member in geometry["geometries"]:
+                for nested in iter_geometries(member):
+                    yield (nested, i) if indices else nested
+        else:
+            yield (geometry, i) if indices else geometry
+
+
+def iter_rings(layer, indices=False):
+    # type: (GeoJSON, bool) -> Iterator[list[list[Number]]]
+    """
+    Iterate over the coordinate sequences of any GeoJSON object:
+        the LinearRings of polygons, each line of a (Multi)LineString,
+        and every point of a (Multi)Point as a sequence of one position.
+
+    Metadata is ``(feature_index, part_index, ring_index)``, where parts are
+        the members of a Multi* geometry (counted across the whole feature)
+        and rings are the rings of one polygon.
+
+    :type   layer:      GeoJSON
+    :param  layer:      any GeoJSON object
+    :type   indices:    bool
+    :param  indices:    whether to yield ``(ring, metadata)`` pairs
+    :rtype:             Iterator[list[list[Number]]]
+    :return:            a generator of coordinate sequences
+    """
+    for ring, closed, index in _iter_rings(layer):
+        yield (ring, index) if indices else ring
+
+
+def iter_coords(layer, exclude_wrap_coord=False, indices=False):
+    # type: (GeoJSON, bool, bool) -> Iterator[list[Number]]
+    """
+    Iterate over coordinates in any GeoJSON object.
+    Unlike coord_each this needs no callback, and stopping early
+        is just a matter of leaving the loop.
+
+    :type   layer:              GeoJSON
+    :param  layer:              any GeoJSON object
+    :type   exclude_wrap_coord: bool
+    :param  exclude_wrap_coord: whether or not to include the final coordinate
+                                of LinearRings that wraps the ring in
+                                its iteration
+    :type   indices:            bool
+    :param  indices:            whether to yield ``(coord, metadata)`` pairs,
+                                see iter_rings for the metadata
+    :rtype:                     Iterator[list[Number]]
+    :return:                    a generator of positions
+
+    @example
+    for coord in iter_coords(polygon, True):
+        if coord[0] > 180:
+            break
+    """
+    for ring, closed, index in _iter_rings(layer):
+        if exclude_wrap_coord and closed:
+            ring = ring[:-1]
+
+        if indices:
+            for coord in ring:
+                yield coord, index
+        else:
+            for coord in ring:
+                yield coord
+
+
+def iter_segments(layer, indices=False):
+    # type: (GeoJSON, bool) -> Iterator[tuple]
+    """
+    Iterate over the line segments of any GeoJSON object
+        as ``(start, end)`` pairs of positions.
+    Points have no segments.
+
+    :type   layer:      GeoJSON
+    :param  layer:      any GeoJSON object
+    :type   indices:    bool
+    :param  indices:    whether to yield ``((start, end), metadata)`` pairs,
+                        see iter_rings for the metadata
+    :rtype:             Iterator[tuple]
+    :return:            a generator of segments
+    """
+    for ring, closed, index in _iter_rings(layer):
+        for k in range(1, len(ring)):
+            if indices:
+                yield (ring[k - 1], ring[k]), index
+            else:
+                yield ring[k - 1], ring[k]
+
+
+def _iter_rings(layer):
+    # yields (ring, closed, (feature_index, part_index, ring_index)),
+    # with closed set for the LinearRings of polygons
+    if is_packed(layer):
+        for item in layer.iter_rings():
+            yield item
+        return
+
+    part = 0
+    last = None
+    for geometry, i in iter_geometries(layer, True):
+        if i != last:
+            part = 0
+            last = i
+
+        geometry_type = geometry["type"]
+        coords = geometry["coordinates"]
+
+        if geometry_type == "Point":
+            yield [coords] if len(coords) else [], False, (i, part, 0)
+            part += 1
+
+        elif geometry_type == "MultiPoint":
+            for coord in coords:
+                yield [coord], False, (i, part, 0)
+                part += 1
+
+        elif geometry_type == "LineString":
+            yield coords, False, (i, part, 0)
+            part += 1
+
+        elif geometry_type == "MultiLineString":
+            for line in coords:
+                yield line, False, (i, part, 0)
+                part += 1
+
+        elif geometry_type == "Polygon":
+            for k, ring in enumerate(coords):
+                yield ring, True, (i, part, k)
+            part += 1
+
+        elif geometry_type == "MultiPolygon":
+            for polygon in coords:
+                for k, ring in enumerate(polygon):
+                    yield ring, True, (i, part, k)
+                part += 1
+
+        else:
+            raise ValueError("Unknown Geometry Type")
+
+
+def pack(layer):
+    # type: (GeoJSON) -> PackedCollection
+    """
+    Copy the coordinates of any GeoJSON object into a PackedCollection:
+        one flat float64 buffer plus offset arrays describing the nesting.
+    Requires numpy.
+
+    Packed collections are accepted by coord_each, coord_reduce and coord_all
+        and by the modules built on them.
+
+    :type   layer:  GeoJSON
+    :param  layer:  any GeoJSON object
+    :rtype:         PackedCollection
+    :return:        packed representation of ``layer``
+    """
+    from packed import PackedCollection
+
+    return PackedCollection.from_geojson(layer)
+
+
+def unpack(packed):
+    # type: (PackedCollection) -> GeoJSON
+    """
+    Convert a PackedCollection back into the GeoJSON object it was packed from
+
+    :type   packed: PackedCollection
+    :param  packed: a packed collection
+    :rtype:         GeoJSON
+    :return:        a FeatureCollection, a Feature or a geometry
+    """
+    return packed.to_geojson()
+
+
+def write_packed(layer, path, node_size=16):
+    # type: (GeoJSON, str, int) -> None
+    """
+    Write any GeoJSON object, or a PackedCollection, to a binary file
+        holding its packed coordinates, a table of feature bounding boxes
+        and a spatial index over them. Requires numpy.
+
+    :type   layer:      GeoJSON
+    :param  layer:      any GeoJSON object or a PackedCollection
+    :type   path:       str
+    :param  path:       file to create or overwrite
+    :type   node_size:  int
+    :param  node_size:  node size of the spatial index
+    """
+    from packfile import write_packed as write
+
+    write(layer, path, node_size)
+
+
+def read_packed(path):
+    # type: (str) -> MappedCollection
+    """
+    Memory-map a file written by write_packed. Arrays are views of the
+        file rather than copies, so opening is nearly free whatever its size.
+
+    The result is a PackedCollection, accepted wherever those are; the
+        spatial joins and inside also use its stored index.
+
+    :type   path:   str
+    :param  path:   file written by write_packed
+    :rtype:         MappedCollection
+    :return:        the mapped collection
+    """
+    from packfile import read_packed as read
+
+    return read(path)
+
+
+def is_packed(layer):
+    # type: (Any) -> bool
+    """
+    Tell a PackedCollection from a GeoJSON object or a stream of features.
+
+    :type   layer:  Any
+    :param  layer:  a GeoJSON object, a PackedCollection or a stream
+    :rtype:         bool
+    :return:        whether ``layer`` is packed
+    """
+    return not isinstance(layer, dict) and hasattr(layer, "geometry_offsets")
+
+
+def is_stream(layer):
+    # type: (Any) -> bool
+    """
+    Tell a stream of features from a GeoJSON object or a PackedCollection.
+    Any iterable of features that is neither, like a list or the generator
+        returned by read_features, is a stream: the iter_* functions go
+        through it once, without holding on to the features.
+
+    :type   layer:  Any
+    :param  layer:  a GeoJSON object, a PackedCollection or a stream
+    :rtype:         bool
+    :return:        whether ``layer`` is a stream of features
+    """
+    return not isinstance(layer, dict) and \
+        not hasattr(layer, "geometry_offsets")
+
+
+def copy_feature(feature, geometry=None):
+    # type: (Feature, Geometry) -> dict
+    """
+    Copy a Feature for an output that sets its properties or replaces its
+        geometry, without copying what is left untouched.
+    The feature and its properties dict are new, so that setting a property
+        of the copy leaves ``feature`` as it is; the geometry and the
+        property values are shared with ``feature``.
+    A replaced geometry drops the ``bbox`` member of the copy, which
+        belongs to the old one.
+
+    :type   feature:    Feature
+    :param  feature:    feature to copy
+    :type   geometry:   Geometry
+    :param  geometry:   geometry of the copy, in place of the shared one
+    :rtype:             dict
+    :return:            a shallow copy of ``feature``
+    """
+    copy = dict(feature)
+    copy["properties"] = dict(feature["properties"] or {})
+    if geometry is not None:
+        copy["geometry"] = geometry
+        copy.pop("bbox", None)
+    return copy
+
+
+def feature_table(layer):
+    # type: (Any) -> Sequence[dict]
+    """
+    Random access to the features of a collection, for a join that reads
+        the same features many times.
+    The features of a GeoJSON collection are returned as they are; those of
+        a PackedCollection are decoded on first access only, and kept for
+        as long as the table is.
+
+    :type   layer:  FeatureCollection | PackedCollection
+    :param  layer:  the features to look up
+    :rtype:         Sequence[dict]
+    :return:        the features, by position
+    """
+    if is_packed(layer):
+        return _DecodedFeatures(layer)
+    return layer["features"]
+
+
+class _DecodedFeatures(object):
+    # the features of a packed collection, each decoded once
+
+    def __init__(self, packed):
+        self.packed = packed
+        self.decoded = {}
+
+    def __len__(self):
+        return len(self.packed)
+
+    def __getitem__(self, index):
+        feature = self.decoded.get(index)
+        if feature is None:
+            feature = self.decoded[index] = self.packed.feature(index)
+        return feature
+
+
 __all__ = [
+    "coord_all",
     "coord_each",
-    "feature_each"
+    "coord_reduce",
+    "copy_feature",
+    "feature_each",
+    "feature_table",
+    "is_packed",
+    "is_stream",
+    "iter_coords",
+    "iter_features",
+    "iter_geometries",
+    "iter_props",
+    "iter_rings",
+    "iter_segments",
+    "pack",
+    "read_packed",
+    "unpack",
+    "write_packed"
 ]
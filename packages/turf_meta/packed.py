@@ -0,0 +1,537 @@
+import copy
+import numpy as np
+
+
+GEOMETRY_TYPES = (
+    "Point",
+    "MultiPoint",
+    "LineString",
+    "MultiLineString",
+    "Polygon",
+    "MultiPolygon"
+)
+POINT, MULTI_POINT, LINE_STRING, MULTI_LINE_STRING, POLYGON, MULTI_POLYGON = \
+    range(len(GEOMETRY_TYPES))
+
+
+class PackedCollection(object):
+    """
+    Array-backed storage for the coordinates of a whole FeatureCollection.
+
+    Every position lives in one contiguous float64 buffer, ``coords``, of shape
+    ``(n, dims)``. Nesting is described by four offset arrays, each of which
+    indexes into the next level down::
+
+        feature_offsets[f]:     first geometry of feature f
+        geometry_offsets[g]:    first part of geometry g
+        part_offsets[p]:        first ring of part p
+        ring_offsets[r]:        first coordinate of ring r
+
+    Parts are the members of Multi* geometries and rings are the rings of a
+    polygon; points and lines have exactly one ring per part. A
+    GeometryCollection contributes one geometry per member, a null geometry
+    contributes none. Everything that is not a coordinate (properties, ids,
+    foreign members) is kept aside so that ``to_geojson`` is lossless.
+
+    Positions with fewer dimensions than the widest one in the collection
+    are padded with NaN, which is stripped again on the way out.
+
+    ``index``, the SpatialIndex of the feature bounding boxes, is built the
+    first time it is used, and kept: ``flip(inplace=True)`` drops it, but
+    other changes made to ``coords`` in place leave it stale.
+    """
+
+    def __init__(self, coords, ring_offsets, part_offsets, geometry_offsets,
+                 geometry_types, feature_offsets, collections, features,
+                 geometry_members=None, root="FeatureCollection",
+                 members=None):
+        self.coords = coords
+        self.ring_offsets = ring_offsets
+        self.part_offsets = part_offsets
+        self.geometry_offsets = geometry_offsets
+        self.geometry_types = geometry_types
+        self.feature_offsets = feature_offsets
+        self.collections = collections
+        self.features = features
+        self.geometry_members = geometry_members
+        self.root = root
+        self.members = members
+        self._index = None
+
+    @classmethod
+    def from_geojson(cls, layer):
+        # type: (GeoJSON) -> PackedCollection
+        """
+        Pack a FeatureCollection, a Feature or a bare geometry
+
+        :type   layer:      GeoJSON
+        :param  layer:      any GeoJSON object
+        :rtype:             PackedCollection
+        :return:            packed copy of the coordinates of ``layer``
+        :raises ValueError: on unknown or nested collection geometry types
+        """
+        if layer["type"] == "FeatureCollection":
+            root = "FeatureCollection"
+            features = layer["features"]
+            members = dict((key, value) for key, value in layer.items()
+                           if key not in ("type", "features"))
+        elif layer["type"] == "Feature":
+            root = "Feature"
+            features = [layer]
+            members = None
+        else:
+            root = "Geometry"
+            features = [{"geometry": layer}]
+            members = None
+
+        positions = []
+        ring_offsets = [0]
+        part_offsets = [0]
+        geometry_offsets = [0]
+        geometry_types = []
+        geometry_members = []
+        feature_offsets = [0]
+        collections = []
+        metas = []
+
+        def add_ring(ring):
+            positions.extend(ring)
+            ring_offsets.append(len(positions))
+
+        def add_geometry(geometry):
+            geometry_type = geometry["type"]
+            if geometry_type not in GEOMETRY_TYPES:
+                raise ValueError("Unknown Geometry Type")
+
+            coords = geometry["coordinates"]
+            if geometry_type == "Point":
+                add_ring([coords] if len(coords) else [])
+                part_offsets.append(len(ring_offsets) - 1)
+            elif geometry_type == "MultiPoint":
+                for coord in coords:
+                    add_ring([coord])
+                    part_offsets.append(len(ring_offsets) - 1)
+            elif geometry_type == "LineString":
+                add_ring(coords)
+                part_offsets.append(len(ring_offsets) - 1)
+            elif geometry_type in ("MultiLineString", "Polygon"):
+                parts = [[line] for line in coords] \
+                    if geometry_type == "MultiLineString" else [coords]
+                for part in parts:
+                    for ring in part:
+                        add_ring(ring)
+                    part_offsets.append(len(ring_offsets) - 1)
+            else:
+                for polygon in coords:
+                    for ring in polygon:
+                        add_ring(ring)
+                    part_offsets.append(len(ring_offsets) - 1)
+
+            geometry_offsets.append(len(part_offsets) - 1)
+            geometry_types.append(GEOMETRY_TYPES.index(geometry_type))
+            extra = dict((key, value) for key, value in geometry.items()
+                         if key not in ("type", "coordinates"))
+            geometry_members.append(extra or None)
+
+        for feature in features:
+            geometry = feature["geometry"]
+            is_collection = geometry is not None and \
+                geometry["type"] == "GeometryCollection"
+
+            if is_collection:
+                for member in geometry["geometries"]:
+                    if member["type"] == "GeometryCollection":
+                        raise ValueError(
+                            "Nested GeometryCollections cannot be packed")
+                    add_geometry(member)
+            elif geometry is not None:
+                add_geometry(geometry)
+
+            feature_offsets.append(len(geometry_types))
+            collections.append(
+                dict((key, value) for key, value in geometry.items()
+                     if key not in ("type", "geometries"))
+                if is_collection else None
+            )
+            if root == "Geometry":
+                metas.append(None)
+            else:
+                meta = copy.copy(feature)
+                del meta["geometry"]
+                metas.append(meta)
+
+        lengths = set(len(position) for position in positions) or set([2])
+        dims = max(lengths)
+        if len(lengths) == 1:
+            coords = np.array(positions, dtype=np.float64) \
+                .reshape(len(positions), dims)
+        else:
+            coords = np.full((len(positions), dims), np.nan, dtype=np.float64)
+            for k, position in enumerate(positions):
+                coords[k, :len(position)] = position
+
+        return cls(
+            coords,
+            np.array(ring_offsets, dtype=np.int64),
+            np.array(part_offsets, dtype=np.int64),
+            np.array(geometry_offsets, dtype=np.int64),
+            np.array(geometry_types, dtype=np.int8),
+            np.array(feature_offsets, dtype=np.int64),
+            collections,
+            metas,
+            geometry_members if any(geometry_members) else None,
+            root,
+            members
+        )
+
+    def __len__(self):
+        return len(self.feature_offsets) - 1
+
+    def __getitem__(self, key):
+        # enough of the FeatureCollection interface for code that indexes
+        # features one by one: packed["features"][i] decodes feature i
+        if key == "type":
+            return self.root
+        if key == "features":
+            return _FeatureSequence(self)
+        raise KeyError(key)
+
+    @property
+    def index(self):
+        # type: () -> SpatialIndex
+        """
+        SpatialIndex over the bounding boxes of the features, which
+            spatial_index() and the spatial joins use
+
+        :rtype:     SpatialIndex
+        :return:    the index, built on first use
+        """
+        if self._index is None:
+            from packages.turf_spatial_index import SpatialIndex
+            from packfile import feature_bboxes
+
+            self._index = SpatialIndex.from_boxes(
+                feature_bboxes(self).tolist())
+            self._index.features = self["features"]
+        return self._index
+
+    def ring_types(self):
+        # type: () -> np.ndarray
+        """
+        Geometry type code of the geometry each ring belongs to
+
+        :rtype:     np.ndarray
+        :return:    one ``GEOMETRY_TYPES`` index per ring
+        """
+        part_geometry, ring_part = self._parents()
+        return self.geometry_types[part_geometry[ring_part]]
+
+    def wrap_mask(self):
+        # type: () -> np.ndarray
+        """
+        Flag the coordinates that close a LinearRing of a polygon
+
+        :rtype:     np.ndarray
+        :return:    boolean mask over ``coords``
+        """
+        mask = np.zeros(len(self.coords), dtype=bool)
+        ends = self.ring_offsets[1:]
+        closed = np.in1d(self.ring_types(), (POLYGON, MULTI_POLYGON)) & \
+            (ends > self.ring_offsets[:-1])
+        mask[ends[closed] - 1] = True
+        return mask
+
+    def coord_array(self, exclude_wrap_coord=False):
+        # type: (bool) -> np.ndarray
+        """
+        All coordinates as a ``(n, dims)`` array
+
+        :type   exclude_wrap_coord: bool
+        :param  exclude_wrap_coord: whether or not to include the final
+                                    coordinate of LinearRings that wraps
+                                    the ring
+        :rtype:                     np.ndarray
+        :return:                    a view of ``coords``, or a copy when
+                                    wrapping coordinates are excluded
+        """
+        if exclude_wrap_coord:
+            return self.coords[~self.wrap_mask()]
+        return self.coords
+
+    def positions(self, exclude_wrap_coord=False):
+        # type: (bool) -> list[list[Number]]
+        """
+        All coordinates as GeoJSON positions
+
+        :type   exclude_wrap_coord: bool
+        :param  exclude_wrap_coord: whether or not to include the final
+                                    coordinate of LinearRings that wraps
+                                    the ring
+        :rtype:                     list[list[Number]]
+        :return:                    coordinate position array
+        """
+        return self._to_positions(self.coord_array(exclude_wrap_coord))
+
+    def coord_each(self, callback, exclude_wrap_coord=False):
+        # type: (FunctionType, bool) -> None
+        """
+        Call ``callback`` with every position, in GeoJSON order.
+
+        Positions are handed out as fresh lists: changes to them are not
+        written back, modify ``coords`` for that instead.
+
+        :type   callback:           FunctionType
+        :param  callback:           a method that takes (value)
+        :type   exclude_wrap_coord: bool
+        :param  exclude_wrap_coord: whether or not to include the final
+                                    coordinate of LinearRings that wraps
+                                    the ring in its iteration
+        """
+        for coord in self.positions(exclude_wrap_coord):
+            callback(coord)
+
+    def bbox(self):
+        # type: () -> list[Number]
+        """
+        Extent of all coordinates in [minX, minY, maxX, maxY] order
+
+        :rtype:     list[Number]
+        :return:    bbox extent
+        """
+        if not len(self.coords):
+            infinity = float("inf")
+            return [infinity, infinity, -infinity, -infinity]
+
+        xy = self.coords[:, :2]
+        return xy.min(axis=0).tolist() + xy.max(axis=0).tolist()
+
+    def flip(self, inplace=False):
+        # type: (bool) -> PackedCollection
+        """
+        Copy of the collection with every position flipped
+            from [x, y] to [y, x]
+
+        :type   inplace:    bool
+        :param  inplace:    flip the positions of this collection instead
+        :rtype:             PackedCollection
+        :return:            flipped collection sharing offsets and
+                            properties, or this one flipped in place
+        """
+        if inplace:
+            self.coords[:, [0, 1]] = self.coords[:, [1, 0]]
+            self._index = None
+            return self
+
+        coords = self.coords.copy()
+        coords[:, [0, 1]] = coords[:, [1, 0]]
+        return PackedCollection(
+            coords, self.ring_offsets, self.part_offsets,
+            self.geometry_offsets, self.geometry_types, self.feature_offsets,
+            self.collections, self.features, self.geometry_members,
+            self.root, self.members
+        )
+
+    def iter_rings(self):
+        # type: () -> Iterator[tuple]
+        """
+        Yield every ring as ``(positions, closed, (feature_index, part_index,
+            ring_index))``, where ``closed`` marks the LinearRings of polygons
+            and part and ring indices count from zero within each feature
+            and part respectively.
+
+        :rtype:     Iterator[tuple]
+        :return:    rings in GeoJSON order
+        """
+        positions = self.positions()
+        part_geometry, ring_part = self._parents()
+        ring_feature = np.repeat(np.arange(len(self)),
+                                 np.diff(self.feature_offsets))[
+            part_geometry[ring_part]]
+        first_part = self.geometry_offsets[self.feature_offsets[:-1]]
+
+        ring_offsets = self.ring_offsets.tolist()
+        closed = np.in1d(self.geometry_types[part_geometry[ring_part]],
+                         (POLYGON, MULTI_POLYGON)).tolist()
+        features = ring_feature.tolist()
+        parts = (ring_part - first_part[ring_feature]).tolist()
+        rings = (np.arange(len(ring_part)) -
+                 self.part_offsets[ring_part]).tolist()
+
+        for r in range(len(ring_offsets) - 1):
+            yield (positions[ring_offsets[r]:ring_offsets[r + 1]], closed[r],
+                   (features[r], parts[r], rings[r]))
+
+    def iter_geometries(self, indices=False):
+        # type: (bool) -> Iterator[dict]
+        """
+        Yield every geometry, unpacking the members of GeometryCollections
+
+        :type   indices:    bool
+        :param  indices:    whether to yield ``(geometry, feature_index)``
+        :rtype:             Iterator[dict]
+        :return:            geometries in GeoJSON order
+        """
+        geometry = self._geometry_decoder()
+        feature_offsets = self.feature_offsets.tolist()
+
+        for f in range(len(self)):
+            for g in range(feature_offsets[f], feature_offsets[f + 1]):
+                yield (geometry(g), f) if indices else geometry(g)
+
+    def iter_features(self):
+        # type: () -> Iterator[dict]
+        """
+        Yield every feature, unpacked one at a time
+
+        :rtype:     Iterator[dict]
+        :return:    features in GeoJSON order
+        """
+        geometry = self._geometry_decoder()
+        feature_offsets = self.feature_offsets.tolist()
+
+        for f in range(len(self)):
+            yield self._feature(f, geometry, feature_offsets)
+
+    def feature(self, index):
+        # type: (int) -> dict
+        """
+        Unpack a single feature, touching only its own coordinates
+
+        :type   index:  int
+        :param  index:  position of the feature in the collection
+        :rtype:         dict
+        :return:        the feature
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError("feature index out of range")
+        return self._feature(index % len(self),
+                             self._geometry_decoder(single=True),
+                             self.feature_offsets)
+
+    def _feature(self, f, geometry, feature_offsets):
+        geometries = [geometry(g) for g in
+                      range(feature_offsets[f], feature_offsets[f + 1])]
+        if self.collections[f] is not None:
+            value = {"type": "GeometryCollection",
+                     "geometries": geometries}
+            value.update(self.collections[f])
+        else:
+            value = geometries[0] if geometries else None
+
+        meta = self.features[f]
+        if meta is None:
+            feature = {"type": "Feature", "properties": {}}
+        else:
+            feature = copy.copy(meta)
+        feature["geometry"] = value
+        return feature
+
+    def to_geojson(self):
+        # type: () -> GeoJSON
+        """
+        Unpack back into the GeoJSON object this collection was built from
+
+        :rtype:     GeoJSON
+        :return:    a FeatureCollection, a Feature or a geometry
+        """
+        features = list(self.iter_features())
+
+        if self.root == "Geometry":
+            return features[0]["geometry"]
+
+        if self.root == "Feature":
+            return features[0]
+
+        collection = {"type": "FeatureCollection", "features": features}
+        collection.update(self.members)
+        return collection
+
+    def _parents(self):
+        part_geometry = np.repeat(np.arange(len(self.geometry_types)),
+                                  np.diff(self.geometry_offsets))
+        ring_part = np.repeat(np.arange(len(part_geometry)),
+                              np.diff(self.part_offsets))
+        return part_geometry, ring_part
+
+    def _geometry_decoder(self, single=False):
+        # decoding everything converts all arrays to lists up front, a
+        # single feature is read straight from the arrays instead
+        if single:
+            ring_offsets = self.ring_offsets
+            part_offsets = self.part_offsets
+            geometry_offsets = self.geometry_offsets
+            geometry_types = self.geometry_types
+
+            def ring(r):
+                return self._to_positions(
+                    self.coords[ring_offsets[r]:ring_offsets[r + 1]])
+        else:
+            positions = self.positions()
+            ring_offsets = self.ring_offsets.tolist()
+            part_offsets = self.part_offsets.tolist()
+            geometry_offsets = self.geometry_offsets.tolist()
+            geometry_types = self.geometry_types.tolist()
+
+            def ring(r):
+                return positions[ring_offsets[r]:ring_offsets[r + 1]]
+
+        def rings(p):
+            return [ring(r) for r in
+                    range(part_offsets[p], part_offsets[p + 1])]
+
+        def geometry(g):
+            geometry_type = int(geometry_types[g])
+            parts = range(geometry_offsets[g], geometry_offsets[g + 1])
+
+            if geometry_type == POINT:
+                coords = ring(part_offsets[parts[0]])
+                coords = coords[0] if coords else []
+            elif geometry_type == MULTI_POINT:
+                coords = [ring(part_offsets[p])[0] for p in parts]
+            elif geometry_type == LINE_STRING:
+                coords = ring(part_offsets[parts[0]])
+            elif geometry_type == MULTI_LINE_STRING:
+                coords = [ring(part_offsets[p]) for p in parts]
+            elif geometry_type == POLYGON:
+                coords = rings(parts[0])
+            else:
+                coords = [rings(p) for p in parts]
+
+            result = {"type": GEOMETRY_TYPES[geometry_type],
+                      "coordinates": coords}
+            if self.geometry_members and self.geometry_members[g]:
+                result.update(self.geometry_members[g])
+            return result
+
+        return geometry
+
+    @staticmethod
+    def _to_positions(coords):
+        positions = coords.tolist()
+        if coords.shape[1] > 2 and np.isnan(coords).any():
+            positions = [[value for value in position if value == value]
+                         for position in positions]
+        return positions
+
+
+class _FeatureSequence(object):
+    # read-only sequence view of the features of a packed collection,
+    # decoding each one on access
+
+    def __init__(self, packed):
+        self.packed = packed
+
+    def __len__(self):
+        return len(self.packed)
+
+    def __getitem__(self, index):
+        return self.packed.feature(index)
+
+    def __iter__(self):
+        return self.packed.iter_features()
+
+
+__all__ = [
+    "GEOMETRY_TYPES",
+    "PackedCollection"
+]
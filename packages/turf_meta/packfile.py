@@ -0,0 +1,254 @@
+import json
+import mmap
+import struct
+import numpy as np
+
+from packed import PackedCollection
+
+MAGIC = b"TURFPACK"
+VERSION = 1
+_ALIGNMENT = 8
+_PREFIX = struct.Struct("<8sII")
+
+
+def write_packed(layer, path, node_size=16):
+    # type: (Any, str, int) -> None
+    """
+    Write a GeoJSON object or a PackedCollection to a binary file that
+        read_packed can map back into memory without parsing.
+
+    The file starts with ``MAGIC``, the format version and the length of
+    a JSON header, followed by the header itself. The header gives the
+    offset, dtype and shape of every array section, all little-endian
+    and 8-byte aligned: the coordinates and offset arrays of the packed
+    collection, an ``(n, 4)`` table of feature bounding boxes, and the
+    flat node arrays of an STR-packed SpatialIndex over those boxes.
+    Properties and other non-coordinate members are stored last as one
+    JSON section, only decoded when they are first needed.
+
+    :type   layer:      Any
+    :param  layer:      a GeoJSON object or a PackedCollection
+    :type   path:       str
+    :param  path:       file to create or overwrite
+    :type   node_size:  int
+    :param  node_size:  node size of the spatial index
+    """
+    from packages.turf_spatial_index import SpatialIndex
+
+    if not isinstance(layer, PackedCollection):
+        layer = PackedCollection.from_geojson(layer)
+
+    bboxes = feature_bboxes(layer)
+    index = SpatialIndex.from_boxes(bboxes.tolist(), node_size)
+
+    arrays = [
+        ("coords", layer.coords),
+        ("ring_offsets", layer.ring_offsets),
+        ("part_offsets", layer.part_offsets),
+        ("geometry_offsets", layer.geometry_offsets),
+        ("geometry_types", layer.geometry_types),
+        ("feature_offsets", layer.feature_offsets),
+        ("bboxes", bboxes),
+        ("index_min_x", np.array(index.min_x, dtype=np.float64)),
+        ("index_min_y", np.array(index.min_y, dtype=np.float64)),
+        ("index_max_x", np.array(index.max_x, dtype=np.float64)),
+        ("index_max_y", np.array(index.max_y, dtype=np.float64)),
+        ("index_refs", np.array(index.refs, dtype=np.int64)),
+    ]
+    meta = json.dumps({
+        "features": layer.features,
+        "collections": layer.collections,
+        "geometry_members": layer.geometry_members,
+        "members": layer.members
+    }).encode("utf-8")
+
+    # lay the sections out after a header whose length depends on their
+    # offsets: grow the reserved space until the header fits
+    reserved = 1024
+    while True:
+        offset = _align(_PREFIX.size + reserved)
+        sections = {}
+        for name, array in arrays:
+            array = np.ascontiguousarray(array)
+            sections[name] = [offset, array.dtype.newbyteorder("<").str,
+                              list(array.shape)]
+            offset = _align(offset + array.nbytes)
+        header = json.dumps({
+            "root": layer.root,
+            "node_size": node_size,
+            "levels": index.levels,
+            "arrays": sections,
+            "meta": [offset, len(meta)]
+        }).encode("utf-8")
+        if len(header) <= reserved:
+            break
+        reserved = len(header)
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for name, array in arrays:
+            f.write(b"\0" * (sections[name][0] - f.tell()))
+            f.write(np.ascontiguousarray(
+                array, dtype=array.dtype.newbyteorder("<")).tobytes())
+        f.write(b"\0" * (offset - f.tell()))
+        f.write(meta)
+
+
+def read_packed(path):
+    # type: (str) -> MappedCollection
+    """
+    Open a file written by write_packed.
+
+    The file is memory-mapped read-only and every array is a numpy view
+    of the mapping: opening costs the same whatever the size of the
+    file, and pages are only read from disk when they are touched.
+
+    :type   path:       str
+    :param  path:       file written by write_packed
+    :rtype:             MappedCollection
+    :return:            the collection, with its bbox table and index
+    :raises ValueError: when the file is not in this format
+    """
+    return MappedCollection(path)
+
+
+def feature_bboxes(layer):
+    # type: (PackedCollection) -> np.ndarray
+    """
+    Bounding box of every feature of a packed collection
+
+    :type   layer:  PackedCollection
+    :param  layer:  a packed collection
+    :rtype:         np.ndarray
+    :return:        ``(n, 4)`` array of [minX, minY, maxX, maxY] rows,
+                    infinite for features without coordinates
+    """
+    # first coordinate of every feature, and of the end of the last one
+    starts = layer.ring_offsets[
+        layer.part_offsets[layer.geometry_offsets[layer.feature_offsets]]]
+    counts = np.diff(starts)
+    bboxes = np.empty((len(counts), 4), dtype=np.float64)
+    bboxes[:, :2] = np.inf
+    bboxes[:, 2:] = -np.inf
+
+    filled = counts > 0
+    if filled.any():
+        xy = layer.coords[:, :2]
+        first = starts[:-1][filled]
+        bboxes[filled, :2] = np.minimum.reduceat(xy, first)
+        bboxes[filled, 2:] = np.maximum.reduceat(xy, first)
+    return bboxes
+
+
+class MappedCollection(PackedCollection):
+    """
+    A PackedCollection whose arrays are views of a memory-mapped file
+        written by write_packed.
+
+    Besides everything a PackedCollection does, it carries ``bboxes``, the
+    ``(n, 4)`` feature bounding box table, and ``index``, the SpatialIndex
+    stored with it; spatial_index() and the spatial joins pick the latter up
+    instead of building their own.
+
+    The mapping stays open as long as the collection or any of its arrays
+    are alive; ``close`` releases it early.
+    """
+
+    def __init__(self, path):
+        from packages.turf_spatial_index import SpatialIndex
+
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, length = _PREFIX.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a packed GeoJSON file")
+        if version != VERSION:
+            raise ValueError(
+                "Unsupported packed GeoJSON version {0}".format(version))
+        header = json.loads(
+            self._mmap[_PREFIX.size:_PREFIX.size + length].decode("utf-8"))
+
+        arrays = {}
+        for name, (offset, dtype, shape) in header["arrays"].items():
+            count = int(np.prod(shape)) if shape else 1
+            arrays[name] = np.frombuffer(
+                self._mmap, dtype=np.dtype(dtype), count=count,
+                offset=offset).reshape(shape)
+
+        self.coords = arrays["coords"]
+        self.ring_offsets = arrays["ring_offsets"]
+        self.part_offsets = arrays["part_offsets"]
+        self.geometry_offsets = arrays["geometry_offsets"]
+        self.geometry_types = arrays["geometry_types"]
+        self.feature_offsets = arrays["feature_offsets"]
+        self.bboxes = arrays["bboxes"]
+        self.root = header["root"]
+        self._index = SpatialIndex.from_arrays(
+            arrays["index_min_x"], arrays["index_min_y"],
+            arrays["index_max_x"], arrays["index_max_y"],
+            arrays["index_refs"], header["levels"], header["node_size"],
+            self["features"]
+        )
+        self._meta_range = header["meta"]
+        self._meta = None
+
+    def _load_meta(self):
+        if self._meta is None:
+            offset, length = self._meta_range
+            self._meta = json.loads(
+                self._mmap[offset:offset + length].decode("utf-8"))
+        return self._meta
+
+    @property
+    def features(self):
+        return self._load_meta()["features"]
+
+    @property
+    def collections(self):
+        return self._load_meta()["collections"]
+
+    @property
+    def geometry_members(self):
+        return self._load_meta()["geometry_members"]
+
+    @property
+    def members(self):
+        return self._load_meta()["members"]
+
+    def bbox(self):
+        # type: () -> list[Number]
+        """
+        Extent of all coordinates in [minX, minY, maxX, maxY] order,
+            from the bbox table
+
+        :rtype:     list[Number]
+        :return:    bbox extent
+        """
+        if not len(self.bboxes):
+            infinity = float("inf")
+            return [infinity, infinity, -infinity, -infinity]
+
+        return self.bboxes[:, :2].min(axis=0).tolist() + \
+            self.bboxes[:, 2:].max(axis=0).tolist()
+
+    def close(self):
+        # type: () -> None
+        """
+        Release the mapping; the arrays must not be used afterwards
+        """
+        self._mmap.close()
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+__all__ = [
+    "MAGIC",
+    "MappedCollection",
+    "feature_bboxes",
+    "read_packed",
+    "write_packed"
+]
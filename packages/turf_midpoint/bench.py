@@ -0,0 +1,11 @@
+from packages import midpoint, midpoint_many
+
+
+def bench(suite, size):
+    pairs = [(suite.point(), suite.point()) for _ in range(size)]
+    starts = [start for start, _ in pairs]
+    ends = [end for _, end in pairs]
+
+    suite.add('midpoint', lambda: [midpoint(start, end)
+                                   for start, end in pairs])
+    suite.add('midpoint_many', lambda: midpoint_many(starts, ends))
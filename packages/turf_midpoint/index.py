@@ -1,4 +1,8 @@
 from packages import bearing, destination, distance
+from packages.turf_bearing.index import _bearing
+from packages.turf_destination.index import _destination
+from packages.turf_distance.index import _distance
+from packages.turf_invariant import get_coord_array
 
 # Takes two {@link Point|points} and returns a point midway between them.
 # The midpoint is calculated geodesically, meaning the curvature of the earth
@@ -41,3 +45,34 @@ def midpoint (point_from, point_to):
     heading = bearing(point_from, point_to)
 
     return destination(point_from, dist / 2, heading, 'miles')
+
+
+# Finds the points midway between many pairs of {@link Point|points} at
+#   once, as `midpoint` does, with the kernels of the vectorized
+#   `distance_pairs`, `bearing_many` and `destination_many`; the points are
+#   unwrapped once for all three.
+#
+# @name midpoint_many
+# @param {FeatureCollection<Point>|Array<Array<number>>} starts first point
+#   of each pair, as a FeatureCollection, a list of points or an (n, 2) array
+#   of coordinates
+# @param {FeatureCollection<Point>|Array<Array<number>>} ends second point
+#   of each pair, likewise
+# @return {numpy.ndarray} (n, 2) coordinates of the midpoints
+# @example
+# var midpoints = turf.midpoint_many(starts, ends);
+#
+# //=midpoints
+def midpoint_many(starts, ends):
+    import numpy as np
+
+    starts = get_coord_array(starts)
+    ends = get_coord_array(ends)
+    lon1, lat1 = starts[:, 0], starts[:, 1]
+    lon2, lat2 = ends[:, 0], ends[:, 1]
+    dist = _distance(np, lon1, lat1, lon2, lat2, 'miles')
+    heading = _bearing(np, lon1, lat1, lon2, lat2)
+
+    longitude, latitude = _destination(np, lon1, lat1, dist / 2, heading,
+                                       'miles')
+    return np.column_stack(np.broadcast_arrays(longitude, latitude))
@@ -0,0 +1,10 @@
+from packages import nearest, point_index
+
+
+def bench(suite, size):
+    target = suite.point()
+    points = suite.points(size)
+    index = point_index(points)
+
+    suite.add('nearest', lambda: nearest(target, points))
+    suite.add('nearest#indexed', lambda: nearest(target, index))
@@ -1,13 +1,17 @@
-from packages import distance
+from packages import distance_many
+from packages.turf_spatial_index import PointIndex
 
 # Takes a reference {@link Point|point} and a FeatureCollection of Features
 # with Point geometries and returns the
 # point from the FeatureCollection closest to the reference. This calculation
 # is geodesic.
 #
+# When the same point set is searched over and over, build a
+# `point_index` of it once and pass that instead of the FeatureCollection.
+#
 # @name nearest
 # @param {Feature<Point>} targetPoint the reference point
-# @param {FeatureCollection<Point>} points against input point set
+# @param {FeatureCollection<Point>|PointIndex} points against input point set
 # @return {Feature<Point>} the closest point in the set to the reference point
 # @example
 # var point = {
@@ -59,14 +63,11 @@ from packages import distance
 #
 # //=result
 def nearest(target_point, points):
-    nearest_point = None
-    min_dist = float("inf")
-    for i in range(len(points["features"])):
-        distance_to_point = distance(target_point, points["features"][i],
-                                     'miles')
-        if distance_to_point < min_dist:
-            nearest_point = points["features"][i]
-            min_dist = distance_to_point
+    if isinstance(points, PointIndex):
+        return points.nearest(target_point)
 
-    return nearest_point
+    if not len(points["features"]):
+        return None
 
+    distances = distance_many(target_point, points, 'miles')
+    return points["features"][int(distances.argmin())]
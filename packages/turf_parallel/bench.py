@@ -0,0 +1,21 @@
+from packages.turf_parallel import JoinExecutor
+from packages import tag, within
+
+
+def bench(suite, size):
+    points = suite.points(size)
+    polygons = suite.polygons(max(size // 10, 1),
+                              properties=lambda i: {'zone': i})
+    # started once, outside the timings, as a long running service would,
+    # by a join of one point; stopped once the cases are done
+    executor = JoinExecutor(2)
+    list(executor.contained(points["features"][:1], polygons))
+    suite.cleanup(executor.close)
+
+    suite.add('within', lambda: within(points, polygons))
+    suite.add('within#workers=2',
+              lambda: within(points, polygons, workers=executor))
+    suite.add('tag', lambda: tag(points, polygons, 'zone', 'zone'))
+    suite.add('tag#workers=2',
+              lambda: tag(points, polygons, 'zone', 'zone',
+                          workers=executor))
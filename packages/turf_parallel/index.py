@@ -0,0 +1,157 @@
+from packages import inside
+from packages.turf_invariant import get_coord
+from packages.turf_meta import iter_features
+from packages.turf_spatial_index import spatial_index
+from geojson import FeatureCollection
+from collections import deque
+import multiprocessing
+
+# what a worker process joins points against, set up once by _initialize
+_worker = {}
+
+
+class JoinExecutor(object):
+    """
+    A pool of worker processes for point in polygon joins, which within,
+        tag and collect run on through their ``workers`` option.
+
+    The polygons are sent to each worker once, when the pool is started
+    for them, and every worker indexes its own copy. The points are then
+    sent in chunks of ``chunk_size`` coordinates, and the polygons each
+    one lands within come back in point order, however the workers are
+    scheduled. Joining against other polygons restarts the pool, so an
+    executor reused for many calls with the same polygons only ships the
+    points; those polygons must not be changed in the meantime.
+
+    At most two chunks per worker are in flight at any time, so that a
+    stream of points is not read ahead of the joins.
+
+    :type   workers:    int
+    :param  workers:    number of worker processes, one per CPU when omitted
+    :type   chunk_size: int
+    :param  chunk_size: number of points per task
+    """
+
+    def __init__(self, workers=None, chunk_size=4096):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._polygons = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def contained(self, points, polygons):
+        # type: (Any, Any) -> Iterator[tuple[Feature, list[int]]]
+        """
+        Pair each point with the polygons it lands within
+
+        :type   points:     FeatureCollection | Iterable[Feature]
+        :param  points:     points to join
+        :type   polygons:   FeatureCollection | PackedCollection
+        :param  polygons:   polygons to join the points to
+        :rtype:             Iterator[tuple[Feature, list[int]]]
+        :return:            each point, in order, with the indices of the
+                            polygons it lands within, in increasing order
+        """
+        pool = self._start(polygons)
+        pending = deque()
+
+        for chunk in _chunks(iter_features(points), self.chunk_size):
+            coords = [get_coord(point) for point in chunk]
+            pending.append((chunk, pool.apply_async(_contained, (coords,))))
+            if len(pending) > 2 * self.workers:
+                for pair in _collect(pending.popleft()):
+                    yield pair
+
+        while pending:
+            for pair in _collect(pending.popleft()):
+                yield pair
+
+    def close(self):
+        # type: () -> None
+        """
+        Stop the worker processes; the next join starts them again
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+        self._pool = None
+        self._polygons = None
+
+    def _start(self, polygons):
+        if self._pool is not None and polygons is self._polygons:
+            return self._pool
+
+        self.close()
+        shipped = polygons
+        if not isinstance(shipped, dict):
+            shipped = FeatureCollection(list(iter_features(polygons)))
+        self._pool = multiprocessing.Pool(self.workers, _initialize,
+                                          (shipped,))
+        # keep the polygons alive, so that their id is not reused
+        self._polygons = polygons
+        return self._pool
+
+
+def iter_contained(points, polygons, workers):
+    # type: (Any, Any, Any) -> Iterator[tuple[Feature, list[int]]]
+    """
+    Pair each point with the polygons it lands within, in worker processes
+
+    :type   points:     FeatureCollection | Iterable[Feature]
+    :param  points:     points to join
+    :type   polygons:   FeatureCollection | PackedCollection
+    :param  polygons:   polygons to join the points to
+    :type   workers:    int | JoinExecutor
+    :param  workers:    an executor to run on, or a number of processes to
+                        start one with for this join only
+    :rtype:             Iterator[tuple[Feature, list[int]]]
+    :return:            see JoinExecutor.contained
+    """
+    if isinstance(workers, JoinExecutor):
+        for pair in workers.contained(points, polygons):
+            yield pair
+        return
+
+    with JoinExecutor(workers) as executor:
+        for pair in executor.contained(points, polygons):
+            yield pair
+
+
+def _chunks(features, size):
+    chunk = []
+    for feature in features:
+        chunk.append(feature)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _collect(task):
+    chunk, result = task
+    return zip(chunk, result.get())
+
+
+def _initialize(polygons):
+    _worker["features"] = polygons["features"]
+    _worker["index"] = spatial_index(polygons)
+
+
+def _contained(coords):
+    features = _worker["features"]
+    index = _worker["index"]
+    return [[i for i in index.search_point(coord)
+             if inside(coord, features[i])]
+            for coord in coords]
+
+
+__all__ = [
+    "JoinExecutor",
+    "iter_contained"
+]
@@ -0,0 +1,14 @@
+from packages import planepoint
+from geojson import Feature, Polygon
+
+
+def bench(suite, size):
+    triangle = Feature(
+        geometry=Polygon([[[-1, -1], [1, -1], [0, 1], [-1, -1]]]),
+        properties={'a': 1, 'b': 2, 'c': 3}
+    )
+    points = [suite.point(suite.coord([-0.5, -0.5, 0.5, 0.5]))
+              for _ in range(size)]
+
+    suite.add('planepoint', lambda: [planepoint(point, triangle)
+                                     for point in points])
@@ -54,13 +54,13 @@ def planepoint (point, triangle):
     y = point.geometry.coordinates[1]
     x1 = triangle.geometry.coordinates[0][0][0]
     y1 = triangle.geometry.coordinates[0][0][1]
-    z1 = triangle.properties.a
+    z1 = triangle.properties["a"]
     x2 = triangle.geometry.coordinates[0][1][0]
     y2 = triangle.geometry.coordinates[0][1][1]
-    z2 = triangle.properties.b
+    z2 = triangle.properties["b"]
     x3 = triangle.geometry.coordinates[0][2][0]
     y3 = triangle.geometry.coordinates[0][2][1]
-    z3 = triangle.properties.c
+    z3 = triangle.properties["c"]
 
     return (z3 * (x - x1) * (y - y2) + z1 * (x - x2) * (y - y3) +
             z2 * (x - x3) * (y - y1) - z2 * (x - x1) * (y - y3) -
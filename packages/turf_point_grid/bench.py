@@ -0,0 +1,19 @@
+from packages import iter_point_grid, point_grid, point_grid_arrays
+
+
+def bench(suite, size):
+    bbox = suite.bbox()
+    # roughly `size` points over a 10 degree box at the equator
+    cell = 1111.0 / size ** 0.5
+
+    def drain(points):
+        count = 0
+        for _ in points:
+            count += 1
+        return count
+
+    suite.add('point_grid', lambda: point_grid(bbox, cell, 'kilometers'))
+    suite.add('iter_point_grid',
+              lambda: drain(iter_point_grid(bbox, cell, 'kilometers')))
+    suite.add('point_grid_arrays',
+              lambda: point_grid_arrays(bbox, cell, 'kilometers'))
@@ -1,5 +1,6 @@
-from packages import distance
+from packages import grid_layout
 from geojson import FeatureCollection, Point
+
 # Takes a bounding box and a cell depth and returns
 #   a set of {@link Point|points} in a grid.
 #
@@ -18,21 +19,47 @@ from geojson import FeatureCollection, Point
 #
 # //=grid
 def point_grid(bbox, cellSize, units):
-    fc = FeatureCollection([])
-    x_fraction = cellSize / distance(Point((bbox[0], bbox[1])),
-                                     Point((bbox[2], bbox[1])), units)
-    cell_width = x_fraction * (bbox[2] - bbox[0])
-    y_fraction = cellSize / distance(Point((bbox[0], bbox[1])),
-                                     Point((bbox[0], bbox[3])), units)
-    cell_height = y_fraction * (bbox[3] - bbox[1])
+    return FeatureCollection(list(iter_point_grid(bbox, cellSize, units)))
+
+
+# Lazy variant of `pointGrid`: yields the same points one at a time instead
+#   of collecting them.
+#
+# @name iterPointGrid
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize the distance across each cell
+# @param {string} [units=kilometers] used in calculating cellSize,
+#   can be degrees, radians, miles, or kilometers
+# @return {Iterator<Point>} the points of the grid
+# @example
+# for (var pt of turf.iterPointGrid(extent, 3, 'miles')) {
+#   //=pt
+# }
+def iter_point_grid(bbox, cellSize, units):
+    xs, ys, _, _ = grid_layout(bbox, cellSize, units)
+
+    for current_x in xs:
+        for current_y in ys:
+            yield Point((current_x, current_y))
 
-    current_x = bbox[0]
-    while current_x <= bbox[2]:
-        current_y = bbox[1]
-        while current_y <= bbox[3]:
-            fc["features"].append(Point((current_x, current_y)))
 
-            current_y += cell_height
-        current_x += cell_width
+# Columnar variant of `pointGrid`: the same points, in the same order, as
+#   one numpy array. Values are those the Points are built from, before
+#   geojson rounds them to its output precision.
+#
+# @name pointGridArrays
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize the distance across each cell
+# @param {string} [units=kilometers] used in calculating cellSize,
+#   can be degrees, radians, miles, or kilometers
+# @return {numpy.ndarray} (n, 2) coordinates of the points
+# @example
+# var coords = turf.pointGridArrays(extent, 3, 'miles');
+def point_grid_arrays(bbox, cellSize, units):
+    import numpy as np
 
-    return fc
+    xs, ys, _, _ = grid_layout(bbox, cellSize, units)
+    return np.column_stack((
+        np.repeat(np.array(xs, dtype=np.float64), len(ys)),
+        np.tile(np.array(ys, dtype=np.float64), len(xs))
+    ))
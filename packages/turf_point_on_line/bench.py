@@ -0,0 +1,13 @@
+from packages import line_snapper, point_on_line
+
+
+def bench(suite, size):
+    line = suite.line(size)
+    pt = suite.point([0.5, 0.1])
+    pings = suite.points(100, bbox=[0, -0.5, 1, 0.5])
+    snapper = line_snapper(line)
+
+    suite.add('point_on_line', lambda: point_on_line(line, pt))
+    suite.add('line_snapper', lambda: line_snapper(line))
+    suite.add('snap', lambda: snapper.snap(pt))
+    suite.add('snap_many#100', lambda: snapper.snap_many(pings))
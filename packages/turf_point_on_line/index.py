@@ -1,14 +1,26 @@
-from packages import bearing, destination, distance
-from geojson import Point
+from packages import distance
+from packages.turf_invariant import get_coord
+from packages.turf_spatial_index import SpatialIndex
+from geojson import Feature, FeatureCollection, Point
+import math
 
 # Takes a {@link Point} and a {@link LineString} and calculates
 #   the closest Point on the LineString.
 #
-# @name inner_function
-# @param {Feature<LineString>} line line to snap to
+# The line is compared to the point in an equirectangular projection centred
+#   on the point, which finds the closest position of each segment without
+#   any geodesic math. Only the segments whose position is about as close as
+#   the closest one, within `LineSnapper.margin`, are measured on the sphere
+#   to pick the closest.
+#
+# @name pointOnLine
+# @param {Feature<LineString>|LineSnapper} line line to snap to, or a
+#   `LineSnapper` to snap with its index of the line
 # @param {Feature<Point>} pt point to snap from
 # @param {String} [units=miles] can be degrees, radians, miles, or kilometers
-# @return {Feature<Point>} closest point on the `line` to `point`
+# @return {Feature<Point>} closest point on the `line` to `point`, with the
+#   distance to it as `dist` and the index of the segment it lies on as
+#   `index`
 # @example
 # var line = {
 #   "type": "Feature",
@@ -34,7 +46,7 @@ from geojson import Point
 #   }
 # };
 #
-# var snapped = turf.inner_function(line, pt, 'miles');
+# var snapped = turf.pointOnLine(line, pt, 'miles');
 # snapped.properties['marker-color'] = '#00f'
 #
 # var result = {
@@ -44,101 +56,157 @@ from geojson import Point
 #
 # //=result
 
-def point_on_line (line, pt, units='miles'):
+def point_on_line(line, pt, units='miles'):
+    if isinstance(line, LineSnapper):
+        return line.snap(pt)
+
+    coords = _coords(line)
+    x, y = get_coord(pt)[:2]
+    scale = _scale(y)
+    return _snapped(_refine(pt, [_project(coords, i, x, y, scale)
+                                 for i in range(max(len(coords) - 1, 1))],
+                            units))
+
+
+# Prepares a {@link LineString|line} for snapping many points to it: its
+#   segments are indexed by bounding box, so that a point is only compared
+#   to the few segments near it, which are found by growing a search window
+#   around the point until it holds one. The window is then widened to the
+#   distance to that segment, plus the margin of `pointOnLine`, so that it
+#   holds every segment `pointOnLine` would measure.
+#
+# The answers are those of `pointOnLine`, which can also be given the
+#   snapper in place of the line.
+#
+# @name lineSnapper
+# @param {Feature<LineString>|LineString} line line to snap to
+# @param {String} [units=miles] can be degrees, radians, miles, or kilometers
+# @return {LineSnapper} the snapper of the line
+# @example
+# var route = turf.lineSnapper(line, 'kilometers');
+#
+# var snapped = route.snap(pt);
+#
+# var all = route.snap_many(pings);
+#
+# //=all
+def line_snapper(line, units='miles'):
+    return LineSnapper(line, units)
+
+
+# A line indexed for snapping points to it, see `lineSnapper`.
+class LineSnapper(object):
+    # how much farther than the closest segment in the projection the
+    # closest one on the sphere may be
+    margin = 1.01
+
+    def __init__(self, line, units='miles'):
+        self.coords = coords = _coords(line)
+        self.units = units
+        count = max(len(coords) - 1, 1)
+        boxes = []
+        extent = 0.0
+        for i in range(count):
+            a = coords[i]
+            b = coords[min(i + 1, len(coords) - 1)]
+            boxes.append([min(a[0], b[0]), min(a[1], b[1]),
+                          max(a[0], b[0]), max(a[1], b[1])])
+            extent += max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+        self.index = SpatialIndex.from_boxes(boxes)
+        # the first search window is about as wide as a segment
+        self.radius = extent / count or 1e-6
+
+    def snap(self, pt):
+        return _snapped(self.closest(pt))
+
+    def snap_many(self, points):
+        if isinstance(points, dict):
+            points = points["features"]
+        return FeatureCollection([self.snap(pt) for pt in points])
+
+    # (distance, segment index, position) of the position of the line
+    # closest to `pt`; the position is one of the coordinates of the line,
+    # unless it lies inside a segment
+    def closest(self, pt):
+        x, y = get_coord(pt)[:2]
+        scale = _scale(y)
+
+        radius = self.radius
+        while True:
+            candidates = self._search(x, y, scale, radius)
+            if candidates:
+                break
+            radius *= 2
+
+        squared = min(_project(self.coords, i, x, y, scale)[0]
+                      for i in candidates)
+        radius = math.sqrt(squared) * LineSnapper.margin
+        return _refine(pt, [_project(self.coords, i, x, y, scale)
+                            for i in self._search(x, y, scale, radius)],
+                       self.units)
+
+    def _search(self, x, y, scale, radius):
+        # ids of the segments whose box is within `radius` of the point in
+        # the projection, in which a degree of longitude is `scale` wide
+        return self.index.search([x - radius / scale, y - radius,
+                                  x + radius / scale, y + radius])
+
+
+def _coords(line):
     if line["type"] == 'Feature':
-        coords = line["geometry"]["coordinates"]
+        return line["geometry"]["coordinates"]
     elif line["type"] == 'LineString':
-        coords = line["coordinates"]
+        return line["coordinates"]
+    raise ValueError('input must be a LineString Feature or Geometry')
+
+
+def _scale(y):
+    # width of a degree of longitude at latitude y, in degrees of latitude
+    return max(math.cos(math.radians(y)), 1e-9)
+
+
+def _project(coords, i, x, y, scale):
+    # (squared projected distance, segment, position) of the position of
+    # segment i closest to the point
+    a = coords[i]
+    b = coords[min(i + 1, len(coords) - 1)]
+    ax = (a[0] - x) * scale
+    ay = a[1] - y
+    dx = (b[0] - a[0]) * scale
+    dy = b[1] - a[1]
+    length2 = dx * dx + dy * dy
+    t = 0.0
+    if length2:
+        t = min(max(-(ax * dx + ay * dy) / length2, 0.0), 1.0)
+    px = ax + t * dx
+    py = ay + t * dy
+
+    if t == 0:
+        position = a
+    elif t == 1:
+        position = b
     else:
-        raise ValueError('input must be a LineString Feature or Geometry')
+        position = [a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1])]
+    return px * px + py * py, i, position
+
 
-    return inner_function(pt, coords, units)
+def _refine(pt, projected, units):
+    # the closest on the sphere of the positions about as close as the
+    # closest in the projection; ties go to the first segment
+    limit = min(p[0] for p in projected) * LineSnapper.margin ** 2
+    closest = None
+    for squared, i, position in sorted(projected, key=lambda p: p[1]):
+        if squared > limit:
+            continue
+        dist = distance(pt, position, units)
+        if closest is None or dist < closest[0]:
+            closest = (dist, i, position)
+    return closest
 
 
-def inner_function(pt, coords, units):
-    closest_pt = Point((float("inf"), float("inf")), {
-        "dist": float("inf")
+def _snapped(closest):
+    dist, i, position = closest
+    return Feature(geometry=Point(position), properties={
+        "dist": dist,
+        "index": i
     })
-    for i in range(len(coords)):
-        start = Point(coords[i])
-        stop = Point(coords[i + 1])
-        # start
-        start.properties.dist = distance(pt, start, units)
-        # stop
-        stop.properties.dist = distance(pt, stop, units)
-        # perpendicular
-        height_distance = max(start.properties.dist, stop.properties.dist)
-        direction = bearing(start, stop)
-        perpendicular_pt1 = destination(pt, height_distance, direction + 90, units)
-        perpendicular_pt2 = destination(pt, height_distance, direction - 90, units)
-        intersect = line_intersects(
-            perpendicular_pt1.geometry.coordinates[0],
-            perpendicular_pt1.geometry.coordinates[1],
-            perpendicular_pt2.geometry.coordinates[0],
-            perpendicular_pt2.geometry.coordinates[1],
-            start.geometry.coordinates[0],
-            start.geometry.coordinates[1],
-            stop.geometry.coordinates[0],
-            stop.geometry.coordinates[1]
-        )
-
-        if intersect:
-            intersect_pt = Point(intersect)
-            intersect_pt.properties.dist = distance(pt, intersect_pt, units)
-
-        if start.properties.dist < closest_pt.properties.dist:
-            closest_pt = start
-            closest_pt.properties.index = i
-        if stop.properties.dist < closest_pt.properties.dist:
-            closest_pt = stop
-            closest_pt.properties.index = i
-        if intersect_pt and intersect_pt.properties.dist < closest_pt.properties.dist:
-            closest_pt = intersect_pt
-            closest_pt.properties.index = i
-
-    return closest_pt
-
-# modified from http://jsfiddle.net/justin_c_rounds/Gd2S2/light/
-def line_intersects(line1_start_x, line1_start_y, line1_end_x, line1_end_y,
-                    line2_start_x, line2_start_y, line2_end_x, line2_end_y):
-    # if the lines intersect, the result contains the x and y
-    #   of the intersection (treating the lines as infinite) and booleans
-    #   for whether line segment 1 or line segment 2 contain the point
-    result = {"x": None, "y": None, "onLine1": False, "onLine2": False}
-    denominator = ((line2_end_y - line2_start_y) *
-                   (line1_end_x - line1_start_x)) - \
-                  ((line2_end_x - line2_start_x) *
-                   (line1_end_y - line1_start_y))
-    if denominator == 0:
-        if result.x is not None and result.y is not None:
-            return result
-        else:
-            return False
-    a = line1_start_y - line2_start_y
-    b = line1_start_x - line2_start_x
-    numerator1 = ((line2_end_x - line2_start_x) * a) - \
-                 ((line2_end_y - line2_start_y) * b)
-    numerator2 = ((line1_end_x - line1_start_x) * a) - \
-                 ((line1_end_y - line1_start_y) * b)
-    a = numerator1 / denominator
-    b = numerator2 / denominator
-
-    # if we cast these lines infinitely in both directions,
-    #   they intersect here:
-    result.x = line1_start_x + (a * (line1_end_x - line1_start_x))
-    result.y = line1_start_y + (a * (line1_end_y - line1_start_y))
-
-    # if line1 is a segment and line2 is infinite, they intersect if:
-    if 0 < a < 1:
-        result.onLine1 = True
-
-    # if line2 is a segment and line1 is infinite, they intersect if:
-    if 0 < b < 1:
-        result.onLine2 = True
-
-    # if line1 and line2 are segments,
-    #   they intersect if both of the above are true
-    if result.onLine1 and result.onLine2:
-        return [result.x, result.y]
-    else:
-        return False
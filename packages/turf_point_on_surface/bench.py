@@ -0,0 +1,9 @@
+from packages import point_on_surface
+
+
+def bench(suite, size):
+    poly = suite.polygon(size)
+    points = suite.points(size)
+
+    suite.add('point_on_surface#polygon', lambda: point_on_surface(poly))
+    suite.add('point_on_surface#points', lambda: point_on_surface(points))
@@ -1,4 +1,4 @@
-from packages import centroid, distance, inside, explode
+from packages import centroid, distance_many, inside, explode
 from geojson import FeatureCollection, Feature
 import math
 
@@ -30,7 +30,7 @@ def point_on_surface(feature_collection):
     # normalize
     if feature_collection.type != "FeatureCollection":
         if feature_collection.type != "Feature":
-            feature_collection = Feature(feature_collection)
+            feature_collection = Feature(geometry=feature_collection)
         feature_collection = FeatureCollection([feature_collection])
 
     # get centroid
@@ -88,7 +88,7 @@ def point_on_surface(feature_collection):
                     k += 1
                 j += 1
         elif geom["type"] == "Polygon" or geom["type"] == "MultiPolygon":
-            f = Feature(geom)
+            f = Feature(geometry=geom)
             if inside(cent, f):
                 on_surface = True
         i += 1
@@ -100,13 +100,8 @@ def point_on_surface(feature_collection):
             vertices.features = \
                 vertices["features"] + \
                 explode(feature_collection["features"][i])["features"]
-        closest_distance = float("inf")
-        for i in range(len(vertices["feautres"])):
-            dist = distance(cent, vertices["features"][i], "miles")
-            if dist < closest_distance:
-                closest_distance = dist
-                closest_vertex = vertices.features[i]
-        return closest_vertex
+        distances = distance_many(cent, vertices, "miles")
+        return vertices["features"][int(distances.argmin())]
 
 def point_on_segment(x, y, x1, y1, x2, y2):
     ab = math.sqrt((x2 - x1) * (x2 - x1) + (y2 - y1) * (y2 - y1))
@@ -0,0 +1,23 @@
+from packages import bearing, destination, distance, fast_ruler, \
+    line_distance, point_on_line
+
+
+def bench(suite, size):
+    ruler = fast_ruler(0.0)
+    a = suite.coord()
+    b = suite.coord()
+    line = suite.line(size)
+    pt = suite.point([0.5, 0.1])
+
+    suite.add('distance', lambda: distance(a, b, 'kilometers'))
+    suite.add('ruler.distance', lambda: ruler.distance(a, b))
+    suite.add('bearing', lambda: bearing(a, b))
+    suite.add('ruler.bearing', lambda: ruler.bearing(a, b))
+    suite.add('destination', lambda: destination(a, 5, 30, 'kilometers'))
+    suite.add('ruler.destination', lambda: ruler.destination(a, 5, 30))
+    suite.add('line_distance', lambda: line_distance(line, 'kilometers'))
+    suite.add('ruler.line_distance', lambda: ruler.line_distance(line))
+    suite.add('point_on_line',
+              lambda: point_on_line(line, pt, 'kilometers'))
+    suite.add('ruler.point_on_line', lambda: ruler.point_on_line(line, pt))
+
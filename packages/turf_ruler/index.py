@@ -0,0 +1,276 @@
+from packages.turf_helpers import radians_to_distance
+from packages.turf_invariant import get_coord
+from packages.turf_meta import iter_segments
+from geojson import Feature, Point
+import math
+
+_RADIANS = math.pi / 180
+
+
+class FastRuler(object):
+    """
+    Fast approximations of distance, bearing, destination, line_distance
+        and point_on_line, for points near one latitude.
+
+    Around the latitude of the ruler, the sphere is taken to be flat: a
+    degree of latitude is ``ky`` long, and a degree of longitude ``kx``,
+    both measured once, when the ruler is built, so that no trigonometry
+    is left for a distance. The width of a degree of longitude is then
+    corrected to the middle latitude of each measure, to second order, and
+    bearings are turned by the convergence of the meridians, so that they
+    are initial bearings, as ``bearing`` gives them.
+
+    Largest differences to ``distance``, ``bearing`` and ``destination``,
+    for points within ``span`` degrees of latitude of the ruler's, and
+    within ``range`` of each other; distances and destinations differ by
+    a fraction of the distance measured or travelled:
+
+        =========  ======  =======  ========  ========  ===========
+        latitude   span    range    distance  bearing   destination
+        =========  ======  =======  ========  ========  ===========
+        <= 60      0.5     100 km   0.005%    0.002     0.01%
+        <= 60      1       200 km   0.02%     0.01      0.04%
+        <= 70      0.5     100 km   0.01%     0.005     0.025%
+        <= 70      1       200 km   0.05%     0.02      0.1%
+        =========  ======  =======  ========  ========  ===========
+
+    Half a degree of latitude is about 55 km: a ruler built at the
+    latitude of the middle of a city is within the first rows for all of
+    it. The ``turf_ruler`` tests check the table.
+
+    :type   latitude:   Number
+    :param  latitude:   latitude of the area to measure, in degrees
+    :type   units:      str
+    :param  units:      units of every distance, can be degrees, radians,
+                        miles, or kilometers
+    """
+
+    def __init__(self, latitude, units="kilometers"):
+        self.latitude = latitude
+        self.units = units
+        radians = math.radians(latitude)
+        self._sin = math.sin(radians)
+        self._cos = math.cos(radians)
+        self._tan = math.tan(radians)
+        # length of a degree of latitude, and of longitude at the latitude
+        # of the ruler
+        self.ky = radians_to_distance(math.pi / 180, units)
+        self.kx = self.ky * self._cos
+
+    def distance(self, start, end):
+        # type: (Any, Any) -> Number
+        """
+        Distance between two points
+
+        :type   start:  Any
+        :param  start:  a coordinate, a Point geometry or a Point Feature
+        :type   end:    Any
+        :param  end:    a coordinate, a Point geometry or a Point Feature
+        :rtype:         Number
+        :return:        distance between the points, in the units of
+                        the ruler
+        """
+        a = get_coord(start)
+        b = get_coord(end)
+        d = ((a[1] + b[1]) / 2.0 - self.latitude) * _RADIANS
+        dx = _wrap(b[0] - a[0]) * \
+            self.kx * (1 - self._tan * d - d * d / 2)
+        dy = (b[1] - a[1]) * self.ky
+        return math.sqrt(dx * dx + dy * dy)
+
+    def bearing(self, start, end):
+        # type: (Any, Any) -> Number
+        """
+        Initial bearing from one point to another
+
+        :type   start:  Any
+        :param  start:  a coordinate, a Point geometry or a Point Feature
+        :type   end:    Any
+        :param  end:    a coordinate, a Point geometry or a Point Feature
+        :rtype:         Number
+        :return:        bearing in degrees, from -180 to 180, clockwise
+                        from north
+        """
+        a = get_coord(start)
+        b = get_coord(end)
+        d = ((a[1] + b[1]) / 2.0 - self.latitude) * _RADIANS
+        dlon = _wrap(b[0] - a[0])
+        heading = math.atan2(dlon * self.kx * (1 - self._tan * d - d * d / 2),
+                             (b[1] - a[1]) * self.ky) / _RADIANS
+        # the heading is that at the middle of the way; the meridians
+        # converge by dlon * sin(middle) over all of it
+        return _wrap(heading - dlon * (self._sin + self._cos * d -
+                                       self._sin * d * d / 2) / 2)
+
+    def destination(self, origin, distance, bearing):
+        # type: (Any, Number, Number) -> Point
+        """
+        Point at a distance from another, along an initial bearing
+
+        :type   origin:     Any
+        :param  origin:     a coordinate, a Point geometry or a Point Feature
+        :type   distance:   Number
+        :param  distance:   distance from the origin, in the units of
+                            the ruler
+        :type   bearing:    Number
+        :param  bearing:    initial bearing, in degrees clockwise from north
+        :rtype:             Point
+        :return:            the destination point
+        """
+        x, y = get_coord(origin)[:2]
+        longitude, latitude = self._offset(x, y, distance, bearing)
+        # once the way is known, the heading at its middle is known too
+        heading = bearing + (longitude - x) * \
+            self._sin_at((y + latitude) / 2.0) / 2
+        return Point(self._offset(x, y, distance, heading))
+
+    def line_distance(self, line):
+        # type: (GeoJSON) -> Number
+        """
+        Length of lines, or of the rings of polygons
+
+        :type   line:   GeoJSON
+        :param  line:   a (Multi)LineString or (Multi)Polygon Feature or
+                        Geometry, or a FeatureCollection of them
+        :rtype:         Number
+        :return:        the sum of the lengths of their segments, in the
+                        units of the ruler
+        """
+        travelled = 0
+        distance = self._distance
+        for start, end in iter_segments(line):
+            travelled += distance(start[0], start[1], end[0], end[1])
+        return travelled
+
+    def point_on_line(self, line, point):
+        # type: (Any, Any) -> Feature
+        """
+        Position of a line closest to a point, as point_on_line finds it,
+            but measured on the ruler's plane
+
+        :type   line:   Feature | LineString
+        :param  line:   line to snap to
+        :type   point:  Any
+        :param  point:  a coordinate, a Point geometry or a Point Feature
+        :rtype:         Feature
+        :return:        a Point feature, with the distance to the point in
+                        its ``dist`` property, and the segment it is on in
+                        its ``index`` property; ties go to the first segment
+        :raises ValueError: when ``line`` is not a LineString
+        """
+        if line["type"] == "Feature":
+            coords = line["geometry"]["coordinates"]
+        elif line["type"] == "LineString":
+            coords = line["coordinates"]
+        else:
+            raise ValueError("input must be a LineString Feature or Geometry")
+
+        x, y = get_coord(point)[:2]
+        # the plane around the point, in the units of the ruler; each
+        # position is projected once, as the end of one segment and the
+        # start of the next
+        kx = self._kx(y)
+        ky = self.ky
+
+        ax = _wrap(coords[0][0] - x) * kx
+        ay = (coords[0][1] - y) * ky
+        closest = (ax * ax + ay * ay, 0, 0.0)
+        for i in range(1, len(coords)):
+            bx = coords[i][0] - x
+            if bx > 180:
+                bx -= 360
+            elif bx < -180:
+                bx += 360
+            bx *= kx
+            by = (coords[i][1] - y) * ky
+            dx = bx - ax
+            dy = by - ay
+            length2 = dx * dx + dy * dy
+            t = 0.0
+            if length2:
+                t = min(max(-(ax * dx + ay * dy) / length2, 0.0), 1.0)
+            px = ax + t * dx
+            py = ay + t * dy
+            squared = px * px + py * py
+            if squared < closest[0]:
+                closest = (squared, i - 1, t)
+            ax = bx
+            ay = by
+
+        _, i, t = closest
+        a = coords[i]
+        b = coords[min(i + 1, len(coords) - 1)]
+        if t == 0:
+            position = a
+        elif t == 1:
+            position = b
+        else:
+            position = [a[0] + t * _wrap(b[0] - a[0]),
+                        a[1] + t * (b[1] - a[1])]
+        return Feature(geometry=Point(position), properties={
+            "dist": self.distance([x, y], position),
+            "index": i
+        })
+
+    def _distance(self, x1, y1, x2, y2):
+        # distance, on coordinates, with _kx and _wrap inlined, for loops
+        d = ((y1 + y2) / 2.0 - self.latitude) * _RADIANS
+        dx = x2 - x1
+        if dx > 180:
+            dx -= 360
+        elif dx < -180:
+            dx += 360
+        dx *= self.kx * (1 - self._tan * d - d * d / 2)
+        dy = (y2 - y1) * self.ky
+        return math.sqrt(dx * dx + dy * dy)
+
+    def _kx(self, latitude):
+        # length of a degree of longitude at a latitude near the ruler's:
+        # cos(lat + d) = cos(lat) * (1 - tan(lat) * d - d * d / 2), to
+        # second order
+        d = (latitude - self.latitude) * _RADIANS
+        return self.kx * (1 - self._tan * d - d * d / 2)
+
+    def _sin_at(self, latitude):
+        # sin(lat + d) = sin(lat) + cos(lat) * d - sin(lat) * d * d / 2
+        d = (latitude - self.latitude) * _RADIANS
+        return self._sin + self._cos * d - self._sin * d * d / 2
+
+    def _offset(self, x, y, distance, heading):
+        # the position `distance` away from (x, y), heading `heading` all
+        # the way
+        heading = math.radians(heading)
+        latitude = y + math.cos(heading) * distance / self.ky
+        longitude = x + math.sin(heading) * distance / \
+            self._kx((y + latitude) / 2.0)
+        return longitude, latitude
+
+
+def fast_ruler(latitude, units="kilometers"):
+    # type: (Number, str) -> FastRuler
+    """
+    Build a ruler for fast approximate measures near one latitude.
+
+    :type   latitude:   Number
+    :param  latitude:   latitude of the area to measure, in degrees
+    :type   units:      str
+    :param  units:      units of every distance
+    :rtype:             FastRuler
+    :return:            the ruler
+    """
+    return FastRuler(latitude, units)
+
+
+def _wrap(degrees):
+    # the same angle, from -180 to 180, across the antimeridian
+    if degrees > 180:
+        return degrees - 360
+    if degrees < -180:
+        return degrees + 360
+    return degrees
+
+
+__all__ = [
+    "FastRuler",
+    "fast_ruler"
+]
@@ -0,0 +1,63 @@
+from packages import bearing, destination, distance, fast_ruler
+import random
+import unittest
+
+# the error table of FastRuler: largest latitude, span and range in
+# kilometers, then the largest relative distance error, bearing error in
+# degrees and relative destination error
+ERRORS = [
+    (60, 0.5, 100, 5e-5, 0.002, 1e-4),
+    (60, 1, 200, 2e-4, 0.01, 4e-4),
+    (70, 0.5, 100, 1e-4, 0.005, 2.5e-4),
+    (70, 1, 200, 5e-4, 0.02, 1e-3)
+]
+
+
+class FastRulerTest(unittest.TestCase):
+
+    def test_errors(self):
+        # the errors documented by FastRuler, against the exact functions,
+        # at every five degrees of latitude of each row, anywhere in
+        # longitude, so across the antimeridian too
+        rng = random.Random(0)
+        for row in ERRORS:
+            max_latitude, span, reach = row[:3]
+            for latitude in range(-max_latitude, max_latitude + 1, 5):
+                ruler = fast_ruler(latitude)
+                worst = [0, 0, 0]
+                for _ in range(100):
+                    a = [rng.uniform(-180, 180),
+                         latitude + rng.uniform(-span, span)]
+                    dist = rng.uniform(reach / 10.0, reach)
+                    heading = rng.uniform(-180, 180)
+                    b = destination(a, dist, heading, 'kilometers')
+                    if abs(b["coordinates"][1] - latitude) > span:
+                        continue
+
+                    exact = distance(a, b, 'kilometers')
+                    worst[0] = max(worst[0],
+                                   abs(ruler.distance(a, b) - exact) / exact)
+                    turn = (ruler.bearing(a, b) - bearing(a, b)) % 360
+                    worst[1] = max(worst[1], min(turn, 360 - turn))
+                    worst[2] = max(worst[2], distance(
+                        ruler.destination(a, dist, heading), b,
+                        'kilometers') / dist)
+
+                for error, bound in zip(worst, row[3:]):
+                    self.assertLessEqual(error, bound, "latitude {0}, span "
+                                         "{1}".format(latitude, span))
+
+    def test_antimeridian(self):
+        ruler = fast_ruler(10)
+        a = [179.9, 10]
+        b = [-179.9, 10.05]
+        self.assertAlmostEqual(ruler.distance(a, b),
+                               distance(a, b, 'kilometers'), 3)
+        line = {"type": "LineString", "coordinates": [a, b]}
+        snapped = ruler.point_on_line(line, [180, 10.1])
+        self.assertLess(abs(snapped["geometry"]["coordinates"][0]), 180.1)
+        self.assertGreater(abs(snapped["geometry"]["coordinates"][0]), 179.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,7 @@
+from packages import sample
+
+
+def bench(suite, size):
+    points = suite.points(size)
+
+    suite.add('sample', lambda: sample(points, max(size // 10, 1)))
@@ -30,9 +30,9 @@ def get_random_subarray(arr, size):
 
     while i > min:
         i -= 1
-        index = math.floor((i + 1) * random())
+        index = int(math.floor((i + 1) * random()))
         temp = shuffled[index]
         shuffled[index] = shuffled[i]
         shuffled[i] = temp
 
-    return shuffled.slice(min)
+    return shuffled[min:]
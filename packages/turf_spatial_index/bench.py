@@ -0,0 +1,21 @@
+from packages import point_index, spatial_index
+
+
+def bench(suite, size):
+    polygons = suite.polygons(size)
+    index = spatial_index(polygons)
+    points = suite.points(size)
+    depots = point_index(points)
+    targets = suite.points(100)
+    pt = suite.point()
+    window = [-1, -1, 1, 1]
+
+    suite.add('spatial_index', lambda: spatial_index(polygons))
+    suite.add('search', lambda: index.search(window))
+    suite.add('search_point', lambda: index.search_point(pt))
+    suite.add('point_index', lambda: point_index(points))
+    suite.add('nearest', lambda: depots.nearest(pt))
+    suite.add('k_nearest#10', lambda: depots.k_nearest(pt, 10))
+    suite.add('within_radius#100km',
+              lambda: depots.within_radius(pt, 100, 'kilometers'))
+    suite.add('nearest_many#100', lambda: depots.nearest_many(targets))
@@ -0,0 +1,516 @@
+from packages import bbox as feature_bbox
+from packages.turf_distance.index import _distance
+from packages.turf_helpers import distance_to_radians, scalar_math
+from packages.turf_invariant import get_coord
+from packages.turf_meta import is_packed
+from geojson import FeatureCollection
+from numbers import Number
+import heapq
+import math
+
+
+class SpatialIndex(object):
+    """
+    Static R-tree over the bounding boxes of a FeatureCollection,
+        bulk-loaded with Sort-Tile-Recursive packing.
+
+    Nodes live in flat per-coordinate lists, level by level from the
+    leaves (one entry per feature, in packing order) up to the root.
+    The children of a node are the ``node_size`` consecutive entries of
+    the level below starting at its ``refs`` value; for a leaf, ``refs``
+    holds the index of its feature.
+
+    :type   features:   FeatureCollection | list[Feature]
+    :param  features:   features to index
+    :type   node_size:  int
+    :param  node_size:  maximum number of children per node
+    """
+
+    def __init__(self, features, node_size=16):
+        if not isinstance(features, list):
+            features = features["features"]
+
+        self.features = features
+        self.node_size = node_size
+        self._load([feature_bbox(feature) for feature in features])
+
+    @classmethod
+    def from_boxes(cls, boxes, node_size=16):
+        # type: (list[list[Number]], int) -> SpatialIndex
+        """
+        Index bare bounding boxes rather than features
+
+        :type   boxes:      list[list[Number]]
+        :param  boxes:      extents in [minX, minY, maxX, maxY] order
+        :type   node_size:  int
+        :param  node_size:  maximum number of children per node
+        :rtype:             SpatialIndex
+        :return:            an index whose ids are positions in ``boxes``
+        """
+        index = cls.__new__(cls)
+        index.features = None
+        index.node_size = node_size
+        index._load(boxes)
+        return index
+
+    @classmethod
+    def from_arrays(cls, min_x, min_y, max_x, max_y, refs, levels,
+                    node_size=16, features=None):
+        # type: (...) -> SpatialIndex
+        """
+        Rebuild an index from the flat arrays of another one, as stored by
+            write_packed; numpy arrays are used as they are, without copying
+
+        :type   levels:     list[tuple[int, int]]
+        :param  levels:     (start, end) node range of each level,
+                            leaves first
+        :type   node_size:  int
+        :param  node_size:  node size the arrays were packed with
+        :type   features:   Any
+        :param  features:   the indexed features, if any
+        :rtype:             SpatialIndex
+        :return:            the index
+        """
+        index = cls.__new__(cls)
+        index.features = features
+        index.node_size = node_size
+        index.min_x = min_x
+        index.min_y = min_y
+        index.max_x = max_x
+        index.max_y = max_y
+        index.refs = refs
+        index.levels = [(int(start), int(end)) for start, end in levels]
+        return index
+
+    def __len__(self):
+        return self.levels[0][1] if self.levels else 0
+
+    def _load(self, boxes):
+        self.min_x = []
+        self.min_y = []
+        self.max_x = []
+        self.max_y = []
+        self.refs = []
+        self.levels = []
+
+        nodes = [(box[0], box[1], box[2], box[3], i)
+                 for i, box in enumerate(boxes)]
+        while nodes:
+            nodes = self._sort_tile(nodes)
+            start = len(self.refs)
+            for node in nodes:
+                self.min_x.append(node[0])
+                self.min_y.append(node[1])
+                self.max_x.append(node[2])
+                self.max_y.append(node[3])
+                self.refs.append(node[4])
+            self.levels.append((start, len(self.refs)))
+
+            if len(nodes) == 1:
+                break
+
+            parents = []
+            for k in range(0, len(nodes), self.node_size):
+                group = nodes[k:k + self.node_size]
+                parents.append((
+                    min(node[0] for node in group),
+                    min(node[1] for node in group),
+                    max(node[2] for node in group),
+                    max(node[3] for node in group),
+                    start + k
+                ))
+            nodes = parents
+
+    def _sort_tile(self, nodes):
+        # Sort-Tile-Recursive: cut the nodes into vertical slices by x
+        # center, then sort each slice by y center, so that consecutive
+        # runs of node_size nodes form compact tiles
+        if len(nodes) <= self.node_size:
+            return nodes
+
+        pages = int(math.ceil(len(nodes) / float(self.node_size)))
+        slice_size = int(math.ceil(math.sqrt(pages))) * self.node_size
+
+        nodes = sorted(nodes, key=lambda node: node[0] + node[2])
+        result = []
+        for k in range(0, len(nodes), slice_size):
+            result.extend(sorted(nodes[k:k + slice_size],
+                                 key=lambda node: node[1] + node[3]))
+        return result
+
+    def search(self, bbox):
+        # type: (list[Number]) -> list[int]
+        """
+        Find the features whose bounding box intersects ``bbox``
+
+        :type   bbox:   list[Number]
+        :param  bbox:   extent in [minX, minY, maxX, maxY] order
+        :rtype:         list[int]
+        :return:        indices of the matching features, in ascending order
+        """
+        if not self.levels:
+            return []
+
+        min_x, min_y, max_x, max_y = bbox[0], bbox[1], bbox[2], bbox[3]
+        result = []
+        level = len(self.levels) - 1
+        stack = [(start, level) for start in range(*self.levels[level])]
+        while stack:
+            node, level = stack.pop()
+            if self.max_x[node] < min_x or self.max_y[node] < min_y or \
+               self.min_x[node] > max_x or self.min_y[node] > max_y:
+                continue
+
+            if level == 0:
+                result.append(int(self.refs[node]))
+            else:
+                start = int(self.refs[node])
+                end = min(start + self.node_size, self.levels[level - 1][1])
+                stack.extend((child, level - 1)
+                             for child in range(start, end))
+
+        result.sort()
+        return result
+
+    def search_point(self, point):
+        # type: (Any) -> list[int]
+        """
+        Find the features whose bounding box contains ``point``
+
+        :type   point:  Any
+        :param  point:  a coordinate, a Point geometry or a Point Feature
+        :rtype:         list[int]
+        :return:        indices of the matching features, in ascending order
+        """
+        coord = get_coord(point)
+        return self.search([coord[0], coord[1], coord[0], coord[1]])
+
+    def candidates(self, point):
+        # type: (Any) -> list[Feature]
+        """
+        The features whose bounding box contains ``point``
+
+        :type   point:  Any
+        :param  point:  a coordinate, a Point geometry or a Point Feature
+        :rtype:         list[Feature]
+        :return:        matching features, in collection order
+        """
+        return [self.features[i] for i in self.search_point(point)]
+
+
+def spatial_index(features, node_size=16):
+    # type: (FeatureCollection, int) -> SpatialIndex
+    """
+    Bulk-load an STR-packed R-tree over the bounding boxes of features.
+    Packed collections hold one, read from the file for those opened with
+        read_packed, or built on first use and kept, which is returned as
+        is.
+
+    :type   features:   FeatureCollection | PackedCollection
+    :param  features:   features to index
+    :type   node_size:  int
+    :param  node_size:  maximum number of children per node
+    :rtype:             SpatialIndex
+    :return:            the index
+
+    @example
+    index = spatial_index(zones)
+    for i in index.search_point(ping):
+        if inside(ping, zones["features"][i]):
+            ...
+    """
+    if is_packed(features):
+        return features.index
+    return SpatialIndex(features, node_size)
+
+
+class PointIndex(object):
+    """
+    Static KD-tree over a set of points, for nearest neighbour and radius
+        queries on the sphere.
+
+    Points are stored as 3D unit vectors, where the straight-line (chord)
+    distance between two points grows monotonically with their great-circle
+    distance, so the tree can prune with plain axis-aligned splits and still
+    rank results exactly as the Haversine ``distance`` does. Ties are broken
+    by the position of the point in the input.
+
+    :type   points:     FeatureCollection | list
+    :param  points:     Point features, Point geometries or coordinates
+    :type   node_size:  int
+    :param  node_size:  largest range scanned linearly instead of split
+    """
+
+    def __init__(self, points, node_size=16):
+        if isinstance(points, dict):
+            points = points["features"]
+
+        self.features = points
+        self.node_size = max(node_size, 1)
+
+        # positions, with the cosines of their latitudes, to report the
+        # distances of turf_distance
+        self.positions = [_position(get_coord(point)) for point in points]
+        nodes = []
+        for i, position in enumerate(self.positions):
+            x, y, z = _unit_vector(position)
+            nodes.append((x, y, z, i))
+
+        # implicit tree: the median of each range splits it on the axis
+        # matching its depth, and both halves are laid out on either side
+        stack = [(0, len(nodes) - 1, 0)]
+        while stack:
+            left, right, axis = stack.pop()
+            if right - left < self.node_size:
+                continue
+
+            nodes[left:right + 1] = sorted(nodes[left:right + 1],
+                                           key=lambda node: node[axis])
+            middle = (left + right) >> 1
+            stack.append((left, middle - 1, (axis + 1) % 3))
+            stack.append((middle + 1, right, (axis + 1) % 3))
+
+        self.nodes = nodes
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def neighbours(self, target, k=None, radius=None, units="kilometers"):
+        # type: (Any, int, Number, str) -> list[tuple[int, float]]
+        """
+        Find the points closest to a target
+
+        :type   target: Any
+        :param  target: a coordinate, a Point geometry or a Point Feature
+        :type   k:      int
+        :param  k:      maximum number of points returned, unbounded if None
+        :type   radius: Number
+        :param  radius: maximum distance of the points returned, unbounded
+                        if None
+        :type   units:  str
+        :param  units:  units of ``radius`` and of the returned distances
+        :rtype:         list[tuple[int, float]]
+        :return:        (index, distance) pairs of the matching points,
+                        closest first
+        """
+        if k is not None and k < 1:
+            return []
+
+        max_d2 = float("inf")
+        if radius is not None:
+            angle = distance_to_radians(float(radius), units)
+            if angle < 0:
+                return []
+            if angle < math.pi:
+                max_d2 = (2 * math.sin(angle / 2)) ** 2
+
+        position = get_coord(target)
+        query = _unit_vector(_position(position))
+        nodes = self.nodes
+        node_size = self.node_size
+        # max-heap of the best candidates so far, worst on top
+        best = []
+
+        def visit(node):
+            dx = node[0] - query[0]
+            dy = node[1] - query[1]
+            dz = node[2] - query[2]
+            d2 = dx * dx + dy * dy + dz * dz
+            if d2 > max_d2:
+                return
+            if k is None:
+                best.append((-d2, -node[3]))
+            elif len(best) < k:
+                heapq.heappush(best, (-d2, -node[3]))
+            elif (-d2, -node[3]) > best[0]:
+                heapq.heapreplace(best, (-d2, -node[3]))
+
+        stack = [(0, len(nodes) - 1, 0, 0.0)]
+        while stack:
+            left, right, axis, bound = stack.pop()
+            if bound > max_d2:
+                continue
+            if k is not None and len(best) == k and bound > -best[0][0]:
+                continue
+
+            if right - left < node_size:
+                for i in range(left, right + 1):
+                    visit(nodes[i])
+                continue
+
+            middle = (left + right) >> 1
+            node = nodes[middle]
+            visit(node)
+
+            diff = query[axis] - node[axis]
+            near = (left, middle - 1)
+            far = (middle + 1, right)
+            if diff > 0:
+                near, far = far, near
+            # the far side is at least diff away along this axis; push it
+            # first so that the near side is searched, and tightens the
+            # bound, before it
+            stack.append((far[0], far[1], (axis + 1) % 3,
+                          max(bound, diff * diff)))
+            stack.append((near[0], near[1], (axis + 1) % 3, bound))
+
+        best.sort(reverse=True)
+        positions = self.positions
+        return [
+            (-i, _distance(scalar_math, position[0], position[1],
+                           positions[-i][0], positions[-i][1], units,
+                           positions[-i][2]))
+            for _, i in best
+        ]
+
+    def nearest(self, target):
+        # type: (Any) -> Feature
+        """
+        The point closest to a target
+
+        :type   target: Any
+        :param  target: a coordinate, a Point geometry or a Point Feature
+        :rtype:         Feature
+        :return:        the closest point, or None if the index is empty
+        """
+        found = self.neighbours(target, k=1)
+        return self.features[found[0][0]] if found else None
+
+    def k_nearest(self, target, k):
+        # type: (Any, int) -> FeatureCollection
+        """
+        The ``k`` points closest to a target
+
+        :type   target: Any
+        :param  target: a coordinate, a Point geometry or a Point Feature
+        :type   k:      int
+        :param  k:      number of points
+        :rtype:         FeatureCollection
+        :return:        the closest points, closest first
+        """
+        return FeatureCollection([
+            self.features[i] for i, _ in self.neighbours(target, k=k)
+        ])
+
+    def within_radius(self, target, radius, units="kilometers"):
+        # type: (Any, Number, str) -> FeatureCollection
+        """
+        The points within a distance of a target
+
+        :type   target: Any
+        :param  target: a coordinate, a Point geometry or a Point Feature
+        :type   radius: Number
+        :param  radius: maximum distance, inclusive
+        :type   units:  str
+        :param  units:  units of ``radius``
+        :rtype:         FeatureCollection
+        :return:        the matching points, closest first
+        """
+        return FeatureCollection([
+            self.features[i]
+            for i, _ in self.neighbours(target, radius=radius, units=units)
+        ])
+
+    def neighbours_many(self, targets, k=None, radius=None,
+                        units="kilometers"):
+        # type: (Any, int, Number, str) -> list[list[tuple[int, float]]]
+        """
+        ``neighbours`` of every target of a batch
+
+        :type   targets:    FeatureCollection | list
+        :param  targets:    Point features, Point geometries or coordinates
+        :rtype:             list[list[tuple[int, float]]]
+        :return:            the result of ``neighbours`` for each target
+        """
+        return [self.neighbours(target, k, radius, units)
+                for target in _targets(targets)]
+
+    def nearest_many(self, targets):
+        # type: (Any) -> list[Feature]
+        """
+        ``nearest`` of every target of a batch
+
+        :type   targets:    FeatureCollection | list
+        :param  targets:    Point features, Point geometries or coordinates
+        :rtype:             list[Feature]
+        :return:            the closest point to each target
+        """
+        return [self.nearest(target) for target in _targets(targets)]
+
+    def k_nearest_many(self, targets, k):
+        # type: (Any, int) -> list[FeatureCollection]
+        """
+        ``k_nearest`` of every target of a batch
+
+        :type   targets:    FeatureCollection | list
+        :param  targets:    Point features, Point geometries or coordinates
+        :type   k:          int
+        :param  k:          number of points per target
+        :rtype:             list[FeatureCollection]
+        :return:            the closest points to each target
+        """
+        return [self.k_nearest(target, k) for target in _targets(targets)]
+
+    def within_radius_many(self, targets, radius, units="kilometers"):
+        # type: (Any, Number, str) -> list[FeatureCollection]
+        """
+        ``within_radius`` of every target of a batch
+
+        :type   targets:    FeatureCollection | list
+        :param  targets:    Point features, Point geometries or coordinates
+        :type   radius:     Number
+        :param  radius:     maximum distance, inclusive
+        :type   units:      str
+        :param  units:      units of ``radius``
+        :rtype:             list[FeatureCollection]
+        :return:            the matching points for each target
+        """
+        return [self.within_radius(target, radius, units)
+                for target in _targets(targets)]
+
+
+def point_index(points, node_size=16):
+    # type: (FeatureCollection, int) -> PointIndex
+    """
+    Build a KD-tree over points for nearest neighbour and radius queries
+
+    :type   points:     FeatureCollection
+    :param  points:     Point features to index
+    :type   node_size:  int
+    :param  node_size:  largest range scanned linearly instead of split
+    :rtype:             PointIndex
+    :return:            the index
+
+    @example
+    depots = point_index(depot_points)
+    closest = depots.nearest(order)
+    nearby = depots.within_radius(order, 5, "kilometers")
+    """
+    return PointIndex(points, node_size)
+
+
+def _position(coord):
+    # longitude and latitude, in degrees, and the cosine of the latitude,
+    # as turf_distance computes it
+    return coord[0], coord[1], math.cos(math.pi / 180 * coord[1])
+
+
+def _unit_vector(position):
+    lon, lat, cos_lat = position
+    lon = math.radians(lon)
+    return cos_lat * math.cos(lon), cos_lat * math.sin(lon), \
+        math.sin(math.radians(lat))
+
+
+def _targets(targets):
+    if isinstance(targets, dict):
+        return targets["features"]
+    return targets
+
+
+__all__ = [
+    "PointIndex",
+    "SpatialIndex",
+    "point_index",
+    "spatial_index"
+]
@@ -0,0 +1,7 @@
+from packages import square
+
+
+def bench(suite, size):
+    boxes = [suite.coord() + suite.coord() for _ in range(size)]
+
+    suite.add('square', lambda: [square(box) for box in boxes])
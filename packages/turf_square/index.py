@@ -21,9 +21,9 @@ from packages import distance
 #
 # //=features
 def square(bbox):
-    horizontal_distance = distance(bbox.slice(0, 2), [bbox[2], bbox[1]],
+    horizontal_distance = distance(bbox[0:2], [bbox[2], bbox[1]],
                                    'miles')
-    vertical_distance = distance(bbox.slice(0, 2), [bbox[0], bbox[3]], 'miles')
+    vertical_distance = distance(bbox[0:2], [bbox[0], bbox[3]], 'miles')
     if horizontal_distance >= vertical_distance:
         vertical_midpoint = (bbox[1] + bbox[3]) / 2
         return [
@@ -0,0 +1,19 @@
+from packages import iter_square_grid, square_grid, square_grid_arrays
+
+
+def bench(suite, size):
+    bbox = suite.bbox()
+    # roughly `size` cells over a 10 degree box at the equator
+    cell = 1111.0 / size ** 0.5
+
+    def drain(cells):
+        count = 0
+        for _ in cells:
+            count += 1
+        return count
+
+    suite.add('square_grid', lambda: square_grid(bbox, cell, 'kilometers'))
+    suite.add('iter_square_grid',
+              lambda: drain(iter_square_grid(bbox, cell, 'kilometers')))
+    suite.add('square_grid_arrays',
+              lambda: square_grid_arrays(bbox, cell, 'kilometers'))
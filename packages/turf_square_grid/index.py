@@ -19,29 +19,95 @@ from packages import distance
 #
 # //=squareGrid
 def square_grid(bbox, cell_size, units):
-    fc = FeatureCollection([])
-    x_fraction = cell_size / distance(Point((bbox[0], bbox[1])),
-                                      Point((bbox[2], bbox[1])), units)
-    cell_width = x_fraction * (bbox[2] - bbox[0])
-    y_fraction = cell_size / distance(Point((bbox[0], bbox[1])),
-                                      Point((bbox[0], bbox[3])), units)
-    cell_height = y_fraction * (bbox[3] - bbox[1])
+    return FeatureCollection(list(iter_square_grid(bbox, cell_size, units)))
 
-    current_x = bbox[0]
-    while current_x <= bbox[2]:
-        current_y = bbox[1]
-        while current_y <= bbox[3]:
-            cell_poly = Polygon(([
+
+# Lazy variant of `squareGrid`: yields the same cells one at a time instead
+#   of collecting them, so that only one cell is alive at any time.
+#
+# @name iterSquareGrid
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize width of each cell
+# @param {string} [units=kilometers] used in calculating cellSize,
+#   can be degrees, radians, miles, or kilometers
+# @return {Iterator<Polygon>} the cells of the grid
+# @example
+# for (var cell of turf.iterSquareGrid([-96,31,-84,40], 10, 'miles')) {
+#   //=cell
+# }
+def iter_square_grid(bbox, cell_size, units):
+    xs, ys, cell_width, cell_height = grid_layout(bbox, cell_size, units)
+
+    for current_x in xs:
+        for current_y in ys:
+            yield Polygon(([
                 [current_x, current_y],
                 [current_x, current_y + cell_height],
                 [current_x + cell_width, current_y + cell_height],
                 [current_x + cell_width, current_y],
                 [current_x, current_y]
             ],))
-            fc["features"].append(cell_poly)
 
-            current_y += cell_height
 
+# Columnar variant of `squareGrid`: the same cells, in the same order, as
+#   numpy arrays rather than GeoJSON objects. Values are those the Polygons
+#   are built from, before geojson rounds them to its output precision.
+#
+# @name squareGridArrays
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize width of each cell
+# @param {string} [units=kilometers] used in calculating cellSize,
+#   can be degrees, radians, miles, or kilometers
+# @return {Array<numpy.ndarray>} the (n, 2) cell centres and the (n, 5, 2)
+#   closed rings of the cells
+# @example
+# var [centres, rings] = turf.squareGridArrays([-96,31,-84,40], 10, 'miles');
+def square_grid_arrays(bbox, cell_size, units):
+    import numpy as np
+
+    xs, ys, cell_width, cell_height = grid_layout(bbox, cell_size, units)
+    x = np.repeat(np.array(xs, dtype=np.float64), len(ys))
+    y = np.tile(np.array(ys, dtype=np.float64), len(xs))
+    right = x + cell_width
+    top = y + cell_height
+
+    rings = np.empty((len(x), 5, 2), dtype=np.float64)
+    rings[:, 0] = rings[:, 4] = np.column_stack((x, y))
+    rings[:, 1] = np.column_stack((x, top))
+    rings[:, 2] = np.column_stack((right, top))
+    rings[:, 3] = np.column_stack((right, y))
+    centres = np.column_stack((x + cell_width / 2, y + cell_height / 2))
+    return centres, rings
+
+
+# Computes where the cells of `square_grid(bbox, cell_size, units)` go,
+#   without building them: the grid has one column per x and one row per y,
+#   and its cells are listed column by column, each from south to north.
+#
+# @name grid_layout
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize width of each cell
+# @param {string} [units=kilometers] used in calculating cellSize
+# @return {Array} the x of the west side of each column, the y of the south
+#   side of each row, and the width and height of a cell, in degrees
+def grid_layout(bbox, cell_size, units):
+    x_fraction = cell_size / distance(Point((bbox[0], bbox[1])),
+                                      Point((bbox[2], bbox[1])), units)
+    cell_width = x_fraction * (bbox[2] - bbox[0])
+    y_fraction = cell_size / distance(Point((bbox[0], bbox[1])),
+                                      Point((bbox[0], bbox[3])), units)
+    cell_height = y_fraction * (bbox[3] - bbox[1])
+
+    xs = []
+    current_x = bbox[0]
+    while current_x <= bbox[2]:
+        xs.append(current_x)
         current_x += cell_width
 
-    return fc
+    ys = []
+    current_y = bbox[1]
+    while current_y <= bbox[3]:
+        ys.append(current_y)
+        current_y += cell_height
+
+    return xs, ys, cell_width, cell_height
@@ -0,0 +1,16 @@
+from packages import read_features
+import io
+import json
+
+
+def bench(suite, size):
+    points = suite.points(size, properties=lambda i: {'name': str(i)})
+    data = json.dumps(points).encode('utf-8')
+    window = [-1, -1, 1, 1]
+
+    suite.add('read_features',
+              lambda: sum(1 for _ in read_features(io.BytesIO(data))))
+    suite.add('read_features#bbox',
+              lambda: sum(1 for _ in read_features(io.BytesIO(data),
+                                                   window)))
+    suite.add('json.loads', lambda: len(json.loads(data)['features']))
@@ -0,0 +1,228 @@
+from packages import bbox as feature_bbox
+from numbers import Number
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+_STRING = re.compile(r'["\\]')
+_LITERAL_END = re.compile(r'[,}\] \t\n\r]')
+_DECODER = json.JSONDecoder()
+
+
+def read_features(fp, bbox=None, chunk_size=65536):
+    # type: (IO, list[Number], int) -> Iterator[dict]
+    """
+    Read the features of a GeoJSON FeatureCollection from a file-like
+        object one at a time, without loading the whole document.
+
+    Memory use is bounded by the largest single feature plus ``chunk_size``:
+    each feature is decoded with ``json`` straight from the read buffer, and
+    the rest of the document is scanned without being kept.
+    A top-level JSON array of features is read the same way.
+
+    Features are plain dicts, in document order.
+
+    :type   fp:         IO
+    :param  fp:         an open file, in text or binary (UTF-8) mode
+    :type   bbox:       list[Number]
+    :param  bbox:       extent in [minX, minY, maxX, maxY] order; when given,
+                        only the features whose bounding box intersects it
+                        are yielded (features without geometry never are)
+    :type   chunk_size: int
+    :param  chunk_size: number of bytes or characters read at a time
+    :rtype:             Iterator[dict]
+    :return:            a generator of features
+    :raises ValueError: when the document is not a FeatureCollection or
+                        an array, or is truncated
+
+    @example
+    with open("pings.geojson", "rb") as f:
+        zones = tag(read_features(f), districts, "name", "district")
+    """
+    reader = _Reader(fp, chunk_size)
+
+    for feature in reader.features():
+        if bbox is not None:
+            extent = feature_bbox(feature)
+            if extent[0] > bbox[2] or extent[1] > bbox[3] or \
+               extent[2] < bbox[0] or extent[3] < bbox[1]:
+                continue
+        yield feature
+
+
+class _Reader(object):
+    # A pull scanner over the text of a JSON document. `buffer` holds the
+    # unread text, from `pos` on, plus whatever is before it from `mark`
+    # on, when the text of a value is being kept.
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = None
+        self.buffer = ""
+        self.pos = 0
+        self.mark = None
+
+    def features(self):
+        char = self._next()
+        if char == "[":
+            for feature in self._elements():
+                yield feature
+            return
+
+        if char != "{":
+            raise ValueError("Expected a FeatureCollection or an array")
+
+        while True:
+            char = self._next()
+            if char == "}":
+                raise ValueError("FeatureCollection without features")
+            if char == ",":
+                continue
+            if char != '"':
+                raise ValueError("Malformed GeoJSON")
+
+            self.pos -= 1
+            key = json.loads(self._value(keep=True))
+            if self._next() != ":":
+                raise ValueError("Malformed GeoJSON")
+
+            if key != "features":
+                self._value(keep=False)
+                continue
+
+            if self._next() != "[":
+                raise ValueError("features must be an array")
+            for feature in self._elements():
+                yield feature
+            return
+
+    def _elements(self):
+        # the opening bracket has been consumed
+        if self._peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self._decode()
+            char = self._next()
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError("Malformed GeoJSON")
+
+    def _read(self, size=None):
+        # append a chunk to the buffer, dropping the text no longer needed
+        chunk = self.fp.read(size or self.chunk_size)
+        if not chunk:
+            return False
+
+        if not isinstance(chunk, type(self.buffer)):
+            if isinstance(chunk, bytes):
+                # binary file under Python 3
+                if self.decoder is None:
+                    self.decoder = codecs.getincrementaldecoder("utf-8")()
+                chunk = self.decoder.decode(chunk)
+            else:
+                # text file under Python 2
+                self.buffer = self.buffer.decode("utf-8")
+
+        start = self.pos if self.mark is None else self.mark
+        self.buffer = self.buffer[start:] + chunk
+        self.pos -= start
+        if self.mark is not None:
+            self.mark = 0
+        return True
+
+    def _peek(self):
+        # the next non-whitespace character, without consuming it
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read():
+                return ""
+
+    def _next(self):
+        char = self._peek()
+        if not char:
+            raise ValueError("Unexpected end of GeoJSON")
+        self.pos += 1
+        return char
+
+    def _search(self, pattern):
+        # move past the next match of pattern, reading as needed
+        while True:
+            match = pattern.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.end()
+                return match.group()
+            self.pos = len(self.buffer)
+            if not self._read():
+                raise ValueError("Unexpected end of GeoJSON")
+
+    def _string(self):
+        # the opening quote has been consumed
+        while True:
+            if self._search(_STRING) == '"':
+                return
+            # skip the escaped character
+            while self.pos >= len(self.buffer):
+                if not self._read():
+                    raise ValueError("Unexpected end of GeoJSON")
+            self.pos += 1
+
+    def _decode(self):
+        # decode the value starting at pos straight from the buffer; one
+        # that does not decode there, because it runs past the buffer or is
+        # malformed, is delimited first, reading up to its end only, and
+        # decoded once
+        self._peek()
+        try:
+            value, end = _DECODER.raw_decode(self.buffer, self.pos)
+        except ValueError:
+            return json.loads(self._value(keep=True))
+        self.pos = end
+        return value
+
+    def _value(self, keep):
+        char = self._peek()
+        if not char:
+            raise ValueError("Unexpected end of GeoJSON")
+        if keep:
+            self.mark = self.pos
+        self.pos += 1
+
+        if char == '"':
+            self._string()
+        elif char in "{[":
+            depth = 1
+            while depth:
+                char = self._search(_STRUCTURE)
+                if char == '"':
+                    self._string()
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+        else:
+            while True:
+                match = _LITERAL_END.search(self.buffer, self.pos)
+                if match:
+                    self.pos = match.start()
+                    break
+                self.pos = len(self.buffer)
+                if not self._read():
+                    break
+
+        if keep:
+            text = self.buffer[self.mark:self.pos]
+            self.mark = None
+            return text
+
+
+__all__ = [
+    "read_features"
+]
@@ -0,0 +1,21 @@
+from packages.turf_parallel import JoinExecutor
+from packages import tag, spatial_index
+
+
+def bench(suite, size):
+    points = suite.points(size)
+    polygons = suite.polygons(max(size // 10, 1),
+                              properties=lambda i: {'zone': i})
+    index = spatial_index(polygons)
+    # started once, outside the timings, as a long running service would,
+    # by a join of one point; stopped once the cases are done
+    executor = JoinExecutor(4)
+    list(executor.contained(points["features"][:1], polygons))
+    suite.cleanup(executor.close)
+
+    suite.add('tag', lambda: tag(points, polygons, 'zone', 'zone'))
+    suite.add('tag#indexed',
+              lambda: tag(points, polygons, 'zone', 'zone', index))
+    suite.add('tag#workers=4',
+              lambda: tag(points, polygons, 'zone', 'zone',
+                          workers=executor))
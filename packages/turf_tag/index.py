@@ -1,16 +1,29 @@
 from packages import inside
-import json
+from packages.turf_meta import copy_feature, feature_table, iter_features
+from packages.turf_parallel import iter_contained
+from packages.turf_spatial_index import spatial_index
+from geojson import FeatureCollection
 
 # Takes a set of {@link Point|points} and a set of {@link Polygon|polygons}
 #   and performs a spatial join.
 #
 # @name tag
-# @param {FeatureCollection<Point>} points input points
-# @param {FeatureCollection<Polygon>} polygons input polygons
+# @param {FeatureCollection<Point>|Iterable<Feature<Point>>} points input
+#   points, or a stream of them such as `read_features` returns
+# @param {FeatureCollection<Polygon>|PackedCollection} polygons input
+#   polygons
 # @param {string} field property in `polygons` to add to joined {<Point>}
 #    features
 # @param {string} outField property in `points` in which to store
 #   joined property from `polygons`
+# @param {SpatialIndex} [index] spatial index of `polygons`, to reuse across
+#   calls; built on the fly when omitted
+# @param {number|JoinExecutor} [workers] number of processes to run the join
+#   on, or a `JoinExecutor` to reuse across calls; the index is then built
+#   by each process instead
+# @param {boolean} [inplace=false] tag the points of `points` themselves,
+#   rather than copies; otherwise the points are copied with new properties
+#   dicts, sharing their geometries with `points`
 # @return {FeatureCollection<Point>} points with `containingPolyId`
 #   property containing values from `polyId`
 # @example
@@ -39,17 +52,82 @@ import json
 #
 # //=tagged
 #
-def tag(points, polygons, field, out_field):
-    # prevent mutations
-    points = json.loads(json.dumps(points))
-    polygons = json.loads(json.dumps(polygons))
-    for pt in points["features"]:
-        if not pt.properties:
-            pt.properties = {}
-
-        for poly in polygons["features"]:
-            if pt.properties[out_field] is None:
-                is_inside = inside(pt, poly)
-                if is_inside:
-                    pt.properties[out_field] = poly.properties[field]
+def tag(points, polygons, field, out_field, index=None, workers=None,
+        inplace=False):
+    if not isinstance(points, dict):
+        return FeatureCollection(list(iter_tag(
+            points, polygons, field, out_field, index, workers, inplace
+        )))
+
+    if not inplace:
+        # prevent mutations: only the properties dicts are written to
+        points = dict(points)
+        points["features"] = [copy_feature(pt) for pt in points["features"]]
+    for pt, matches in _matches(points, polygons, index, workers):
+        _tag(pt, matches, field, out_field)
     return points
+
+
+# Streaming variant of `tag`: takes the points as any iterable and yields
+#   a tagged copy of each one as it is read, so that only the polygons are
+#   held in memory.
+#
+# @name iter_tag
+# @param {FeatureCollection<Point>|Iterable<Feature<Point>>} points input
+#   points
+# @param {FeatureCollection<Polygon>|PackedCollection} polygons input
+#   polygons
+# @param {string} field property in `polygons` to add to joined {<Point>}
+#    features
+# @param {string} outField property in `points` in which to store
+#   joined property from `polygons`
+# @param {SpatialIndex} [index] spatial index of `polygons`
+# @param {number|JoinExecutor} [workers] number of processes to run the join
+#   on, or a `JoinExecutor` to reuse across calls
+# @param {boolean} [inplace=false] tag the points themselves, rather than
+#   copies sharing their geometries
+# @return {Iterator<Feature<Point>>} tagged points, in input order
+# @example
+# var tagged = turf.iter_tag(turf.read_features(file), zones,
+#                            'name', 'zone');
+#
+def iter_tag(points, polygons, field, out_field, index=None, workers=None,
+             inplace=False):
+    points = iter_features(points)
+    if not inplace:
+        # prevent mutations: only the properties dicts are written to
+        points = (copy_feature(pt) for pt in points)
+    for pt, matches in _matches(points, polygons, index, workers):
+        _tag(pt, matches, field, out_field)
+        yield pt
+
+
+def _matches(points, polygons, index, workers):
+    # each point, with the polygons it lands within, in index order; tested
+    # lazily on the serial path, so that _tag can stop at the first match
+    # the polygons are only ever read from, and are not copied
+    features = feature_table(polygons)
+    if workers is not None:
+        for pt, polygon_ids in iter_contained(points, polygons, workers):
+            yield pt, [features[i] for i in polygon_ids]
+        return
+
+    if index is None:
+        index = spatial_index(polygons)
+
+    for pt in iter_features(points):
+        yield pt, (features[i] for i in index.search_point(pt)
+                   if inside(pt, features[i]))
+
+
+def _tag(pt, matches, field, out_field):
+    if not pt["properties"]:
+        pt["properties"] = {}
+    if pt["properties"].get(out_field) is not None:
+        return
+
+    for poly in matches:
+        pt["properties"][out_field] = poly["properties"][field]
+        if pt["properties"][out_field] is not None:
+            break
+
@@ -0,0 +1,11 @@
+from packages import delaunay, tin
+
+
+def bench(suite, size):
+    points = suite.points(size, properties=lambda i: {
+        'elevation': suite.random.uniform(0, 100)
+    })
+
+    suite.add('tin', lambda: tin(points, None))
+    suite.add('tin#z', lambda: tin(points, 'elevation'))
+    suite.add('delaunay', lambda: delaunay(points))
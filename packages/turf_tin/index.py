@@ -1,6 +1,8 @@
 # http://en.wikipedia.org/wiki/Delaunay_triangulation
-# https://github.com/ironwallaby/delaunay
-from geojson import FeatureCollection, Polygon
+# https://github.com/mapbox/delaunator
+from packages.turf_invariant import get_coord
+from geojson import Feature, FeatureCollection, Polygon
+import math
 
 # Takes a set of {@link Point|points} and the name of a z-value property and
 # creates a [Triangulated Irregular Network](http://en.wikipedia.org/wiki/Triangulated_irregular_network),
@@ -15,6 +17,8 @@ from geojson import FeatureCollection, Polygon
 # @param {FeatureCollection<Point>} points input points
 # @param {String=} z name of the property from which to pull z values
 # This is optional: if not given, then there will be no extra data added to the derived triangles.
+# @param {Delaunay=} triangulation `delaunay(points)`, when it was already
+#   computed
 # @return {FeatureCollection<Polygon>} TIN output
 #
 # @example
@@ -41,191 +45,446 @@ from geojson import FeatureCollection, Polygon
 # }
 # //=tin
 #
-def tin (points, z):
-    # (dict, str) -> FeatureCollection
-    def mapping1(p):
-        point = {
-            "x": p["geometry"]["coordinates"][0],
-            "y": p["geometry"]["coordinates"][1]
-        }
+def tin(points, z=None, triangulation=None):
+    # (dict, str, Delaunay) -> FeatureCollection
+    features = points["features"]
+    if triangulation is None:
+        triangulation = delaunay(points)
+
+    coords = [feature["geometry"]["coordinates"] for feature in features]
+    triangles = triangulation.triangles
+    result = []
+    for t in range(0, len(triangles), 3):
+        a, b, c = triangles[t], triangles[t + 1], triangles[t + 2]
+        properties = {}
         if z:
-            point["z"] = p["properties"][z]
-        return point
-
-    def mapping2(triangle):
-        return Polygon(([
-            [triangle.a["x"], triangle.a["y"]],
-            [triangle.b["x"], triangle.b["y"]],
-            [triangle.c["x"], triangle.c["y"]],
-            [triangle.a["x"], triangle.a["y"]]
-        ],), None, {
-            "a": triangle.a["z"],
-            "b": triangle.b["z"],
-            "c": triangle.c["z"]
-        })
-    # break down points
-    return FeatureCollection(
-        map(mapping2, triangulate(map(mapping1, points["features"])))
-    )
-
-class Triangle(object):
-    def __init__(self, a, b, c):
-        self.a = a
-        self.b = b
-        self.c = c
-
-        aa = b["x"] - a["x"]
-        bb = b["y"] - a["y"]
-        cc = c["x"] - a["x"]
-        dd = c["y"] - a["y"]
-        ee = aa * (a["x"] + b["x"]) + bb * (a["y"] + b["y"])
-        ff = cc * (a["x"] + c["x"]) + dd * (a["y"] + c["y"])
-        gg = 2 * (aa * (c["y"] - b["y"]) - bb * (c["x"] - b["x"]))
-
-        # If the points of the triangle are collinear, then just find the
-        # extremes and use the midpoint as the center of the circumcircle.
-        self.x = (dd * ee - bb * ff) / gg
-        self.y = (aa * ff - cc * ee) / gg
-        dx = self.x - a["x"]
-        dy = self.y - a["y"]
-        self.r = dx * dx + dy * dy
-
-
-def dedup(edges):
-    j = len(edges)
-
-    flag = False
-    while j:
-        j -= 1
-        b = edges[j]
-        j -= 1
-        a = edges[j]
-        i = j
-        while i:
-            i -= 1
-            n = edges[i]
-            i -= 1
-            m = edges[i]
-            if (a == m and b == n) or (a == n and b == m):
-                edges.splice(j, 2)
-                edges.splice(i, 2)
-                j -= 2
-                flag = True
-            if flag:
-                break
-        if flag:
-            continue
-
-def triangulate(vertices):
-    # Bail if there aren't enough vertices to form any triangles.
-    if len(vertices) < 3:
-        return []
-
-    # Ensure the vertex array is in order of descending X coordinate
-    # (which is needed to ensure a subquadratic runtime), and then find
-    # the bounding box around the points.
-    vertices.sort(lambda (v1, v2): v2["x"] - v1["x"])
-
-    i = len(vertices) - 1
-    xmin = vertices[i]["x"]
-    xmax = vertices[0]["x"]
-    ymin = vertices[i]["y"]
-    ymax = ymin
-    epsilon = 1e-12
-
-
-    while i:
-        i -= 1
-        if vertices[i]["y"] < ymin:
-            ymin = vertices[i]["y"]
-        if vertices[i]["y"] > ymax:
-            ymax = vertices[i]["y"]
-
-    # Find a supertriangle, which is a triangle that surrounds all the
-    # vertices. This is used like something of a sentinel value to remove
-    # cases in the main algorithm, and is removed before we return any results.
-
-    # Once found, put it in the "open" list. (The "open" list is for
-    # triangles who may still need to be considered; the "closed" list is
-    # for triangles which do not.)
-    dx = xmax - xmin
-    dy = ymax - ymin
-    d_max = dx if (dx > dy) else dy
-    x_mid = (xmax + xmin) * 0.5
-    y_mid = (ymax + ymin) * 0.5
-    open_set = [
-        Triangle({"x": x_mid - 20 * d_max,  "y": y_mid - d_max,
-                  "__sentinel": True},
-                 {"x": x_mid,               "y": y_mid + 20 * d_max,
-                  "__sentinel": True},
-                 {"x": x_mid + 20 * d_max,  "y": y_mid - d_max,
-                  "__sentinel": True})
-    ]
-    closed_set = []
-
-    # Incrementally add each vertex to the mesh.
-    i = len(vertices)
-    while i:
-        i -= 1
-        # For each open triangle, check to see if the current point is
-        # inside it's circumcircle. If it is, remove the triangle and add
-        # it's edges to an edge list.
-        edges = []
-        j = len(open_set)
-        while j:
-            j -= 1
-            # If this point is to the right of this triangle's circumcircle,
-            # then this triangle should never get checked again. Remove it
-            # from the open list, add it to the closed list, and skip.
-            dx = vertices[i].x - open_set[j].x
-            if dx > 0 and dx * dx > open_set[j].r:
-                closed_set.append(open_set[j])
-                open_set.pop(j)
+            properties = {
+                "a": features[a]["properties"][z],
+                "b": features[b]["properties"][z],
+                "c": features[c]["properties"][z]
+            }
+        result.append(Feature(
+            geometry=Polygon([[
+                [coords[a][0], coords[a][1]],
+                [coords[b][0], coords[b][1]],
+                [coords[c][0], coords[c][1]],
+                [coords[a][0], coords[a][1]]
+            ]]),
+            properties=properties
+        ))
+    return FeatureCollection(result)
+
+
+# Computes the Delaunay triangulation of a set of points, as flat index
+#   arrays rather than GeoJSON, with the sweep-hull algorithm of
+#   [Delaunator](https://github.com/mapbox/delaunator): points are added in
+#   order of distance from a seed triangle, each one is connected to the
+#   visible part of the convex hull, and the new edges are legalized by
+#   flipping. Expected running time is O(n log n).
+#
+# Points closer than 2^-52 to the previous one in sweep order are dropped as
+#   duplicates; if all the points are collinear there are no triangles and
+#   `hull` lists the points in order along the line.
+#
+# @name delaunay
+# @param {FeatureCollection<Point>|Array<Array<number>>} points input points
+# @return {Delaunay} the triangulation, whose indices refer to `points`
+# @example
+# var mesh = turf.delaunay(points);
+#
+# // vertices of the first triangle
+# var a = mesh.triangles[0], b = mesh.triangles[1], c = mesh.triangles[2];
+#
+# // triangle on the other side of its first edge, or -1 on the hull
+# var across = mesh.adjacency()[0];
+#
+def delaunay(points):
+    if isinstance(points, dict):
+        points = points["features"]
+
+    coords = []
+    for point in points:
+        coord = get_coord(point)
+        coords.append(float(coord[0]))
+        coords.append(float(coord[1]))
+    return Delaunay(coords)
+
+
+EPSILON = math.pow(2, -52)
+
+
+# A Delaunay triangulation, see `delaunay`.
+#
+# `triangles` holds three vertex indices per triangle, clockwise;
+# `halfedges[e]` is the half-edge opposite to half-edge `e` (the edge from
+#   `triangles[e]` to the next vertex of its triangle) in the adjacent
+#   triangle, or -1 on the convex hull;
+# `hull` lists the vertices of the convex hull, clockwise.
+class Delaunay(object):
+    def __init__(self, coords):
+        self.coords = coords
+        n = len(coords) >> 1
+
+        max_triangles = max(2 * n - 5, 0)
+        self.triangles = [0] * (max_triangles * 3)
+        self.halfedges = [0] * (max_triangles * 3)
+        self.triangles_len = 0
+
+        self.hash_size = int(math.ceil(math.sqrt(n)))
+        self.hull_prev = [0] * n
+        self.hull_next = [0] * n
+        self.hull_tri = [0] * n
+        self.hull_hash = [-1] * self.hash_size
+        self.hull_start = 0
+        self.hull = []
+
+        if n:
+            self._triangulate(n)
+
+        del self.triangles[self.triangles_len:]
+        del self.halfedges[self.triangles_len:]
+
+    def adjacency(self):
+        # the triangle across each half-edge, or -1 on the hull
+        return [e // 3 if e != -1 else -1 for e in self.halfedges]
+
+    def _triangulate(self, n):
+        coords = self.coords
+        hull_prev = self.hull_prev
+        hull_next = self.hull_next
+        hull_tri = self.hull_tri
+        hull_hash = self.hull_hash
+
+        xs = coords[0::2]
+        ys = coords[1::2]
+        cx = (min(xs) + max(xs)) / 2
+        cy = (min(ys) + max(ys)) / 2
+
+        # seed triangle: the point closest to the center of the bbox, the
+        # point closest to it, and the third point forming the smallest
+        # circumcircle with them
+        i0 = min(range(n), key=lambda i: _dist(cx, cy, xs[i], ys[i]))
+        i0x, i0y = xs[i0], ys[i0]
+
+        i1 = -1
+        min_dist = float("inf")
+        for i in range(n):
+            if i == i0:
                 continue
+            d = _dist(i0x, i0y, xs[i], ys[i])
+            if 0 < d < min_dist:
+                i1 = i
+                min_dist = d
+
+        i2 = -1
+        min_radius = float("inf")
+        if i1 != -1:
+            i1x, i1y = xs[i1], ys[i1]
+            for i in range(n):
+                if i == i0 or i == i1:
+                    continue
+                r = _circumradius(i0x, i0y, i1x, i1y, xs[i], ys[i])
+                if r < min_radius:
+                    i2 = i
+                    min_radius = r
+
+        if i2 == -1:
+            # every point is on a line (or on a single spot): no triangles,
+            # and the hull is the points sorted along the line
+            dists = [(xs[i] - xs[0]) or (ys[i] - ys[0]) for i in range(n)]
+            d0 = -float("inf")
+            for i in sorted(range(n), key=lambda i: dists[i]):
+                if dists[i] > d0:
+                    self.hull.append(i)
+                    d0 = dists[i]
+            return
+
+        i2x, i2y = xs[i2], ys[i2]
+        # make the seed triangle clockwise
+        if _orient(i0x, i0y, i1x, i1y, i2x, i2y):
+            i1, i2 = i2, i1
+            i1x, i1y, i2x, i2y = i2x, i2y, i1x, i1y
+
+        self.cx, self.cy = _circumcenter(i0x, i0y, i1x, i1y, i2x, i2y)
+        ccx, ccy = self.cx, self.cy
+        ids = sorted(range(n), key=lambda i: _dist(ccx, ccy, xs[i], ys[i]))
+
+        # the hull starts as the seed triangle
+        self.hull_start = i0
+        hull_size = 3
+        hull_next[i0] = hull_prev[i2] = i1
+        hull_next[i1] = hull_prev[i0] = i2
+        hull_next[i2] = hull_prev[i1] = i0
+        hull_tri[i0] = 0
+        hull_tri[i1] = 1
+        hull_tri[i2] = 2
+        hull_hash[self._hash_key(i0x, i0y)] = i0
+        hull_hash[self._hash_key(i1x, i1y)] = i1
+        hull_hash[self._hash_key(i2x, i2y)] = i2
+
+        self._add_triangle(i0, i1, i2, -1, -1, -1)
+
+        xp = yp = None
+        for k, i in enumerate(ids):
+            x, y = xs[i], ys[i]
+
+            # skip near-duplicate points
+            if k > 0 and abs(x - xp) <= EPSILON and abs(y - yp) <= EPSILON:
+                continue
+            xp, yp = x, y
+
+            # skip the seed triangle points
+            if i == i0 or i == i1 or i == i2:
+                continue
+
+            # find a visible edge on the convex hull using the edge hash
+            start = 0
+            key = self._hash_key(x, y)
+            for j in range(self.hash_size):
+                start = hull_hash[(key + j) % self.hash_size]
+                if start != -1 and start != hull_next[start]:
+                    break
+
+            start = hull_prev[start]
+            e = start
+            while True:
+                q = hull_next[e]
+                if _orient(x, y, xs[e], ys[e], xs[q], ys[q]):
+                    break
+                e = q
+                if e == start:
+                    e = -1
+                    break
+
+            if e == -1:
+                # likely a near-duplicate point; skip it
+                continue
+
+            # add the first triangle from the point
+            t = self._add_triangle(e, i, hull_next[e], -1, -1, hull_tri[e])
+
+            # recursively flip triangles from the point until they satisfy
+            # the Delaunay condition
+            hull_tri[i] = self._legalize(t + 2)
+            hull_tri[e] = t
+            hull_size += 1
+
+            # walk forward through the hull, adding more triangles and
+            # flipping recursively
+            f = hull_next[e]
+            while True:
+                q = hull_next[f]
+                if not _orient(x, y, xs[f], ys[f], xs[q], ys[q]):
+                    break
+                t = self._add_triangle(f, i, q, hull_tri[i], -1, hull_tri[f])
+                hull_tri[i] = self._legalize(t + 2)
+                # mark as removed
+                hull_next[f] = f
+                hull_size -= 1
+                f = q
 
-            # If not, skip this triangle.
-            dy = vertices[i]["y"] - open_set[j].y
-            if dx * dx + dy * dy > open_set[j].r:
+            # walk backward from the other side, adding more triangles and
+            # flipping
+            if e == start:
+                while True:
+                    q = hull_prev[e]
+                    if not _orient(x, y, xs[q], ys[q], xs[e], ys[e]):
+                        break
+                    t = self._add_triangle(q, i, e, -1, hull_tri[e],
+                                           hull_tri[q])
+                    self._legalize(t + 2)
+                    hull_tri[q] = t
+                    # mark as removed
+                    hull_next[e] = e
+                    hull_size -= 1
+                    e = q
+
+            # update the hull indices
+            self.hull_start = hull_prev[i] = e
+            hull_next[e] = hull_prev[f] = i
+            hull_next[i] = f
+
+            # save the two new edges in the hash table
+            hull_hash[self._hash_key(x, y)] = i
+            hull_hash[self._hash_key(xs[e], ys[e])] = e
+
+        e = self.hull_start
+        for _ in range(hull_size):
+            self.hull.append(e)
+            e = hull_next[e]
+
+    def _hash_key(self, x, y):
+        return int(math.floor(
+            _pseudo_angle(x - self.cx, y - self.cy) * self.hash_size
+        )) % self.hash_size
+
+    def _legalize(self, a):
+        coords = self.coords
+        triangles = self.triangles
+        halfedges = self.halfedges
+        stack = []
+
+        while True:
+            b = halfedges[a]
+
+            # if the pair of triangles doesn't satisfy the Delaunay
+            # condition (p1 is inside the circumcircle of [p0, pl, pr]),
+            # flip them, then do the same check for the new pair of
+            # triangles
+            #
+            #           pl                    pl
+            #          /||\                  /  \
+            #       al/ || \bl            al/    \a
+            #        /  ||  \              /      \
+            #       /  a||b  \    flip    /___ar___\
+            #     p0\   ||   /p1   =>   p0\---bl---/p1
+            #        \  ||  /              \      /
+            #       ar\ || /br             b\    /br
+            #          \||/                  \  /
+            #           pr                    pr
+            a0 = a - a % 3
+            ar = a0 + (a + 2) % 3
+
+            if b == -1:
+                # convex hull edge
+                if not stack:
+                    break
+                a = stack.pop()
                 continue
 
-            # Remove the triangle and add it's edges to the edge list.
-            edges += [
-                open_set[j].a, open_set[j].b,
-                open_set[j].b, open_set[j].c,
-                open_set[j].c, open_set[j].a
-            ]
-            open_set.pop(j)
-
-        # Remove any doubled edges.
-        dedup(edges)
-
-        # Add a new triangle for each edge.
-        j = len(edges)
-        while j:
-            j -= 1
-            b = edges[j]
-            j -= 1
-            a = edges[j]
-            c = vertices[i]
-            # Avoid adding colinear triangles
-            #   (which have error-prone circumcircles)
-            aa = b["x"] - a["x"]
-            bb = b["y"] - a["y"]
-            gg = 2 * (aa * (c["y"] - b["y"]) - bb * (c["x"] - b["x"]))
-            if abs(gg) > epsilon:
-                open_set.append(Triangle(a, b, c))
-
-    # Copy any remaining open triangles to the closed list, and then
-    # remove any triangles that share a vertex with the supertriangle.
-    for triangle in open_set:
-        closed_set.append(triangle)
-
-    i = len(closed_set)
-    while i:
-        i -= 1
-        if closed_set[i].a["__sentinel"] or \
-           closed_set[i].b["__sentinel"] or \
-           closed_set[i].c["__sentinel"]:
-            closed_set.pop(i)
-
-    return closed_set
+            b0 = b - b % 3
+            al = a0 + (a + 1) % 3
+            bl = b0 + (b + 2) % 3
+
+            p0 = triangles[ar]
+            pr = triangles[a]
+            pl = triangles[al]
+            p1 = triangles[bl]
+
+            illegal = _in_circle(
+                coords[2 * p0], coords[2 * p0 + 1],
+                coords[2 * pr], coords[2 * pr + 1],
+                coords[2 * pl], coords[2 * pl + 1],
+                coords[2 * p1], coords[2 * p1 + 1]
+            )
+
+            if illegal:
+                triangles[a] = p1
+                triangles[b] = p0
+
+                hbl = halfedges[bl]
+
+                # edge swapped on the other side of the hull (rare); fix
+                # the halfedge reference
+                if hbl == -1:
+                    e = self.hull_start
+                    while True:
+                        if self.hull_tri[e] == bl:
+                            self.hull_tri[e] = a
+                            break
+                        e = self.hull_prev[e]
+                        if e == self.hull_start:
+                            break
+
+                self._link(a, hbl)
+                self._link(b, halfedges[ar])
+                self._link(ar, bl)
+
+                stack.append(b0 + (b + 1) % 3)
+            else:
+                if not stack:
+                    break
+                a = stack.pop()
+
+        return ar
+
+    def _link(self, a, b):
+        self.halfedges[a] = b
+        if b != -1:
+            self.halfedges[b] = a
+
+    def _add_triangle(self, i0, i1, i2, a, b, c):
+        t = self.triangles_len
+
+        self.triangles[t] = i0
+        self.triangles[t + 1] = i1
+        self.triangles[t + 2] = i2
+
+        self._link(t, a)
+        self._link(t + 1, b)
+        self._link(t + 2, c)
+
+        self.triangles_len += 3
+        return t
+
+
+def _pseudo_angle(dx, dy):
+    # monotonic in the angle of (dx, dy), in [0, 1]
+    if not dx and not dy:
+        return 0
+    p = dx / (abs(dx) + abs(dy))
+    return (3 - p if dy > 0 else 1 + p) / 4
+
+
+def _dist(ax, ay, bx, by):
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+
+def _orient(px, py, qx, qy, rx, ry):
+    # whether p, q, r turn counter-clockwise
+    return (qy - py) * (rx - qx) - (qx - px) * (ry - qy) < 0
+
+
+def _in_circle(ax, ay, bx, by, cx, cy, px, py):
+    dx = ax - px
+    dy = ay - py
+    ex = bx - px
+    ey = by - py
+    fx = cx - px
+    fy = cy - py
+
+    ap = dx * dx + dy * dy
+    bp = ex * ex + ey * ey
+    cp = fx * fx + fy * fy
+
+    return dx * (ey * cp - bp * fy) - \
+        dy * (ex * cp - bp * fx) + \
+        ap * (ex * fy - ey * fx) < 0
+
+
+def _circumradius(ax, ay, bx, by, cx, cy):
+    dx = bx - ax
+    dy = by - ay
+    ex = cx - ax
+    ey = cy - ay
+
+    det = dx * ey - dy * ex
+    if det == 0:
+        return float("inf")
+
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = 0.5 / det
+
+    x = (ey * bl - dy * cl) * d
+    y = (dx * cl - ex * bl) * d
+
+    return x * x + y * y
+
+
+def _circumcenter(ax, ay, bx, by, cx, cy):
+    dx = bx - ax
+    dy = by - ay
+    ex = cx - ax
+    ey = cy - ay
+
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = 0.5 / (dx * ey - dy * ex)
+
+    x = ax + (ey * bl - dy * cl) * d
+    y = ay + (dx * cl - ex * bl) * d
+
+    return x, y
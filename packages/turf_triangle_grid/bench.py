@@ -0,0 +1,20 @@
+from packages import iter_triangle_grid, triangle_grid, triangle_grid_arrays
+
+
+def bench(suite, size):
+    bbox = suite.bbox()
+    # roughly `size` triangles over a 10 degree box at the equator
+    cell = 1111.0 / (size / 2.0) ** 0.5
+
+    def drain(triangles):
+        count = 0
+        for _ in triangles:
+            count += 1
+        return count
+
+    suite.add('triangle_grid',
+              lambda: triangle_grid(bbox, cell, 'kilometers'))
+    suite.add('iter_triangle_grid',
+              lambda: drain(iter_triangle_grid(bbox, cell, 'kilometers')))
+    suite.add('triangle_grid_arrays',
+              lambda: triangle_grid_arrays(bbox, cell, 'kilometers'))
